@@ -7,12 +7,14 @@ Bu uygulama, haber başlıklarının clickbait olup olmadığını analiz eder.
 """
 
 import streamlit as st
-import tensorflow as tf
-import pickle
-import re
+import io
 import os
+import sys
 from pathlib import Path
 
+import numpy as np
+import pandas as pd
+
 # Sayfa yapılandırması
 st.set_page_config(
     page_title="🎯 Clickbait Avcısı",
@@ -58,79 +60,172 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
-# Model yolları
 # Model yolları
 BASE_DIR = Path(__file__).resolve().parent.parent
 MODEL_DIR = BASE_DIR / "model_training"
-MODEL_PATH = MODEL_DIR / "saved_model.h5"
-TOKENIZER_PATH = MODEL_DIR / "tokenizer.pickle"
-CONFIG_PATH = MODEL_DIR / "model_config.pickle"
+TRANSLATION_CACHE_DB = os.getenv("CLICKBAIT_TRANSLATION_CACHE_DB", str(BASE_DIR / ".cache" / "translations.sqlite3"))
+TRANSLATORS = os.getenv("CLICKBAIT_TRANSLATORS", "google,dictionary")
+TRANSLATION_TIMEOUT = float(os.getenv("CLICKBAIT_TRANSLATION_TIMEOUT", "3"))
+
+# Toplu analiz: tek forward pass'teki başlık sayısı ve sonuçların rerun'lar arası saklanma süresi (sn)
+DASHBOARD_BATCH_SIZE = int(os.getenv("CLICKBAIT_DASHBOARD_BATCH_SIZE", "256"))
+PREDICTION_CACHE_TTL = float(os.getenv("CLICKBAIT_RESULT_CACHE_TTL", "3600"))
+
+SINGLE_MODE = "🔍 Tekil Analiz"
+BATCH_MODE = "📑 Toplu Analiz (CSV)"
+
+# Paylaşılan clickbait_core paketi proje kökünde
+sys.path.insert(0, str(BASE_DIR))
+from clickbait_core.metrics import collect_timings
+from clickbait_core.pipeline import build_results, load_artifacts, score_texts
+from clickbait_core.preprocessing import clean_texts
+from clickbait_core.translation import TranslationCache
+from clickbait_core.translators import build_stage
+
+# Çıkarım motoru: "keras" (varsayılan), "numpy", "mmap" (TensorFlow'suz) veya "tflite" (kuantize)
+ENGINE = os.getenv("CLICKBAIT_ENGINE", "keras").lower()
 
 
 @st.cache_resource
 def load_model():
     """Model ve tokenizer'ı yükle (cache'le)"""
     try:
-        model = tf.keras.models.load_model(str(MODEL_PATH))
-        with open(TOKENIZER_PATH, 'rb') as f:
-            tokenizer = pickle.load(f)
-        with open(CONFIG_PATH, 'rb') as f:
-            config = pickle.load(f)
-        return model, tokenizer, config
+        return load_artifacts(MODEL_DIR, ENGINE)
     except Exception as e:
         st.error(f"❌ Model yüklenemedi: {e}")
         st.info("💡 Önce model_training/train_model.ipynb notebook'unu çalıştırın.")
         return None, None, None
 
 
-def clean_text(text):
-    """Metni temizle ve normalize et"""
-    if not isinstance(text, str):
-        return ""
-    text = text.lower()
-    text = re.sub(r'[^\w\sğüşıöçĞÜŞİÖÇ]', '', text)
-    text = re.sub(r'\s+', ' ', text).strip()
-    return text
+@st.cache_resource
+def get_translation_cache():
+    """Rerun'lar arasında paylaşılan çeviri önbelleği"""
+    stage = build_stage(TRANSLATORS, timeout=TRANSLATION_TIMEOUT or None)
+    return TranslationCache(db_path=TRANSLATION_CACHE_DB or None, stage=stage)
 
 
-def predict_clickbait(text, model, tokenizer, max_length):
-    """Clickbait tahmini yap"""
-    from tensorflow.keras.preprocessing.sequence import pad_sequences
-    
-    cleaned = clean_text(text)
-    sequence = tokenizer.texts_to_sequences([cleaned])
-    padded = pad_sequences(sequence, maxlen=max_length, padding='post', truncating='post')
-    
-    score = float(model.predict(padded, verbose=0)[0][0])
-    
-    # --- Heuristics to reduce False Positives ---
-    safe_patterns = [
-        r"(?i).*\b(dollar|euro|gold|currency|exchange rate)\b.*\?", # Money questions
-        r"(?i).*\b(match|score|won|lost|game)\b.*\?",               # Sports questions
-        r"(?i).*\b(school|holiday|vacation|class)\b.*\?",            # School questions
-        r"(?i).*\b(weather|snow|rain|temperature|forecast)\b.*",     # Weather
-        r"(?i).*\b(announced|statement|reported|said)\b.*",          # Official statements
-    ]
-    
-    is_safe = False
-    for pattern in safe_patterns:
-        if re.search(pattern, text):
-            is_safe = True
-            break
-            
-    if is_safe and score > 0.5:
-        # If it looks like a safe question but model thinks clickbait (common for Questions),
-        # we act as a "Second Opinion" and lower the score.
-        print(f"Heuristic applied: Safe pattern detected for '{text}'")
-        score = min(score, 0.3) # Force to Normal
-        
-    is_clickbait = score > 0.5
-    
-    return {
-        'is_clickbait': is_clickbait,
-        'score': score,
-        'confidence': score * 100 if is_clickbait else (1 - score) * 100
-    }
+@st.cache_data(ttl=PREDICTION_CACHE_TTL or None, max_entries=5000, show_spinner=False)
+def score_translated(translated: tuple, engine: str) -> list[float]:
+    """
+    Çevrilmiş başlıkları tek forward pass'te skorla.
+
+    Yalnızca model aşaması ``(çeviriler, motor)`` anahtarıyla rerun'lar
+    arasında saklanır. Çeviriler burada önbelleğe alınmaz: başarısız
+    çevirileri saklamayan ``TranslationCache`` her seferinde sorulur,
+    böylece çevirmen geri geldiğinde doğru çeviriyle yeniden skorlanır.
+    """
+    model, tokenizer, config = load_model()
+    return score_texts(model, tokenizer, config, clean_texts(list(translated))).tolist()
+
+
+def analyze_headlines(headlines: tuple, engine: str) -> list[dict]:
+    """Başlıkları çevirip skorla (backend ile aynı ölçülen aşamalar)"""
+    texts = list(headlines)
+    translated = get_translation_cache().translate_batch(texts)
+    scores = score_translated(tuple(translated), engine)
+    # If it looks like a safe question but model thinks clickbait (common for Questions),
+    # we act as a "Second Opinion" and lower the score (backend ile aynı kural motoru).
+    return build_results(texts, translated, scores)
+
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def load_headline_csv(data: bytes) -> pd.DataFrame:
+    """Yüklenen CSV'yi oku (ayraç otomatik bulunur: virgül, noktalı virgül, sekme)"""
+    return pd.read_csv(io.BytesIO(data), sep=None, engine="python")
+
+
+def show_timings(timings):
+    """Aşama sürelerini göster (hiç ölçüm yoksa gösterilmez)"""
+    summary = timings.summary()
+    if summary:
+        with st.expander("⏱️ Aşama Süreleri"):
+            st.table({
+                stage: {"ms": round(stage_summary["seconds"] * 1000, 2), "başlık": stage_summary["items"]}
+                for stage, stage_summary in summary.items()
+            })
+
+
+def score_headline_column(headlines: list[str]) -> pd.DataFrame:
+    """Benzersiz başlıkları DASHBOARD_BATCH_SIZE'lık parçalar halinde skorla (ilerleme çubuğuyla)"""
+    unique = list(dict.fromkeys(headlines))
+    results = {}
+    progress = st.progress(0.0, text="Analiz başlıyor...")
+    for start in range(0, len(unique), DASHBOARD_BATCH_SIZE):
+        chunk = tuple(unique[start:start + DASHBOARD_BATCH_SIZE])
+        results.update(zip(chunk, analyze_headlines(chunk, ENGINE)))
+        done = start + len(chunk)
+        progress.progress(done / len(unique), text=f"{done:,} / {len(unique):,} başlık skorlandı")
+    progress.empty()
+
+    rows = [results[headline] for headline in headlines]
+    return pd.DataFrame({
+        "Başlık": headlines,
+        "Çeviri": [row['translated_text'] for row in rows],
+        "Skor": [row['score'] for row in rows],
+        "Etiket": [row['label'] for row in rows],
+        "Kural": [row['heuristic'] or "" for row in rows],
+    })
+
+
+def render_batch_dashboard():
+    """CSV'deki tüm başlıkları skorla; sıralanabilir tablo ve skor dağılımı"""
+    st.subheader("📑 Toplu Başlık Analizi")
+    uploaded = st.file_uploader("Başlık CSV dosyasını yükleyin", type=["csv", "txt"])
+    if uploaded is None:
+        st.info("💡 Her satırında bir başlık olan bir CSV yükleyin (örn. `headline` sütunu).")
+        return
+
+    try:
+        frame = load_headline_csv(uploaded.getvalue())
+    except Exception as e:
+        st.error(f"❌ CSV okunamadı: {e}")
+        return
+
+    columns = list(frame.columns)
+    column = st.selectbox("Başlık sütunu", columns, index=columns.index("headline") if "headline" in columns else 0)
+    headlines = frame[column].dropna().astype(str).str.strip()
+    headlines = headlines[headlines != ""].tolist()
+    if not headlines:
+        st.warning("⚠️ Seçilen sütunda başlık yok!")
+        return
+    st.caption(f"{len(headlines):,} başlık ({len(set(headlines)):,} benzersiz)")
+
+    # Sonuçlar oturumda saklanır; indirme gibi rerun'larda kaybolmaz
+    key = (uploaded.name, uploaded.size, column)
+    if st.button("🚀 Tümünü Analiz Et", type="primary"):
+        with collect_timings() as timings:
+            st.session_state.batch_results = (key, score_headline_column(headlines))
+        show_timings(timings)
+    stored = st.session_state.get("batch_results")
+    if stored is None or stored[0] != key:
+        return
+    results = stored[1]
+
+    clickbait_count = int((results["Etiket"] == "CLICKBAIT").sum())
+    col1, col2, col3, col4 = st.columns(4)
+    col1.metric("Başlık", f"{len(results):,}")
+    col2.metric("Clickbait", f"{clickbait_count:,}")
+    col3.metric("Oran", f"{clickbait_count / len(results):.1%}")
+    col4.metric("Ort. Skor", f"{results['Skor'].mean():.2f}")
+
+    st.subheader("📈 Skor Dağılımı")
+    counts, edges = np.histogram(results["Skor"], bins=20, range=(0.0, 1.0))
+    st.bar_chart(pd.DataFrame({"Başlık sayısı": counts}, index=[f"{edge:.2f}" for edge in edges[:-1]]))
+
+    st.subheader("📋 Sonuçlar")
+    st.caption("Sütun başlıklarına tıklayarak sıralayabilirsiniz.")
+    st.dataframe(
+        results,
+        hide_index=True,
+        use_container_width=True,
+        column_config={"Skor": st.column_config.ProgressColumn("Skor", min_value=0.0, max_value=1.0, format="%.2f")},
+    )
+    st.download_button(
+        "⬇️ Sonuçları İndir (CSV)",
+        results.to_csv(index=False).encode("utf-8"),
+        file_name="clickbait_sonuclari.csv",
+        mime="text/csv",
+    )
 
 
 # Ana başlık
@@ -149,12 +244,16 @@ with st.sidebar:
     abartılı, merak uyandırıcı başlıklardır.
     """)
     
+    st.header("🧭 Mod")
+    mode = st.radio("Analiz modu", [SINGLE_MODE, BATCH_MODE], label_visibility="collapsed")
+    
     st.header("📊 Model Bilgisi")
     model, tokenizer, config = load_model()
     if config:
         st.write(f"- **Kelime Dağarcığı:** {config['vocab_size']:,}")
         st.write(f"- **Max Uzunluk:** {config['max_length']}")
         st.write(f"- **Embedding Boyutu:** {config['embedding_dim']}")
+        st.write(f"- **Motor:** {ENGINE}")
     
     st.header("🔗 Proje")
     st.write("Full-Stack AI Projesi")
@@ -171,6 +270,8 @@ if model is None:
     2. Tüm hücreleri sırasıyla çalıştırın
     3. Bu sayfayı yenileyin
     """)
+elif mode == BATCH_MODE:
+    render_batch_dashboard()
 else:
     # Giriş alanı
     st.subheader("📝 Başlık Analizi")
@@ -187,20 +288,16 @@ else:
     
     # Sonuç gösterimi
     if analyze_button and headline:
-        with st.spinner("🤖 Translating & Analyzing..."):
-            # 1. Translate
-            from deep_translator import GoogleTranslator
-            try:
-                translated_text = GoogleTranslator(source='auto', target='en').translate(headline)
-            except Exception as e:
-                st.error(f"Translation failed: {e}")
-                translated_text = headline
+        with collect_timings() as timings, st.spinner("🤖 Translating & Analyzing..."):
+            # 1. Translate (çeviri önbelleği) + 2. Predict (rerun'larda önbellekten)
+            translation_cache = get_translation_cache()
+            errors_before = translation_cache.errors
+            result = analyze_headlines((headline,), ENGINE)[0]
+            if translation_cache.errors > errors_before:
+                st.error("Translation failed, orijinal metin kullanılıyor.")
             
             # Show translation
-            st.info(f"**Translated Text:** {translated_text}")
-            
-            # 2. Predict
-            result = predict_clickbait(translated_text, model, tokenizer, config['max_length'])
+            st.info(f"**Translated Text:** {result['translated_text']}")
         
         st.markdown("---")
         st.subheader("📊 Sonuç")
@@ -231,6 +328,8 @@ else:
             st.metric("Güven", f"{result['confidence']:.1f}%")
         with col3:
             st.metric("Durum", "Clickbait" if result['is_clickbait'] else "Normal")
+
+        show_timings(timings)
     
     elif analyze_button:
         st.warning("⚠️ Lütfen bir başlık girin!")
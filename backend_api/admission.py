@@ -0,0 +1,95 @@
+"""
+🚦 Clickbait Avcısı - Yük Atma ve İstek Süre Sınırları
+======================================================
+Çevirmen yavaşladığında isteklerin birikip süreci çökertmesini önler:
+
+- ``AdmissionController``: aynı anda işlenen tahmin isteği sayısını
+  sınırlar; sınır doluysa istek kuyruğa alınmaz, hemen 429 döner.
+- ``request_deadline``: her isteğe bir bitiş anı (``time.monotonic()``)
+  verir. İstemci ``X-Request-Deadline-Ms`` başlığıyla süreyi kısaltabilir.
+- ``AdmissionController.wait``: süre dolarsa beklemeyi bırakıp 503 döndürür.
+
+Süresi yaklaşan isteklerde ağ çevirisi bırakılır ve başlıklar yerel yedek
+çeviriyle (sözlük) skorlanır; bu yanıtlar ``degraded: true`` ile işaretlenir
+(bkz. ``main._predict_translated``).
+"""
+
+import asyncio
+import time
+from contextlib import contextmanager
+from typing import Awaitable, Optional, TypeVar
+
+from fastapi import HTTPException
+
+DEADLINE_HEADER = "X-Request-Deadline-Ms"
+
+T = TypeVar("T")
+
+
+class AdmissionController:
+    """Eşzamanlı tahmin isteklerini sınırlayan sayaç (olay döngüsünde kullanılır)"""
+
+    def __init__(self, max_in_flight: int, retry_after: int = 1):
+        self.max_in_flight = max_in_flight
+        self.retry_after = retry_after
+        self.in_flight = 0
+        self.rejected = 0
+        self.timed_out = 0
+
+    @contextmanager
+    def admit(self):
+        """Yer varsa isteği say; yoksa bekletmeden 429 (``max_in_flight`` 0 ise sınırsız)"""
+        if self.max_in_flight and self.in_flight >= self.max_in_flight:
+            self.rejected += 1
+            raise HTTPException(
+                status_code=429,
+                detail="Sunucu yoğun, lütfen biraz sonra tekrar deneyin.",
+                headers={"Retry-After": str(self.retry_after)},
+            )
+        self.in_flight += 1
+        try:
+            yield
+        finally:
+            self.in_flight -= 1
+
+    async def wait(self, awaitable: Awaitable[T], deadline: Optional[float]) -> T:
+        """``awaitable``'ı süre dolana kadar bekle; dolarsa iptal edip 503 döndür"""
+        if deadline is None:
+            return await awaitable
+        try:
+            return await asyncio.wait_for(awaitable, max(deadline - time.monotonic(), 0.0))
+        except asyncio.TimeoutError:
+            self.timed_out += 1
+            raise HTTPException(
+                status_code=503,
+                detail="İstek süre sınırı içinde tamamlanamadı.",
+                headers={"Retry-After": str(self.retry_after)},
+            )
+
+    def stats(self) -> dict:
+        return {
+            "in_flight": self.in_flight,
+            "max_in_flight": self.max_in_flight,
+            "rejected": self.rejected,
+            "timed_out": self.timed_out,
+        }
+
+
+def request_deadline(header_value: Optional[str], default_ms: float) -> Optional[float]:
+    """
+    İsteğin bitiş anı; süre yoksa ``None``.
+
+    Başlık varsayılan süreyi yalnızca kısaltabilir (``default_ms`` 0 ise
+    başlıktaki süre olduğu gibi kullanılır). Geçersiz başlık 400 döner.
+    """
+    budget_ms = default_ms or None
+    if header_value:
+        try:
+            requested = float(header_value)
+        except ValueError:
+            raise HTTPException(status_code=400, detail=f"Geçersiz {DEADLINE_HEADER}: {header_value}")
+        if requested <= 0:
+            raise HTTPException(status_code=400, detail=f"{DEADLINE_HEADER} pozitif olmalı")
+        budget_ms = requested if budget_ms is None else min(budget_ms, requested)
+    return None if budget_ms is None else time.monotonic() + budget_ms / 1000.0
+
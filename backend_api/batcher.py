@@ -0,0 +1,144 @@
+"""
+⏱️ Clickbait Avcısı - Mikro Batch Zamanlayıcı
+============================================
+Eşzamanlı gelen tekil tahmin isteklerini küçük batch'ler halinde toplar
+ve her batch'i tek seferde bir worker thread üzerinde çalıştırır.
+En fazla ``max_concurrent_batches`` batch aynı anda işlenir; ağ çevirisi
+yavaşlayan bir batch, arkasından gelen istekleri bekletmez.
+
+Bir batch şu durumlardan biri gerçekleştiğinde işlenir:
+- ``max_batch_size`` kadar istek birikti,
+- ilk istekten bu yana ``max_wait_ms`` milisaniye geçti.
+"""
+
+import asyncio
+import logging
+from typing import Any, Callable, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+
+class MicroBatcher:
+    """Asyncio tabanlı istek birleştirici"""
+
+    def __init__(
+        self,
+        batch_fn: Callable[[list], Sequence[Any]],
+        max_batch_size: int = 32,
+        max_wait_ms: float = 5.0,
+        max_concurrent_batches: int = 4,
+    ):
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size en az 1 olmalı")
+        if max_concurrent_batches < 1:
+            raise ValueError("max_concurrent_batches en az 1 olmalı")
+        self.batch_fn = batch_fn
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000.0
+        self.max_concurrent_batches = max_concurrent_batches
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._in_flight: set[asyncio.Task] = set()
+
+    @property
+    def running(self) -> bool:
+        return self._worker is not None and not self._worker.done()
+
+    async def start(self):
+        """Arka plan worker'ını başlat"""
+        if self.running:
+            return
+        self._queue = asyncio.Queue()
+        self._slots = asyncio.Semaphore(self.max_concurrent_batches)
+        self._worker = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """Worker'ı durdur, bekleyen istekleri iptal et"""
+        if self._worker is None:
+            return
+        self._worker.cancel()
+        try:
+            await self._worker
+        except asyncio.CancelledError:
+            pass
+        self._worker = None
+
+        for task in list(self._in_flight):
+            task.cancel()
+        if self._in_flight:
+            await asyncio.gather(*self._in_flight, return_exceptions=True)
+
+        while not self._queue.empty():
+            _, future = self._queue.get_nowait()
+            if not future.done():
+                future.cancel()
+
+    async def submit(self, item: Any) -> Any:
+        """Bir öğeyi kuyruğa ekle ve kendi sonucunu bekle"""
+        if not self.running:
+            raise RuntimeError("MicroBatcher başlatılmadı")
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((item, future))
+        return await future
+
+    async def _collect(self) -> list:
+        """Boyut veya süre sınırına kadar istek topla"""
+        loop = asyncio.get_running_loop()
+        batch = [await self._queue.get()]
+        deadline = loop.time() + self.max_wait
+
+        while len(batch) < self.max_batch_size:
+            if not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+                continue
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+
+        return batch
+
+    async def _run(self):
+        while True:
+            # Boş slot yoksa yeni batch toplanmaz; istekler kuyrukta birikir
+            await self._slots.acquire()
+            try:
+                batch = await self._collect()
+            except BaseException:
+                self._slots.release()
+                raise
+            task = asyncio.create_task(self._process(batch))
+            self._in_flight.add(task)
+            task.add_done_callback(self._in_flight.discard)
+
+    async def _process(self, batch: list):
+        """Tek bir batch'i worker thread'de çalıştırıp sonuçları dağıt"""
+        try:
+            # İstemcisi bağlantıyı kesmiş istekleri atla
+            batch = [(item, future) for item, future in batch if not future.done()]
+            if not batch:
+                return
+
+            items = [item for item, _ in batch]
+            try:
+                results = await asyncio.get_running_loop().run_in_executor(None, self.batch_fn, items)
+            except asyncio.CancelledError:
+                for _, future in batch:
+                    future.cancel()
+                raise
+            except Exception as e:
+                logger.error(f"Batch işlenirken hata: {e}")
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                return
+
+            for (_, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
+        finally:
+            self._slots.release()
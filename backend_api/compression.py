@@ -0,0 +1,89 @@
+"""
+🗜️ Clickbait Avcısı - Sıkıştırılmış İstek Gövdeleri
+===================================================
+``Content-Encoding: gzip`` (veya ``deflate``) ile gönderilen istek
+gövdelerini, FastAPI gövdeyi doğrulamadan önce açan route sınıfı.
+
+Chrome eklentisinin sayfa taraması yüzlerce başlığı tek bir sıkıştırılmış
+istekte gönderir. Hem gelen (sıkıştırılmış) gövde hem de açılan boyut
+``max_bytes`` ile sınırlıdır: ``Content-Length`` sınırı aşıyorsa gövde hiç
+okunmaz, akarken sınırı aşan gövdeler ve açılınca büyüyenler (örn.
+sıkıştırma bombası) 413 ile reddedilir::
+
+    router = APIRouter(route_class=compressed_route(1_000_000))
+"""
+
+import zlib
+from typing import Callable
+
+from fastapi import HTTPException, Request, Response
+from fastapi.routing import APIRoute
+
+# zlib pencere biti: 16 + MAX_WBITS gzip, MAX_WBITS zlib/deflate başlığı
+_WBITS = {"gzip": 16 + zlib.MAX_WBITS, "deflate": zlib.MAX_WBITS}
+
+
+def decompress_body(body: bytes, encoding: str, max_bytes: int) -> bytes:
+    """Gövdeyi aç; bilinmeyen kodlama 415, bozuk veri 400, sınır aşımı 413"""
+    encoding = encoding.strip().lower()
+    if encoding in ("", "identity"):
+        if len(body) > max_bytes:
+            raise HTTPException(status_code=413, detail=f"İstek gövdesi {max_bytes} baytı aşıyor")
+        return body
+    if encoding not in _WBITS:
+        raise HTTPException(status_code=415, detail=f"Desteklenmeyen Content-Encoding: {encoding}")
+
+    decompressor = zlib.decompressobj(_WBITS[encoding])
+    try:
+        data = decompressor.decompress(body, max_bytes)
+        if decompressor.unconsumed_tail:
+            raise HTTPException(status_code=413, detail=f"Açılan istek gövdesi {max_bytes} baytı aşıyor")
+        data += decompressor.flush()
+    except zlib.error as e:
+        raise HTTPException(status_code=400, detail=f"Sıkıştırılmış gövde açılamadı: {e}")
+    if len(data) > max_bytes:
+        raise HTTPException(status_code=413, detail=f"Açılan istek gövdesi {max_bytes} baytı aşıyor")
+    return data
+
+
+async def read_body(request: Request, max_bytes: int) -> bytes:
+    """Ham gövdeyi ``max_bytes``'ı aşmadan oku; ``Content-Length`` veya akan boyut aşarsa 413"""
+    length = request.headers.get("content-length")
+    if length is not None:
+        try:
+            declared = int(length)
+        except ValueError:
+            raise HTTPException(status_code=400, detail=f"Geçersiz Content-Length: {length}")
+        if declared > max_bytes:
+            raise HTTPException(status_code=413, detail=f"İstek gövdesi {max_bytes} baytı aşıyor")
+
+    chunks = []
+    size = 0
+    async for chunk in request.stream():
+        size += len(chunk)
+        if size > max_bytes:
+            raise HTTPException(status_code=413, detail=f"İstek gövdesi {max_bytes} baytı aşıyor")
+        chunks.append(chunk)
+    return b"".join(chunks)
+
+
+def compressed_route(max_bytes: int) -> type[APIRoute]:
+    """Gövdesi ``Content-Encoding``'e göre açılan ``APIRoute`` sınıfı üret"""
+
+    class CompressedRequest(Request):
+        async def body(self) -> bytes:
+            if not hasattr(self, "_body"):
+                raw = await read_body(self, max_bytes)
+                self._body = decompress_body(raw, self.headers.get("content-encoding", ""), max_bytes)
+            return self._body
+
+    class CompressedRoute(APIRoute):
+        def get_route_handler(self) -> Callable:
+            handler = super().get_route_handler()
+
+            async def compressed_handler(request: Request) -> Response:
+                return await handler(CompressedRequest(request.scope, request.receive))
+
+            return compressed_handler
+
+    return CompressedRoute
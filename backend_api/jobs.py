@@ -0,0 +1,467 @@
+"""
+📦 Clickbait Avcısı - Toplu Skorlama İşleri
+==========================================
+Arşiv gibi büyük başlık dosyaları için iş kuyruğu. ``POST /jobs`` dosyayı
+diske yazıp hemen bir iş id'si döner; istemci bağlantıyı kapatabilir.
+
+İşler ayrı süreçlerde (``ProcessPoolExecutor``) çalışır; her worker
+backend modülünü kendi sürecinde yükler ve ``/predict/batch`` ile aynı
+``predict_clickbait_batch`` yolunu kullanır. Böylece uzun işler API
+sürecinin GIL'ini ve mikro batch kuyruğunu meşgul etmez.
+
+Kuyruk ve ilerleme yerel bir SQLite dosyasında tutulur. Worker her
+parçadan sonra çıktıyı diske yazar ve ``(işlenen satır, çıktı baytı)``
+kontrol noktasını kaydeder. Backend kapanırsa veya çökerse yarım kalan
+işler kuyruğa döner ve kaldıkları satırdan devam eder. Kapanırken işler
+önce ``stopping`` olur; kuyruğa ancak worker'ları durduktan sonra döner,
+böylece başka bir backend süreci aynı parçayı eşzamanlı yazamaz.
+
+Durumlar: ``queued`` → ``running`` (→ ``stopping`` → ``queued``) → ``completed`` | ``failed`` | ``cancelled``
+"""
+
+import logging
+import multiprocessing
+import os
+import sqlite3
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import AsyncIterator, BinaryIO, Callable, Iterator, Optional, Union
+
+from streaming import encode_record, read_line, result_record, summarize
+
+logger = logging.getLogger(__name__)
+
+JOB_STATUSES = ("queued", "running", "stopping", "completed", "failed", "cancelled")
+FINISHED_STATUSES = ("completed", "failed", "cancelled")
+# Worker süreci çökerse (örn. bellek yetersizliği) iş en fazla bu kadar denenir
+MAX_ATTEMPTS = 3
+
+
+def _pid_alive(pid: Optional[int]) -> bool:
+    if not pid:
+        return False
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class JobStore:
+    """İş kuyruğu ve kontrol noktaları için SQLite deposu (süreçler arası paylaşılır)"""
+
+    def __init__(self, db_path: Union[str, Path], jobs_dir: Union[str, Path]):
+        self.path = Path(db_path)
+        self.jobs_dir = Path(jobs_dir)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.jobs_dir.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False, timeout=30)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS jobs ("
+            " id TEXT PRIMARY KEY, status TEXT NOT NULL, field TEXT NOT NULL,"
+            " total_lines INTEGER NOT NULL, processed_lines INTEGER NOT NULL DEFAULT 0,"
+            " output_bytes INTEGER NOT NULL DEFAULT 0, scored INTEGER NOT NULL DEFAULT 0,"
+            " clickbait INTEGER NOT NULL DEFAULT 0, errors INTEGER NOT NULL DEFAULT 0,"
+            " attempts INTEGER NOT NULL DEFAULT 0, owner INTEGER, error TEXT,"
+            " created REAL NOT NULL, started REAL, finished REAL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS jobs_status ON jobs (status, created)")
+        self._conn.commit()
+
+    def input_path(self, job_id: str) -> Path:
+        return self.jobs_dir / f"{job_id}.input"
+
+    def output_path(self, job_id: str) -> Path:
+        return self.jobs_dir / f"{job_id}.ndjson"
+
+    def _update(self, sql: str, params: tuple) -> int:
+        with self._lock:
+            cursor = self._conn.execute(sql, params)
+            self._conn.commit()
+            return cursor.rowcount
+
+    def create(self, job_id: str, field: str, total_lines: int) -> dict:
+        self._update(
+            "INSERT INTO jobs (id, status, field, total_lines, created) VALUES (?, 'queued', ?, ?, ?)",
+            (job_id, field, total_lines, time.time()),
+        )
+        return self.get(job_id)
+
+    def get(self, job_id: str) -> Optional[dict]:
+        with self._lock:
+            row = self._conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return dict(row) if row is not None else None
+
+    def list(self, limit: int = 50) -> list[dict]:
+        with self._lock:
+            rows = self._conn.execute("SELECT * FROM jobs ORDER BY created DESC LIMIT ?", (limit,)).fetchall()
+        return [dict(row) for row in rows]
+
+    def counts(self) -> dict:
+        with self._lock:
+            rows = self._conn.execute("SELECT status, COUNT(*) FROM jobs GROUP BY status").fetchall()
+        counts = dict.fromkeys(JOB_STATUSES, 0)
+        counts.update({status: count for status, count in rows})
+        return counts
+
+    def claim_next(self, owner: int) -> Optional[dict]:
+        """En eski bekleyen işi atomik olarak ``running`` yap"""
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._conn.execute(
+                    "SELECT id FROM jobs WHERE status = 'queued' ORDER BY created LIMIT 1"
+                ).fetchone()
+                if row is not None:
+                    self._conn.execute(
+                        "UPDATE jobs SET status = 'running', owner = ?, attempts = attempts + 1,"
+                        " started = COALESCE(started, ?) WHERE id = ?",
+                        (owner, time.time(), row["id"]),
+                    )
+                self._conn.commit()
+            except BaseException:
+                self._conn.rollback()
+                raise
+        return self.get(row["id"]) if row is not None else None
+
+    def checkpoint(self, job_id: str, processed_lines: int, output_bytes: int,
+                   scored: int, clickbait: int, errors: int) -> str:
+        """İlerlemeyi kaydet ve işin güncel durumunu döndür (iptal/durdurma kontrolü için)"""
+        with self._lock:
+            self._conn.execute(
+                "UPDATE jobs SET processed_lines = ?, output_bytes = ?, scored = ?, clickbait = ?, errors = ?"
+                " WHERE id = ?",
+                (processed_lines, output_bytes, scored, clickbait, errors, job_id),
+            )
+            self._conn.commit()
+            return self._conn.execute("SELECT status FROM jobs WHERE id = ?", (job_id,)).fetchone()["status"]
+
+    def finish(self, job_id: str, status: str, error: Optional[str] = None) -> bool:
+        """Çalışan işi bitir; bu arada iptal edilen veya kuyruğa dönen iş değişmez"""
+        return self._update(
+            "UPDATE jobs SET status = ?, error = ?, finished = ?, owner = NULL WHERE id = ? AND status = 'running'",
+            (status, error, time.time(), job_id),
+        ) > 0
+
+    def cancel(self, job_id: str) -> bool:
+        return self._update(
+            "UPDATE jobs SET status = 'cancelled', finished = ?, owner = NULL"
+            " WHERE id = ? AND status IN ('queued', 'running', 'stopping')",
+            (time.time(), job_id),
+        ) > 0
+
+    def requeue(self, job_id: str) -> bool:
+        return self._update(
+            "UPDATE jobs SET status = 'queued', owner = NULL WHERE id = ? AND status IN ('running', 'stopping')",
+            (job_id,),
+        ) > 0
+
+    def stop_owned(self, owner: int) -> int:
+        """
+        Bu sürecin çalıştırdığı işleri ``stopping`` yap (kapanırken).
+
+        Worker'lar sonraki kontrol noktasında durur; iş bu durumdayken
+        başka bir süreç tarafından alınamaz.
+        """
+        return self._update(
+            "UPDATE jobs SET status = 'stopping' WHERE status = 'running' AND owner = ?", (owner,)
+        )
+
+    def requeue_owned(self, owner: int) -> int:
+        """Bu sürecin çalıştırdığı veya durdurduğu işleri kuyruğa geri koy (worker'lar durduktan sonra)"""
+        return self._update(
+            "UPDATE jobs SET status = 'queued', owner = NULL WHERE status IN ('running', 'stopping') AND owner = ?",
+            (owner,),
+        )
+
+    def requeue_orphaned(self) -> int:
+        """Sahibi artık çalışmayan (çöken/öldürülen) süreçlere ait işleri kuyruğa geri koy"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT id, owner FROM jobs WHERE status IN ('running', 'stopping')"
+            ).fetchall()
+        return sum(self.requeue(row["id"]) for row in rows if not _pid_alive(row["owner"]))
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+def describe(job: dict) -> dict:
+    """API yanıtı: durum, ilerleme ve ``/predict/batch`` ile aynı özet alanları"""
+    total = job["total_lines"]
+    return {
+        "job_id": job["id"],
+        "status": job["status"],
+        "field": job["field"],
+        "progress": round(job["processed_lines"] / total, 4) if total else 1.0,
+        "processed_lines": job["processed_lines"],
+        "total_lines": total,
+        "summary": dict(summarize(job["scored"], job["clickbait"]), errors=job["errors"]),
+        "attempts": job["attempts"],
+        "error": job["error"],
+        "created": job["created"],
+        "started": job["started"],
+        "finished": job["finished"],
+    }
+
+
+async def save_upload(chunks: AsyncIterator[bytes], path: Path, max_bytes: int) -> int:
+    """İstek gövdesini diske yaz ve satır sayısını döndür; ``max_bytes`` aşılırsa ``ValueError``"""
+    size = lines = 0
+    last = b"\n"
+    try:
+        with open(path, "wb") as f:
+            async for chunk in chunks:
+                if not chunk:
+                    continue
+                size += len(chunk)
+                if size > max_bytes:
+                    raise ValueError(f"Dosya {max_bytes} baytı aşıyor")
+                f.write(chunk)
+                lines += chunk.count(b"\n")
+                last = chunk[-1:]
+    except BaseException:
+        path.unlink(missing_ok=True)
+        raise
+    return lines + (last != b"\n")
+
+
+def iter_file_lines(f: BinaryIO, max_line_bytes: int) -> Iterator[tuple[int, Optional[bytes]]]:
+    """``streaming.iter_lines`` ile aynı numaralandırma; uzun satırlar ``None`` olarak döner"""
+    line_no = 0
+    while True:
+        line = f.readline(max_line_bytes + 1)
+        if not line:
+            return
+        line_no += 1
+        if len(line) > max_line_bytes and not line.endswith(b"\n"):
+            while line and not line.endswith(b"\n"):
+                line = f.readline(max_line_bytes + 1)
+            yield line_no, None
+        elif line.strip():
+            yield line_no, line
+
+
+def score_file(store: JobStore, job: dict, score_batch: Callable[[list[str]], list[dict]],
+               chunk_size: int, max_line_bytes: int, max_text_length: int = 500) -> str:
+    """
+    İşin girdi dosyasını kontrol noktasından itibaren parça parça skorla.
+
+    Çıktı dosyası son kontrol noktasındaki boyuta kırpılır; yarım yazılmış
+    parça tekrar üretilir. Dönüş değeri işin son durumudur (iş iptal
+    edilir veya kuyruğa geri alınırsa sonraki parçada durulur).
+    """
+    job_id = job["id"]
+    processed = job["processed_lines"]
+    counts = {"scored": job["scored"], "clickbait": job["clickbait"], "errors": job["errors"]}
+    output_path = store.output_path(job_id)
+    entries: list[tuple[int, Optional[str], Optional[object], Optional[str]]] = []
+
+    with open(store.input_path(job_id), "rb") as src, open(output_path, "r+b" if output_path.exists() else "w+b") as out:
+        out.truncate(job["output_bytes"])
+        out.seek(job["output_bytes"])
+
+        def flush(line_no: int) -> str:
+            texts = [text for _, text, _, error in entries if error is None]
+            results = iter(score_batch(texts) if texts else ())
+            output = []
+            for entry_line, text, record_id, error in entries:
+                if error is not None:
+                    counts["errors"] += 1
+                    output.append(encode_record({"line": entry_line, "error": error}))
+                    continue
+                record = result_record(next(results), entry_line, text, record_id)
+                counts["scored"] += 1
+                counts["clickbait"] += bool(record["is_clickbait"])
+                output.append(encode_record(record))
+            entries.clear()
+            out.write(b"".join(output))
+            out.flush()
+            os.fsync(out.fileno())
+            return store.checkpoint(job_id, line_no, out.tell(), **counts)
+
+        line_no = processed
+        for line_no, line in iter_file_lines(src, max_line_bytes):
+            if line_no <= processed:
+                continue
+            try:
+                text, record_id = read_line(line, job["field"], max_text_length)
+                entries.append((line_no, text, record_id, None))
+            except (ValueError, UnicodeDecodeError) as e:
+                entries.append((line_no, None, None, str(e)))
+            if len(entries) >= chunk_size:
+                status = flush(line_no)
+                if status != "running":
+                    return status
+
+        status = flush(max(line_no, job["total_lines"]))
+        if status != "running":
+            return status
+        out.write(encode_record({"summary": dict(summarize(counts["scored"], counts["clickbait"]),
+                                                 errors=counts["errors"])}))
+        out.flush()
+        os.fsync(out.fileno())
+    store.finish(job_id, "completed")
+    return "completed"
+
+
+def _init_worker(nice: int):
+    """Worker süreci: etkileşimli /predict trafiğinin önüne geçmemesi için düşük öncelik"""
+    if nice:
+        try:
+            os.nice(nice)
+        except OSError as e:
+            logger.warning(f"İş worker önceliği düşürülemedi: {e}")
+
+
+def _worker_backend():
+    """Worker sürecinde backend modülünü yükle; etkin model sürümü değiştiyse yenisine geç"""
+    import main as backend
+
+    if backend.serving is None:
+        if not backend.load_model_and_tokenizer():
+            raise RuntimeError("Model yüklenemedi")
+    elif backend.registry.active_version() != backend.serving.version:
+        backend.reload_model()
+    return backend
+
+
+def run_job(db_path: str, jobs_dir: str, job_id: str, chunk_size: int, max_line_bytes: int) -> str:
+    """Worker sürecinde tek bir işi çalıştır (``ProcessPoolExecutor`` hedefi)"""
+    store = JobStore(db_path, jobs_dir)
+    try:
+        job = store.get(job_id)
+        if job is None or job["status"] != "running":
+            return job["status"] if job is not None else "missing"
+        backend = _worker_backend()
+        return score_file(store, job, backend.predict_clickbait_batch, chunk_size, max_line_bytes)
+    except Exception as e:
+        logger.error(f"İş başarısız ({job_id}): {e}")
+        store.finish(job_id, "failed", error=str(e))
+        return "failed"
+    finally:
+        store.close()
+
+
+class JobRunner:
+    """
+    Kuyruktaki işleri süreç havuzuna dağıtan arka plan thread'i.
+
+    Aynı anda en fazla ``workers`` iş çalışır. Kapanırken worker'lar mevcut
+    parçayı bitirip durur; işler ancak ondan sonra kuyruğa geri alınır.
+    """
+
+    def __init__(self, store: JobStore, workers: int, chunk_size: int, max_line_bytes: int,
+                 nice: int = 10, poll_interval: float = 1.0):
+        self.store = store
+        self.workers = workers
+        self.chunk_size = chunk_size
+        self.max_line_bytes = max_line_bytes
+        self.nice = nice
+        self.poll_interval = poll_interval
+        self.owner = os.getpid()
+        self._active: dict[Future, str] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._broken = False
+        self._thread: Optional[threading.Thread] = None
+
+    def _new_pool(self) -> ProcessPoolExecutor:
+        # fork, TensorFlow ve backend thread'leriyle güvenli değil
+        return ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(self.nice,),
+        )
+
+    def start(self):
+        # Konteyner yeniden başlayınca aynı PID (örn. 1) tekrar kullanılabilir
+        requeued = self.store.requeue_owned(self.owner) + self.store.requeue_orphaned()
+        if requeued:
+            logger.info(f"📦 Yarım kalan {requeued} iş kaldığı yerden devam etmek üzere kuyruğa alındı")
+        self._pool = self._new_pool()
+        self._thread = threading.Thread(target=self._run, name="job-runner", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Yeni iş alma; worker'ların durmasını bekle, sonra çalışan işleri kuyruğa geri al"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        self.store.stop_owned(self.owner)
+        if self._pool is not None:
+            self._pool.shutdown(wait=True, cancel_futures=True)
+        # Worker'lar durmadan kuyruğa alınan iş, başka bir süreçte aynı parçayı yeniden yazabilirdi
+        self.store.requeue_owned(self.owner)
+
+    def _run(self):
+        while not self._stop.wait(self.poll_interval):
+            try:
+                self._dispatch()
+            except Exception as e:
+                logger.error(f"İş dağıtım hatası: {e}")
+
+    def _dispatch(self):
+        submitted = []
+        with self._lock:
+            if self._broken and not self._active:
+                self._pool.shutdown(wait=False)
+                self._pool = self._new_pool()
+                self._broken = False
+            while not self._broken and len(self._active) < self.workers:
+                job = self.store.claim_next(self.owner)
+                if job is None:
+                    break
+                try:
+                    future = self._pool.submit(run_job, str(self.store.path), str(self.store.jobs_dir),
+                                               job["id"], self.chunk_size, self.max_line_bytes)
+                except Exception as e:
+                    # Havuz bozuk veya kapanıyor: iş "running" durumunda asılı kalmasın
+                    self._broken = self._broken or isinstance(e, BrokenProcessPool)
+                    self._retry_or_fail(job["id"], e)
+                    break
+                self._active[future] = job["id"]
+                submitted.append(future)
+        # Bitmiş future'ın callback'i hemen bu thread'de çalışır ve kilidi ister;
+        # bu yüzden kilit bırakıldıktan sonra eklenir
+        for future in submitted:
+            future.add_done_callback(self._done)
+
+    def _retry_or_fail(self, job_id: str, error: BaseException):
+        """Deneme hakkı kaldıysa işi kuyruğa geri koy, yoksa başarısız say"""
+        job = self.store.get(job_id)
+        if job is not None and job["attempts"] < MAX_ATTEMPTS:
+            self.store.requeue(job_id)
+            logger.warning(f"İş {job_id} çalıştırılamadı, tekrar denenecek: {error}")
+            return
+        logger.error(f"İş başarısız ({job_id}): {error}")
+        self.store.finish(job_id, "failed", error=str(error) or type(error).__name__)
+
+    def _done(self, future: Future):
+        with self._lock:
+            job_id = self._active.pop(future)
+        if future.cancelled():
+            return
+        error = future.exception()
+        if error is None:
+            logger.info(f"📦 İş {job_id}: {future.result()}")
+            return
+        if isinstance(error, BrokenProcessPool):
+            # Worker süreci öldü; havuz yeniden kurulur, iş deneme hakkı varsa kuyruğa döner
+            with self._lock:
+                self._broken = True
+            self._retry_or_fail(job_id, error)
+            return
+        logger.error(f"İş başarısız ({job_id}): {error}")
+        self.store.finish(job_id, "failed", error=str(error) or type(error).__name__)
@@ -4,19 +4,44 @@
 Chrome Extension için REST API servisi.
 
 Çalıştırmak için: uvicorn main:app --reload --host 0.0.0.0 --port 8000
+
+Model arka planda yüklenir; bu sırada /health "loading" döner.
+Yeni model sürümleri (model_training/versions/) POST /model/reload veya
+CLICKBAIT_MODEL_WATCH_INTERVAL ile kesinti olmadan devreye alınır.
 """
 
-from fastapi import FastAPI, HTTPException
+from fastapi import APIRouter, Depends, FastAPI, Header, HTTPException, Request
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import FileResponse, PlainTextResponse
 from pydantic import BaseModel, Field
-import tensorflow as tf
-import pickle
-import re
 import os
+import sys
+import threading
+import time
+import uuid
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Annotated, Any, Optional, Union
 import logging
 
+from admission import DEADLINE_HEADER, AdmissionController, request_deadline
+from batcher import MicroBatcher
+from compression import compressed_route
+from jobs import JobRunner, JobStore, describe, save_upload
+from streaming import NDJSON_MEDIA_TYPE, NDJSONStreamingResponse, iter_lines, ndjson_stream, summarize
+
+# Paylaşılan clickbait_core paketi proje kökünde
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from clickbait_core.language import detect_languages
+from clickbait_core.metrics import BATCH_SIZE_BUCKETS, REGISTRY
+from clickbait_core.pipeline import artifact_paths, build_results, load_artifacts, score_texts
+from clickbait_core.preprocessing import clean_texts
+from clickbait_core.registry import ArtifactRegistry
+from clickbait_core.translation import TranslationCache, latest_deadlines
+from clickbait_core.translators import build_stage
+from result_cache import ResultCache, artifact_fingerprint
+
 # Logging ayarları
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -39,18 +64,120 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Model yolları
 # Model yolları
 BASE_DIR = Path(__file__).resolve().parent.parent
 MODEL_DIR = BASE_DIR / "model_training"
-MODEL_PATH = MODEL_DIR / "saved_model.h5"
-TOKENIZER_PATH = MODEL_DIR / "tokenizer.pickle"
-CONFIG_PATH = MODEL_DIR / "model_config.pickle"
+
+# Çıkarım motoru: "keras" (varsayılan), "numpy" veya "mmap" (TensorFlow'suz,
+# ağırlıklar worker'lar arasında paylaşılır) ya da "tflite" (kuantize, export.py --quantize)
+ENGINE = os.getenv("CLICKBAIT_ENGINE", "keras").lower()
+
+# Türkçe model (train.py --language tr); varsa Türkçe başlıklar çevrilmeden skorlanır
+TR_MODEL_DIR = Path(os.getenv("CLICKBAIT_TR_MODEL_DIR", str(MODEL_DIR / "tr")))
+NATIVE_TURKISH = os.getenv("CLICKBAIT_NATIVE_TURKISH", "1") == "1"
+
+# versions/ACTIVE kaç saniyede bir kontrol edilsin (0 = izleme kapalı)
+MODEL_WATCH_INTERVAL = float(os.getenv("CLICKBAIT_MODEL_WATCH_INTERVAL", "0"))
+
+# Çeviri arka uçları (sırayla denenir), eşzamanlı istek sayısı ve
+# arka uç başına zaman aşımı (saniye, 0 = sınırsız)
+TRANSLATORS = os.getenv("CLICKBAIT_TRANSLATORS", "google,dictionary")
+TRANSLATION_WORKERS = int(os.getenv("CLICKBAIT_TRANSLATION_WORKERS", "8"))
+TRANSLATION_TIMEOUT = float(os.getenv("CLICKBAIT_TRANSLATION_TIMEOUT", "3"))
+
+# /predict mikro batch ayarları
+MAX_BATCH_SIZE = int(os.getenv("CLICKBAIT_MAX_BATCH_SIZE", "32"))
+MAX_BATCH_WAIT_MS = float(os.getenv("CLICKBAIT_MAX_BATCH_WAIT_MS", "5"))
+MAX_CONCURRENT_BATCHES = int(os.getenv("CLICKBAIT_MAX_CONCURRENT_BATCHES", "4"))
+
+# Yük atma: tahmin isteği süre sınırı (0 = sınırsız), aynı anda işlenen istek sınırı (0 = sınırsız)
+# ve süre sınırından model + yerel yedek çeviri için ayrılan pay (ağ çevirisi bu paydan önce bırakılır).
+# Süre sınırı, ağ çevirisinin metin başı zaman aşımına ve payına yetecek kadar uzun olmalı.
+REQUEST_DEADLINE_MS = float(os.getenv("CLICKBAIT_REQUEST_DEADLINE_MS", "5000"))
+MAX_IN_FLIGHT = int(os.getenv("CLICKBAIT_MAX_IN_FLIGHT", "256"))
+DEGRADE_MARGIN_MS = float(os.getenv("CLICKBAIT_DEGRADE_MARGIN_MS", "200"))
+
+# /predict/stream: parça başına skorlanan satır ve tek satır için bayt sınırı
+STREAM_CHUNK_SIZE = int(os.getenv("CLICKBAIT_STREAM_CHUNK_SIZE", "256"))
+STREAM_MAX_LINE_BYTES = int(os.getenv("CLICKBAIT_STREAM_MAX_LINE_BYTES", "65536"))
+
+# /predict/page: tek istekte en fazla başlık ve açılmış gövde boyutu (bayt)
+PAGE_MAX_ITEMS = int(os.getenv("CLICKBAIT_PAGE_MAX_ITEMS", "500"))
+PAGE_MAX_BODY_BYTES = int(os.getenv("CLICKBAIT_PAGE_MAX_BODY_BYTES", "1048576"))
+
+# /jobs: SQLite kuyruğu, iş dosyaları ve süreç havuzu (0 worker = bu süreç iş çalıştırmaz)
+JOB_DB = os.getenv("CLICKBAIT_JOB_DB", str(BASE_DIR / ".cache" / "jobs.sqlite3"))
+JOB_DIR = os.getenv("CLICKBAIT_JOB_DIR", str(BASE_DIR / ".cache" / "jobs"))
+JOB_WORKERS = int(os.getenv("CLICKBAIT_JOB_WORKERS", "1"))
+JOB_CHUNK_SIZE = int(os.getenv("CLICKBAIT_JOB_CHUNK_SIZE", "512"))
+JOB_MAX_BYTES = int(os.getenv("CLICKBAIT_JOB_MAX_BYTES", str(1024 ** 3)))
+JOB_NICE = int(os.getenv("CLICKBAIT_JOB_NICE", "10"))
+
+# Çeviri önbelleği (boş DB yolu disk katmanını kapatır)
+TRANSLATION_CACHE_SIZE = int(os.getenv("CLICKBAIT_TRANSLATION_CACHE_SIZE", "20000"))
+TRANSLATION_CACHE_TTL = float(os.getenv("CLICKBAIT_TRANSLATION_CACHE_TTL", "604800"))
+TRANSLATION_CACHE_DB = os.getenv("CLICKBAIT_TRANSLATION_CACHE_DB", str(BASE_DIR / ".cache" / "translations.sqlite3"))
+
+# Tahmin sonucu önbelleği
+RESULT_CACHE_SIZE = int(os.getenv("CLICKBAIT_RESULT_CACHE_SIZE", "50000"))
+RESULT_CACHE_TTL = float(os.getenv("CLICKBAIT_RESULT_CACHE_TTL", "3600"))
 
 # Global değişkenler
-model = None
-tokenizer = None
-config = None
+translation_stage = build_stage(
+    TRANSLATORS,
+    timeout=TRANSLATION_TIMEOUT or None,
+    max_concurrency=TRANSLATION_WORKERS,
+)
+translation_cache = TranslationCache(
+    maxsize=TRANSLATION_CACHE_SIZE,
+    ttl=TRANSLATION_CACHE_TTL or None,
+    db_path=TRANSLATION_CACHE_DB or None,
+    stage=translation_stage,
+)
+# Önbellek versiyonu model her devreye alındığında ayarlanır (bkz. activate_models)
+result_cache = ResultCache(maxsize=RESULT_CACHE_SIZE, ttl=RESULT_CACHE_TTL or None)
+registry = ArtifactRegistry(MODEL_DIR)
+tr_registry = ArtifactRegistry(TR_MODEL_DIR)
+job_store = JobStore(JOB_DB, JOB_DIR)
+job_runner = JobRunner(job_store, JOB_WORKERS, JOB_CHUNK_SIZE, STREAM_MAX_LINE_BYTES, nice=JOB_NICE)
+
+
+@dataclass(frozen=True)
+class ServingModels:
+    """
+    Birlikte servis edilen modeller.
+
+    İstekler başta ``serving`` referansını bir kez okur ve sonuna kadar
+    aynı seti kullanır; sürüm değişimi tek bir atamadır.
+    """
+    version: Optional[str]
+    model: Any
+    tokenizer: Any
+    config: dict
+    tr_version: Optional[str] = None
+    tr_model: Any = None
+    tr_tokenizer: Any = None
+    tr_config: Optional[dict] = None
+    artifact_paths: tuple = ()
+    cache_version: str = ""
+    loaded_at: float = 0.0
+
+
+serving: Optional[ServingModels] = None
+model_status = "loading"  # loading | healthy | unhealthy
+reload_state = {"status": "idle", "target": None, "error": None}  # idle | loading | failed
+_reload_lock = threading.Lock()
+
+# Metrikler (/metrics); aşama süreleri clickbait_core içinde ölçülür
+HTTP_REQUESTS = REGISTRY.counter("clickbait_http_requests_total", "HTTP istekleri", ("path", "method", "status"))
+HTTP_SECONDS = REGISTRY.histogram("clickbait_http_request_duration_seconds", "HTTP istek süresi", ("path",))
+PREDICT_BATCH_SIZE = REGISTRY.histogram(
+    "clickbait_predict_batch_size", "predict_clickbait_batch çağrısı başına başlık (mikro batch dahil)",
+    buckets=BATCH_SIZE_BUCKETS,
+)
+DEGRADED_PREDICTIONS = REGISTRY.counter(
+    "clickbait_degraded_predictions_total", "Yedek çeviriyle veya çevrilmeden (süre sınırı, çeviri hatası) skorlanan başlıklar"
+)
 
 
 # Request/Response modelleri
@@ -70,6 +197,9 @@ class PredictResponse(BaseModel):
     score: float = Field(..., description="Clickbait skoru (0-1)")
     confidence: float = Field(..., description="Güven yüzdesi")
     label: str = Field(..., description="Etiket")
+    heuristic: Optional[str] = Field(None, description="Skoru düşüren güvenli kalıp kuralı")
+    language: Optional[str] = Field(None, description="Tespit edilen dil (tr başlıklar çevrilmeden skorlanır)")
+    degraded: bool = Field(False, description="Asıl çevirmen kullanılamadı (süre sınırı/hata); başlık yedek çeviriyle veya çevrilmeden skorlandı")
     
     class Config:
         json_schema_extra = {
@@ -86,104 +216,408 @@ class BatchPredictRequest(BaseModel):
     texts: list[str] = Field(..., min_length=1, max_length=50, description="Analiz edilecek başlıklar listesi")
 
 
+class PageScanRequest(BaseModel):
+    texts: list[Annotated[str, Field(min_length=1, max_length=500)]] = Field(
+        ..., min_length=1, max_length=PAGE_MAX_ITEMS, description="Sayfadan toplanan başlıklar"
+    )
+
+
+class PageScanResponse(BaseModel):
+    version: Optional[str] = Field(None, description="Skorlayan model sürümü (eklenti önbelleği için)")
+    scores: list[float] = Field(..., description="Başlık sırasıyla clickbait skorları (0-1)")
+    clickbait: list[int] = Field(..., description="Başlık sırasıyla 1 = clickbait, 0 = normal")
+    degraded: list[int] = Field(..., description="Başlık sırasıyla 1 = yedek çeviriyle veya çevrilmeden skorlandı (önbelleğe alınmamalı)")
+
+
 class HealthResponse(BaseModel):
     status: str
     model_loaded: bool
     version: str
 
 
+def load_serving_models(version: Optional[str] = None) -> ServingModels:
+    """
+    Model sürümünü (verilmezse etkin sürümü) ve Türkçe modeli yükleyip ısıt.
+
+    Servis edilen set bu sırada değişmez; ağır modüller (TensorFlow)
+    ilk çağrıda burada import edilir.
+    """
+    version, model_dir = registry.resolve(version)
+    logger.info(f"Model yükleniyor ({ENGINE}, sürüm: {version or 'sürümsüz'})...")
+    loaded_model, loaded_tokenizer, loaded_config = load_artifacts(model_dir, ENGINE)
+
+    # İlk isteğin graf oluşturma maliyetini burada öde
+    warmup = loaded_tokenizer.encode_batch([""], loaded_config['max_length'])
+    loaded_model.predict(warmup, verbose=0)
+
+    tr_version, tr_model, tr_tokenizer, tr_config, tr_paths = load_turkish_model()
+    paths = tuple(artifact_paths(model_dir, ENGINE) + tr_paths)
+    return ServingModels(
+        version=version,
+        model=loaded_model,
+        tokenizer=loaded_tokenizer,
+        config=loaded_config,
+        tr_version=tr_version,
+        tr_model=tr_model,
+        tr_tokenizer=tr_tokenizer,
+        tr_config=tr_config,
+        artifact_paths=paths,
+        cache_version=artifact_fingerprint(paths),
+        loaded_at=time.time(),
+    )
+
+
+def load_turkish_model():
+    """
+    Türkçe modeli (varsa) yükle: ``(sürüm, model, tokenizer, config, artefaktlar)``.
+
+    Model yoksa model alanları ``None`` olur ve tüm başlıklar çeviri
+    yolundan geçer; artefakt yolları model sonradan eklenirse diye yine izlenir.
+    """
+    if not NATIVE_TURKISH:
+        return None, None, None, None, []
+    # Sürüm yüklenemese de döner; izleme modu aynı sürümü tekrar tekrar denemez
+    tr_version, model_dir = None, TR_MODEL_DIR
+    try:
+        tr_version, model_dir = tr_registry.resolve()
+        loaded_model, loaded_tokenizer, loaded_config = load_artifacts(model_dir, ENGINE)
+        warmup = loaded_tokenizer.encode_batch([""], loaded_config['max_length'])
+        loaded_model.predict(warmup, verbose=0)
+    except FileNotFoundError:
+        logger.info(f"Türkçe model bulunamadı ({TR_MODEL_DIR}), Türkçe başlıklar çevrilecek")
+        return tr_version, None, None, None, artifact_paths(model_dir, ENGINE)
+    except Exception as e:
+        logger.error(f"Türkçe model yüklenemedi, Türkçe başlıklar çevrilecek: {e}")
+        return tr_version, None, None, None, artifact_paths(model_dir, ENGINE)
+    logger.info("✅ Türkçe model yüklendi, Türkçe başlıklar çevrilmeden skorlanacak")
+    return tr_version, loaded_model, loaded_tokenizer, loaded_config, artifact_paths(model_dir, ENGINE)
+
+
+def activate_models(loaded: ServingModels):
+    """Yüklenmiş seti tek atamayla devreye al; önbellek önce yeni sürüme geçer"""
+    global serving, model_status
+    result_cache.activate(loaded.cache_version)
+    serving = loaded
+    model_status = "healthy"
+
+
 def load_model_and_tokenizer():
-    """Model ve tokenizer'ı yükle"""
-    global model, tokenizer, config
+    """
+    Başlangıçta etkin model sürümünü yükle.
+
+    Ağır modüller (TensorFlow, deep_translator) burada bir kez import edilir.
+    """
+    global model_status
     
     try:
-        if not MODEL_PATH.exists():
-            logger.warning(f"Model dosyası bulunamadı: {MODEL_PATH}")
-            return False
-        
-        logger.info("Model yükleniyor...")
-        model = tf.keras.models.load_model(str(MODEL_PATH))
-        
-        with open(TOKENIZER_PATH, 'rb') as f:
-            tokenizer = pickle.load(f)
-        
-        with open(CONFIG_PATH, 'rb') as f:
-            config = pickle.load(f)
-        
-        logger.info("✅ Model başarıyla yüklendi!")
+        loaded = load_serving_models()
+        try:
+            import deep_translator  # noqa: F401
+        except ImportError as e:
+            logger.warning(f"deep_translator yüklenemedi, çeviri devre dışı: {e}")
+        activate_models(loaded)
+        logger.info(f"✅ Model başarıyla yüklendi! (sürüm: {loaded.version or 'sürümsüz'})")
         return True
     
+    except FileNotFoundError as e:
+        logger.warning(str(e))
+        model_status = "unhealthy"
+        return False
+
     except Exception as e:
         logger.error(f"❌ Model yüklenirken hata: {e}")
+        model_status = "unhealthy"
         return False
 
 
-def clean_text(text: str) -> str:
-    """Metni temizle ve normalize et"""
-    if not isinstance(text, str):
-        return ""
-    text = text.lower()
-    text = re.sub(r'[^\w\sğüşıöçĞÜŞİÖÇ]', '', text)
-    text = re.sub(r'\s+', ' ', text).strip()
-    return text
+def reload_model(version: Optional[str] = None, persist: bool = False) -> bool:
+    """
+    Yeni sürümü arka planda yükle ve hazır olunca devreye al.
+
+    Yükleme sürerken ve başarısız olursa eski sürüm servis etmeye devam
+    eder. ``persist`` sürümü ``versions/ACTIVE`` dosyasına da yazar; böylece
+    izleme modundaki diğer worker'lar ve podlar da aynı sürüme geçer.
+    """
+    if not _reload_lock.acquire(blocking=False):
+        return False
+    try:
+        reload_state.update(status="loading", target=version, error=None)
+        loaded = load_serving_models(version)
+        if persist and loaded.version is not None:
+            registry.activate(loaded.version)
+        previous = serving.version if serving is not None else None
+        activate_models(loaded)
+        reload_state.update(status="idle", error=None)
+        logger.info(f"🔄 Model sürümü değişti: {previous or 'sürümsüz'} -> {loaded.version or 'sürümsüz'}")
+        return True
+    except Exception as e:
+        reload_state.update(status="failed", error=str(e))
+        logger.error(f"❌ Model sürümü yüklenemedi, eski sürüm servis edilmeye devam ediyor: {e}")
+        return False
+    finally:
+        _reload_lock.release()
+
+
+def watch_registry(interval: float):
+    """
+    ``versions/ACTIVE`` veya servis edilen artefakt dosyaları değiştiğinde
+    yeni seti yükle (başarısız durum, dosyalar tekrar değişene kadar denenmez).
+    """
+    failed = None
+    while True:
+        time.sleep(interval)
+        if model_status == "loading":
+            continue
+        try:
+            wanted = (registry.active_version(), tr_registry.active_version() if NATIVE_TURKISH else None)
+        except OSError as e:
+            logger.warning(f"Model sürüm kaydı okunamadı: {e}")
+            continue
+        current = serving
+        if current is not None:
+            # Sürümsüz (düz) artefaktlar /model/reload olmadan yerinde değiştirilmiş olabilir
+            wanted += (artifact_fingerprint(current.artifact_paths),)
+            if wanted == (current.version, current.tr_version, current.cache_version):
+                continue
+        if wanted == failed:
+            continue
+        failed = None if reload_model() else wanted
+
+
+def ensure_model_loaded() -> ServingModels:
+    """Servis edilen model setini döndür; model hazır değilse 503"""
+    current = serving
+    if current is None:
+        detail = (
+            "Model yükleniyor, lütfen biraz sonra tekrar deneyin."
+            if model_status == "loading"
+            else "Model henüz yüklenmedi. Lütfen önce modeli eğitin."
+        )
+        raise HTTPException(status_code=503, detail=detail)
+    return current
+
+
+def translate_text(text: str) -> str:
+    """Başlığı İngilizce'ye çevir, hata olursa orijinal metni döndür"""
+    return translation_cache.translate(text)
+
+
+def translate_batch(texts: list[str], fallback: bool = True) -> list[Optional[str]]:
+    """
+    Başlıkları önbellek ve çeviri aşaması üzerinden çevir (sıra korunur).
+
+    Eşzamanlılık sınırı ve zaman aşımı aşamada uygulanır;
+    ``fallback=False`` ise başarısız çeviriler ``None`` döner.
+    """
+    return translation_cache.translate_batch(texts, fallback=fallback)
+
+
+def predict_clickbait_batch(texts: list[str], deadline: Union[None, float, list[Optional[float]]] = None) -> list[dict]:
+    """
+    Birden fazla başlığı tek seferde skorla.
+
+    Önbellekte olan başlıklar doğrudan döner. Kalan başlıklar bir kez
+    işlenir; çeviri eşzamanlı yapılır, tümü tek bir matris halinde
+    modelden geçirilir. Model seti başta bir kez okunur; sürüm değişimi
+    sürmekte olan bir batch'i etkilemez. ``deadline`` (``time.monotonic()``;
+    tek an veya başlık başına liste) verilirse her başlığın çevirisi kendi
+    süre sınırına kadar sürebilir (bkz. ``_predict_translated``).
+    """
+    models = ensure_model_loaded()
+    PREDICT_BATCH_SIZE.observe(len(texts))
+    cached = result_cache.get_many(texts, models.cache_version)
+    unique_texts = [text for text in dict.fromkeys(texts) if text not in cached]
+    if unique_texts:
+        if isinstance(deadline, (list, tuple)):
+            # Aynı başlık birden çok istekte geçerse en geç süre sınırı geçerlidir
+            latest = latest_deadlines(texts, deadline)
+            deadline = [latest[text] for text in unique_texts]
+        cached.update(_predict_uncached(models, unique_texts, deadline))
+    return [dict(cached[text]) for text in texts]
+
+
+def _predict_uncached(models: ServingModels, unique_texts: list[str],
+                     deadline: Union[None, float, list[Optional[float]]] = None) -> dict:
+    """Önbellekte olmayan benzersiz başlıkları skorla (liste halindeki ``deadline`` başlık sırasıyladır)"""
+    languages = dict(zip(unique_texts, detect_languages(unique_texts)))
+    # Türkçe model yüklüyse Türkçe başlıklar çeviri turu olmadan doğrudan ona gider
+    has_tr = models.tr_model is not None
+    native = [text for text in unique_texts if has_tr and languages[text] == "tr"]
+    translated = [text for text in unique_texts if not has_tr or languages[text] != "tr"]
+    if isinstance(deadline, (list, tuple)):
+        deadlines = dict(zip(unique_texts, deadline))
+        deadline = [deadlines[text] for text in translated]
+
+    results, durable = _predict_translated(models, translated, deadline) if translated else ({}, set())
+    if native:
+        scores = score_texts(models.tr_model, models.tr_tokenizer, models.tr_config, clean_texts(native))
+        results.update(zip(native, build_results(native, native, scores)))
+        durable.update(native)
+
+    for text, result in results.items():
+        result['language'] = languages[text]
+        result.setdefault('degraded', False)
+    # Çevirisi başarısız olan veya yedek sözlükten gelen başlıklar önbelleğe yazılmaz
+    result_cache.set_many({text: result for text, result in results.items() if text in durable},
+                          version=models.cache_version)
+    return results
+
+
+def _predict_translated(models: ServingModels, unique_texts: list[str],
+                        deadline: Union[None, float, list[Optional[float]]] = None) -> tuple[dict, set]:
+    """
+    Başlıkları İngilizce'ye çevirip ana modelle skorla; ``(sonuçlar, önbelleğe yazılabilenler)``.
+
+    Ağ çevirisi, süre sınırından ``DEGRADE_MARGIN_MS`` önce bırakılır;
+    kalan pay yerel yedek çeviri (sözlük) ve model içindir. Yedek arka uç
+    süre dolmuş olsa da çalışır; hiçbir arka ucun çeviremediği başlıklar
+    orijinal metinle skorlanır. Kalıcı olmayan (yedekten gelen veya
+    çevrilemeyen) her sonuç ``degraded`` olarak işaretlenir.
+    """
+    # 1. Translate (başarısız çeviride orijinal metin kullanılır)
+    margin = DEGRADE_MARGIN_MS / 1000.0
+    if isinstance(deadline, (list, tuple)):
+        translate_deadline = [None if item is None else item - margin for item in deadline]
+    else:
+        translate_deadline = None if deadline is None else deadline - margin
+    translations = translation_cache.translate_batch_detailed(unique_texts, deadline=translate_deadline)
+    translated_texts = [
+        text if translated is None else translated
+        for text, (translated, _) in zip(unique_texts, translations)
+    ]
+
+    # 2. Predict (tek forward pass)
+    cleaned = clean_texts(translated_texts)
+    scores = score_texts(models.model, models.tokenizer, models.config, cleaned)
+
+    results = dict(zip(unique_texts, build_results(unique_texts, translated_texts, scores)))
+    durable = {text for text, (_, is_durable) in zip(unique_texts, translations) if is_durable}
+    # Önbelleğe yazılmayan her sonuç (yedek çeviri veya çevrilemedi) degraded sayılır
+    for text in unique_texts:
+        results[text]['degraded'] = text not in durable
+    degraded = len(unique_texts) - len(durable)
+    if degraded:
+        DEGRADED_PREDICTIONS.inc(degraded)
+    return results, durable
 
 
 def predict_clickbait(text: str) -> dict:
     """Clickbait tahmini yap"""
-    from tensorflow.keras.preprocessing.sequence import pad_sequences
-    
-    from deep_translator import GoogleTranslator
+    return predict_clickbait_batch([text])[0]
 
-    # 1. Translate
-    try:
-        translated_text = GoogleTranslator(source='auto', target='en').translate(text)
-    except Exception as e:
-        logger.error(f"Translation failed: {e}")
-        translated_text = text
 
-    # 2. Predict
-    cleaned = clean_text(translated_text)
-    sequence = tokenizer.texts_to_sequences([cleaned])
-    padded = pad_sequences(sequence, maxlen=config['max_length'], padding='post', truncating='post')
-    
-    score = float(model.predict(padded, verbose=0)[0][0])
-
-    # --- Heuristics to reduce False Positives ---
-    safe_patterns = [
-        r"(?i).*\b(dollar|euro|gold|currency|exchange rate)\b.*\?", # Money questions
-        r"(?i).*\b(match|score|won|lost|game)\b.*\?",               # Sports questions
-        r"(?i).*\b(school|holiday|vacation|class)\b.*\?",            # School questions
-        r"(?i).*\b(weather|snow|rain|temperature|forecast)\b.*",     # Weather
-        r"(?i).*\b(announced|statement|reported|said)\b.*",          # Official statements
-    ]
-    
-    is_safe = False
-    for pattern in safe_patterns:
-        if re.search(pattern, translated_text):
-            is_safe = True
-            break
-            
-    if is_safe and score > 0.5:
-        logger.info(f"Heuristic applied: Safe pattern detected for '{translated_text}'")
-        score = min(score, 0.3) # Force to Normal
-
-    is_clickbait = score > 0.5
-    
-    return {
-        'is_clickbait': is_clickbait,
-        'score': round(score, 4),
-        'confidence': round(score * 100 if is_clickbait else (1 - score) * 100, 2),
-        'label': 'CLICKBAIT' if is_clickbait else 'NORMAL',
-        'original_text': text,
-        'translated_text': translated_text
-    }
+def predict_batch_items(items: list[tuple[str, Optional[float]]]) -> list[dict]:
+    """Mikro batch: ``(başlık, süre sınırı)`` çiftleri; her başlık kendi süre sınırıyla çevrilir"""
+    return predict_clickbait_batch([text for text, _ in items], [deadline for _, deadline in items])
+
+
+batcher = MicroBatcher(predict_batch_items, max_batch_size=MAX_BATCH_SIZE, max_wait_ms=MAX_BATCH_WAIT_MS,
+                       max_concurrent_batches=MAX_CONCURRENT_BATCHES)
+admission = AdmissionController(MAX_IN_FLIGHT)
+
+
+async def admit_prediction(
+    deadline_ms: Optional[str] = Header(None, alias=DEADLINE_HEADER,
+                                        description="İstek süre sınırı (ms); varsayılanı yalnızca kısaltabilir"),
+):
+    """
+    Tahmin uç noktaları için bağımlılık: yer yoksa 429, varsa isteğin süre sınırı.
+
+    Sınır istek boyunca tutulur; yanıt dönünce bırakılır. ``async`` olduğu
+    için olay döngüsünde çalışır: thread havuzu dolu olsa da 429 hemen döner
+    ve ``admission`` sayacı tek thread'den güncellenir.
+    """
+    deadline = request_deadline(deadline_ms, REQUEST_DEADLINE_MS)
+    with admission.admit():
+        yield deadline
+
+
+def check_deadline_settings():
+    """Süre sınırı, ağ çevirisinin zaman aşımına yetmiyorsa uyar (yedek çeviri yine çalışır)"""
+    if not REQUEST_DEADLINE_MS or not TRANSLATION_TIMEOUT:
+        return
+    budget_ms = REQUEST_DEADLINE_MS - DEGRADE_MARGIN_MS
+    if budget_ms < TRANSLATION_TIMEOUT * 1000:
+        logger.warning(
+            f"CLICKBAIT_REQUEST_DEADLINE_MS ({REQUEST_DEADLINE_MS:.0f}) - CLICKBAIT_DEGRADE_MARGIN_MS "
+            f"({DEGRADE_MARGIN_MS:.0f}) = {budget_ms:.0f} ms, çeviri zaman aşımından "
+            f"({TRANSLATION_TIMEOUT * 1000:.0f} ms) kısa; yavaş çeviriler süre sınırında kesilecek"
+        )
 
 
 # Startup event
 @app.on_event("startup")
 async def startup_event():
-    """Uygulama başlatıldığında modeli yükle"""
-    load_model_and_tokenizer()
+    """Modeli arka planda yükle; /health hemen yanıt verebilsin"""
+    check_deadline_settings()
+    await batcher.start()
+    threading.Thread(target=load_model_and_tokenizer, name="model-loader", daemon=True).start()
+    if MODEL_WATCH_INTERVAL > 0:
+        threading.Thread(target=watch_registry, args=(MODEL_WATCH_INTERVAL,),
+                         name="model-watcher", daemon=True).start()
+    if JOB_WORKERS > 0:
+        job_runner.start()
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Uygulama kapanırken bekleyen batch'leri durdur; çalışan işler kuyruğa döner"""
+    await batcher.stop()
+    if JOB_WORKERS > 0:
+        await run_in_threadpool(job_runner.stop)
+
+
+def collect_runtime_metrics():
+    """Önbellek, çeviri arka ucu ve model sürümü sayaçlarını okuma anında topla"""
+    caches = {"translation": translation_cache.stats(), "result": result_cache.stats()}
+    yield ("clickbait_cache_hits_total", "counter", "Önbellek isabetleri",
+           [({"cache": name}, stats["hits"]) for name, stats in caches.items()])
+    yield ("clickbait_cache_misses_total", "counter", "Önbellek ıskalamaları",
+           [({"cache": name}, stats["misses"]) for name, stats in caches.items()])
+    yield ("clickbait_cache_hit_ratio", "gauge", "Önbellek isabet oranı",
+           [({"cache": name}, stats["hit_rate"]) for name, stats in caches.items()])
+    yield ("clickbait_cache_entries", "gauge", "Önbellekteki kayıt sayısı",
+           [({"cache": name}, stats["size"]) for name, stats in caches.items()])
+    yield ("clickbait_translation_failures_total", "counter", "Hiçbir arka ucun çeviremediği başlıklar",
+           [({}, caches["translation"]["errors"])])
+
+    backends = translation_stage.stats()
+    for field, help in (("calls", "Çeviri arka ucu çağrıları"), ("errors", "Çeviri arka ucu hataları"),
+                        ("timeouts", "Çeviri arka ucu zaman aşımları")):
+        yield (f"clickbait_translation_backend_{field}_total", "counter", help,
+               [({"backend": name}, stats[field]) for name, stats in backends.items()])
+
+    limits = admission.stats()
+    yield ("clickbait_in_flight_requests", "gauge", "İşlenmekte olan tahmin istekleri",
+           [({}, limits["in_flight"])])
+    yield ("clickbait_rejected_requests_total", "counter", "Yük atma ile reddedilen istekler (429/503)",
+           [({"reason": "overloaded"}, limits["rejected"]), ({"reason": "deadline"}, limits["timed_out"])])
+
+    yield ("clickbait_jobs", "gauge", "Durumlarına göre toplu skorlama işleri",
+           [({"status": status}, count) for status, count in job_store.counts().items()])
+
+    current = serving
+    yield ("clickbait_model_info", "gauge", "Servis edilen model sürümü",
+           [({"version": current.version or "unversioned", "engine": ENGINE}, 1)] if current is not None else [])
+
+
+REGISTRY.add_collector(collect_runtime_metrics)
+
+
+@app.middleware("http")
+async def record_request_metrics(request: Request, call_next):
+    """İstek sayısı ve süresi (yol şablonu etiketiyle, örn. /predict/batch)"""
+    started = time.perf_counter()
+    status = 500
+    try:
+        response = await call_next(request)
+        status = response.status_code
+        return response
+    finally:
+        route = request.scope.get("route")
+        path = route.path if route is not None else "unmatched"
+        HTTP_REQUESTS.inc(path=path, method=request.method, status=status)
+        HTTP_SECONDS.observe(time.perf_counter() - started, path=path)
 
 
 # Endpoints
@@ -202,81 +636,257 @@ async def root():
 async def health_check():
     """API sağlık kontrolü"""
     return {
-        "status": "healthy" if model is not None else "unhealthy",
-        "model_loaded": model is not None,
+        "status": model_status,
+        "model_loaded": serving is not None,
         "version": "1.0.0"
     }
 
 
 @app.post("/predict", response_model=PredictResponse, tags=["Prediction"])
-async def predict(request: PredictRequest):
+async def predict(request: PredictRequest, deadline: Optional[float] = Depends(admit_prediction)):
     """
     Tek bir başlık için clickbait tahmini yap.
     
     - **text**: Analiz edilecek haber başlığı
     """
-    if model is None:
-        raise HTTPException(
-            status_code=503, 
-            detail="Model henüz yüklenmedi. Lütfen önce modeli eğitin."
-        )
+    ensure_model_loaded()
     
     try:
-        result = predict_clickbait(request.text)
+        result = await admission.wait(batcher.submit((request.text, deadline)), deadline)
         return result
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Tahmin hatası: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.post("/predict/batch", tags=["Prediction"])
-async def predict_batch(request: BatchPredictRequest):
+async def predict_batch(request: BatchPredictRequest, deadline: Optional[float] = Depends(admit_prediction)):
     """
     Birden fazla başlık için toplu clickbait tahmini yap.
     
     - **texts**: Analiz edilecek haber başlıkları listesi (max 50)
     """
-    if model is None:
-        raise HTTPException(
-            status_code=503, 
-            detail="Model henüz yüklenmedi. Lütfen önce modeli eğitin."
-        )
+    ensure_model_loaded()
     
     try:
-        results = []
-        for text in request.texts:
-            result = predict_clickbait(text)
+        results = await admission.wait(run_in_threadpool(predict_clickbait_batch, request.texts, deadline), deadline)
+        for text, result in zip(request.texts, results):
             result['text'] = text
-            results.append(result)
         
         # İstatistikler
         clickbait_count = sum(1 for r in results if r['is_clickbait'])
         
         return {
             "results": results,
-            "summary": {
-                "total": len(results),
-                "clickbait_count": clickbait_count,
-                "normal_count": len(results) - clickbait_count,
-                "clickbait_ratio": round(clickbait_count / len(results) * 100, 2)
-            }
+            "summary": summarize(len(results), clickbait_count)
         }
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Toplu tahmin hatası: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.post("/predict/stream", tags=["Prediction"])
+async def predict_stream(request: Request, field: str = "text"):
+    """
+    Sınırsız uzunlukta başlık listesini akış olarak skorla.
+    
+    Gövde NDJSON (``{"text": ..., "id": ...}``) veya satır başına bir düz
+    metin başlık olabilir. Satırlar ``CLICKBAIT_STREAM_CHUNK_SIZE``'lık
+    parçalar halinde skorlanır; her sonuç bir NDJSON satırı olarak hemen
+    gönderilir, en son satır ``{"summary": {...}}`` özetidir. Hatalı
+    satırlar ``{"line": n, "error": "..."}`` olarak bildirilir, akış durmaz.
+    Sonuç ve hata satırları girdi satır sırasıyla gelir.
+    
+    - **field**: NDJSON kayıtlarında başlığın bulunduğu alan (varsayılan ``text``)
+    """
+    ensure_model_loaded()
+
+    async def score_chunk(texts: list[str]) -> list[dict]:
+        return await run_in_threadpool(predict_clickbait_batch, texts)
+
+    lines = iter_lines(request.stream(), STREAM_MAX_LINE_BYTES)
+    return NDJSONStreamingResponse(ndjson_stream(lines, score_chunk, STREAM_CHUNK_SIZE, field))
+
+
+# Gövdesi gzip/deflate ile sıkıştırılabilen uç noktalar
+compressed_router = APIRouter(route_class=compressed_route(PAGE_MAX_BODY_BYTES))
+
+
+@compressed_router.post("/predict/page", response_model=PageScanResponse, tags=["Prediction"])
+async def predict_page(request: PageScanRequest, deadline: Optional[float] = Depends(admit_prediction)):
+    """
+    Bir haber sayfasındaki tüm başlıkları tek batch'te skorla (eklenti sayfa taraması).
+    
+    Gövde ``Content-Encoding: gzip`` ile sıkıştırılmış olabilir. Yanıt,
+    sayfayı işaretlemek için yalnızca başlık sırasıyla skor, etiket ve
+    ``degraded`` (yedek çeviriyle veya çevrilmeden skorlandı; istemci
+    önbelleğe almamalı) dizilerini içerir.
+    
+    - **texts**: Sayfadan toplanan başlıklar (max ``CLICKBAIT_PAGE_MAX_ITEMS``)
+    """
+    models = ensure_model_loaded()
+
+    try:
+        results = await admission.wait(run_in_threadpool(predict_clickbait_batch, request.texts, deadline), deadline)
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Sayfa tarama hatası: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+    return {
+        "version": models.version,
+        "scores": [round(result['score'], 4) for result in results],
+        "clickbait": [int(result['is_clickbait']) for result in results],
+        "degraded": [int(result['degraded']) for result in results],
+    }
+
+
+app.include_router(compressed_router)
+
+
+def get_job_or_404(job_id: str) -> dict:
+    job = job_store.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"İş bulunamadı: {job_id}")
+    return job
+
+
+@app.post("/jobs", status_code=202, tags=["Jobs"])
+async def create_job(request: Request, field: str = "text"):
+    """
+    Büyük bir başlık dosyasını arka planda skorlamak için kuyruğa al.
+    
+    Gövde ``/predict/stream`` ile aynı biçimdedir (NDJSON veya satır başına
+    düz metin). Dosya diske yazılır ve hemen iş id'si döner; ilerleme
+    ``GET /jobs/{job_id}``, sonuçlar ``GET /jobs/{job_id}/results`` ile alınır.
+    
+    - **field**: NDJSON kayıtlarında başlığın bulunduğu alan (varsayılan ``text``)
+    """
+    job_id = uuid.uuid4().hex
+    input_path = job_store.input_path(job_id)
+    try:
+        total_lines = await save_upload(request.stream(), input_path, JOB_MAX_BYTES)
+    except ValueError as e:
+        raise HTTPException(status_code=413, detail=str(e))
+    if total_lines == 0:
+        input_path.unlink(missing_ok=True)
+        raise HTTPException(status_code=400, detail="Dosya boş")
+    return describe(job_store.create(job_id, field, total_lines))
+
+
+@app.get("/jobs", tags=["Jobs"])
+async def list_jobs(limit: int = 50):
+    """Son işler (en yeni önce)"""
+    return {"workers": JOB_WORKERS, "jobs": [describe(job) for job in job_store.list(limit)]}
+
+
+@app.get("/jobs/{job_id}", tags=["Jobs"])
+async def get_job(job_id: str):
+    """İşin durumu, ilerlemesi ve o ana kadarki özeti"""
+    return describe(get_job_or_404(job_id))
+
+
+@app.get("/jobs/{job_id}/results", tags=["Jobs"])
+async def get_job_results(job_id: str):
+    """Tamamlanan işin NDJSON sonuç dosyası (``/predict/stream`` ile aynı satırlar)"""
+    job = get_job_or_404(job_id)
+    if job["status"] != "completed":
+        raise HTTPException(status_code=409, detail=f"İş henüz tamamlanmadı (durum: {job['status']})")
+    return FileResponse(job_store.output_path(job_id), media_type=NDJSON_MEDIA_TYPE, filename=f"{job_id}.ndjson")
+
+
+@app.delete("/jobs/{job_id}", tags=["Jobs"])
+async def cancel_job(job_id: str):
+    """Bekleyen veya çalışan işi iptal et (çalışan iş mevcut parçadan sonra durur)"""
+    job = get_job_or_404(job_id)
+    if not job_store.cancel(job_id):
+        raise HTTPException(status_code=409, detail=f"İş zaten bitmiş (durum: {job['status']})")
+    return describe(job_store.get(job_id))
+
+
+@app.get("/cache/stats", tags=["Cache"])
+async def cache_stats():
+    """Önbellek isabet/ıskalama istatistikleri"""
+    return {
+        "translation": translation_cache.stats(),
+        "result": result_cache.stats()
+    }
+
+
+@app.get("/metrics", response_class=PlainTextResponse, tags=["Health"])
+async def metrics():
+    """Prometheus metin formatında metrikler (istekler, batch boyutları, aşama süreleri, önbellekler)"""
+    return PlainTextResponse(REGISTRY.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
+
+
+@app.get("/translation/stats", tags=["Cache"])
+async def translation_stats():
+    """Çeviri arka uçlarının çağrı, hata, zaman aşımı ve gecikme istatistikleri"""
+    return {
+        "backends": [backend.name for backend in translation_stage.backends],
+        "timeout": translation_stage.timeout,
+        "max_concurrency": translation_stage.max_concurrency,
+        "metrics": translation_stage.stats()
+    }
+
+
 @app.get("/model/info", tags=["Model"])
 async def model_info():
     """Model hakkında bilgi al"""
-    if config is None:
+    current = serving
+    if current is None:
         raise HTTPException(status_code=503, detail="Model henüz yüklenmedi.")
+    config = current.config
     
     return {
+        "version": current.version,
+        "tr_version": current.tr_version,
+        "loaded_at": current.loaded_at,
         "vocab_size": config['vocab_size'],
         "max_length": config['max_length'],
         "embedding_dim": config['embedding_dim'],
-        "model_loaded": model is not None
+        "engine": ENGINE,
+        "model_loaded": True,
+        "native_turkish": current.tr_model is not None,
+        "reload": dict(reload_state)
+    }
+
+
+@app.get("/model/versions", tags=["Model"])
+async def model_versions():
+    """Kayıtlı model sürümleri ve eğitim bilgileri"""
+    return {
+        "active": registry.active_version(),
+        "serving": serving.version if serving is not None else None,
+        "versions": [dict(registry.describe(version), version=version) for version in registry.versions()]
+    }
+
+
+@app.post("/model/reload", status_code=202, tags=["Model"])
+async def model_reload(version: Optional[str] = None):
+    """
+    Model sürümünü kesintisiz değiştir.
+
+    Yeni sürüm arka planda yüklenir; hazır olana kadar eski sürüm servis
+    edilir. ``version`` verilmezse ``versions/ACTIVE`` yeniden okunur;
+    verilirse o sürüm yüklenip etkin sürüm olarak kaydedilir.
+    """
+    if _reload_lock.locked():
+        raise HTTPException(status_code=409, detail="Başka bir model yüklemesi sürüyor.")
+    try:
+        target, _ = registry.resolve(version)
+    except FileNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    threading.Thread(target=reload_model, args=(version, version is not None),
+                     name="model-reloader", daemon=True).start()
+    return {
+        "status": "loading",
+        "target": target,
+        "serving": serving.version if serving is not None else None
     }
 
 
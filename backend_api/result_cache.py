@@ -0,0 +1,84 @@
+"""
+💾 Clickbait Avcısı - Tahmin Sonucu Önbelleği
+============================================
+Aynı başlık için çeviri, temizleme, tokenizasyon ve model çağrısını
+tekrarlamadan hazır yanıtı döndürür.
+
+Anahtar: (model versiyonu, normalize edilmiş başlık). Model versiyonu
+servis edilen model setine aittir (``ServingModels.cache_version``):
+set yüklenirken artefaktların boyut ve değişiklik zamanlarından üretilir
+ve her model değişiminde ``activate`` ile önbelleğe bildirilir. Diskteki
+dosyalar değişse de yeni set devreye alınana kadar anahtar değişmez;
+böylece bellekteki modelle eşleşmeyen bir versiyon altında skor tutulmaz.
+"""
+
+import copy
+import hashlib
+import threading
+from pathlib import Path
+from typing import Iterable, Optional
+
+from clickbait_core.cache import LRUCache
+from clickbait_core.translation import normalize_key
+
+
+def artifact_fingerprint(paths: Iterable[Path]) -> str:
+    """Artefakt dosyalarından kısa bir versiyon özeti üret"""
+    digest = hashlib.sha1()
+    for path in paths:
+        try:
+            stat = Path(path).stat()
+            digest.update(f"{path}:{stat.st_size}:{stat.st_mtime_ns};".encode())
+        except FileNotFoundError:
+            digest.update(f"{path}:missing;".encode())
+    return digest.hexdigest()[:12]
+
+
+class ResultCache:
+    """Servis edilen model setine bağlı LRU tahmin önbelleği"""
+
+    def __init__(self, maxsize: int = 50000, ttl: Optional[float] = None):
+        self.cache = LRUCache(maxsize=maxsize, ttl=ttl)
+        self.invalidations = 0
+        self.version = ""
+        self._lock = threading.Lock()
+
+    def activate(self, version: str):
+        """Yeni model setine geç; versiyon değiştiyse önbelleği boşalt"""
+        with self._lock:
+            if version != self.version:
+                self.version = version
+                self.cache.clear()
+                self.invalidations += 1
+
+    def get_many(self, texts: list[str], version: Optional[str] = None) -> dict:
+        """
+        Önbellekte bulunan başlıkların yanıtlarını döndür.
+
+        ``version`` isteği skorlayacak model setinin versiyonudur; değişim
+        sırasında eski setle başlayan istek yeni setin yanıtlarını almaz.
+        """
+        version = version or self.version
+        found = {}
+        for text in texts:
+            result = self.cache.get((version, normalize_key(text)))
+            if result is not None:
+                found[text] = copy.copy(result)
+        return found
+
+    def set_many(self, results: dict, version: Optional[str] = None):
+        """
+        ``{başlık: yanıt}`` eşlemesini önbelleğe yaz.
+
+        ``version`` yanıtları üreten modelin versiyonudur; model değişimi
+        sırasında eski modelden gelen yanıtlar yeni versiyonla karışmaz.
+        """
+        version = version or self.version
+        for text, result in results.items():
+            self.cache.set((version, normalize_key(text)), copy.copy(result))
+
+    def stats(self) -> dict:
+        stats = self.cache.stats()
+        stats["version"] = self.version
+        stats["invalidations"] = self.invalidations
+        return stats
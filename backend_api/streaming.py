@@ -0,0 +1,176 @@
+"""
+🌊 Clickbait Avcısı - NDJSON Akış Skorlama
+==========================================
+``POST /predict/stream`` için yardımcılar.
+
+İstek gövdesi satır satır okunur (NDJSON ``{"text": ...}`` kayıtları veya
+düz metin satırları). Satırlar sabit boyutlu parçalar halinde toplanıp tek
+seferde skorlanır ve her parçanın sonuçları hemen NDJSON olarak yazılır.
+Bellekte aynı anda yalnızca bir parça ve yarım kalan son satır tutulur;
+girdi boyutu ne olursa olsun bellek kullanımı sabittir. Akışın sonunda
+toplam özet (``clickbait_count``, ``clickbait_ratio``) gönderilir.
+"""
+
+import json
+from typing import AsyncIterator, Awaitable, Callable, Optional
+
+from starlette.responses import StreamingResponse
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+class NDJSONStreamingResponse(StreamingResponse):
+    """
+    İstek gövdesini okurken yanıt yazabilen ``StreamingResponse``.
+
+    Starlette'in varsayılan bağlantı kopması dinleyicisi ``receive()``
+    çağırarak henüz okunmamış gövde parçalarını tüketebilir; burada gövde
+    üretecin kendisi tarafından okunduğu için o dinleyici çalıştırılmaz.
+    """
+
+    def __init__(self, content, **kwargs):
+        kwargs.setdefault("media_type", NDJSON_MEDIA_TYPE)
+        super().__init__(content, **kwargs)
+
+    async def __call__(self, scope, receive, send):
+        await self.stream_response(send)
+        if self.background is not None:
+            await self.background()
+
+
+def encode_record(record: dict) -> bytes:
+    """Tek bir NDJSON satırı"""
+    return (json.dumps(record, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+def summarize(total: int, clickbait_count: int) -> dict:
+    """``/predict/batch`` ile aynı özet alanları"""
+    return {
+        "total": total,
+        "clickbait_count": clickbait_count,
+        "normal_count": total - clickbait_count,
+        "clickbait_ratio": round(clickbait_count / total * 100, 2) if total else 0.0,
+    }
+
+
+async def iter_lines(chunks: AsyncIterator[bytes], max_line_bytes: int) -> AsyncIterator[tuple[int, Optional[bytes]]]:
+    """
+    Bayt parçalarından ``(satır_no, satır)`` üret; boş satırlar atlanır.
+
+    ``max_line_bytes`` sınırını aşan satır için ``None`` döner ve satırın
+    geri kalanı atlanır (tek bir bozuk satır belleği büyütemez).
+    """
+    buffer = b""
+    line_no = 0
+    skipping = False
+    async for chunk in chunks:
+        buffer += chunk
+        lines = buffer.split(b"\n")
+        buffer = lines.pop()
+        for line in lines:
+            line_no += 1
+            if skipping or len(line) > max_line_bytes:
+                skipping = False
+                yield line_no, None
+            elif line.strip():
+                yield line_no, line
+        if len(buffer) > max_line_bytes:
+            buffer = b""
+            skipping = True
+    if skipping:
+        yield line_no + 1, None
+    elif buffer.strip():
+        yield line_no + 1, buffer
+
+
+def parse_record(line: bytes, field: str) -> tuple[str, Optional[object]]:
+    """
+    Bir satırdan ``(başlık, id)`` çıkar.
+
+    ``{`` veya ``"`` ile başlayan satır JSON olarak çözülmeye çalışılır:
+    nesne ise ``field`` ve isteğe bağlı ``id`` alanı, metin ise kendisi
+    kullanılır. Çözülemeyen veya başka türde bir değer veren satırlar
+    (örn. ``"Şok" açıklama...``) düz metin başlıktır.
+    """
+    text = line.decode("utf-8").strip()
+    if text[:1] not in ('{', '"'):
+        return text, None
+    try:
+        value = json.loads(text)
+    except json.JSONDecodeError:
+        return text, None
+    if isinstance(value, str):
+        return value.strip(), None
+    if not isinstance(value, dict):
+        return text, None
+    record = value.get(field)
+    if not isinstance(record, str) or not record.strip():
+        raise ValueError(f"'{field}' alanı boş veya metin değil")
+    return record, value.get("id")
+
+
+def read_line(line: Optional[bytes], field: str, max_text_length: int) -> tuple[str, Optional[object]]:
+    """``iter_lines`` satırını doğrula; hatalı satırda ``ValueError``"""
+    if line is None:
+        raise ValueError("satır çok uzun")
+    text, record_id = parse_record(line, field)
+    if not text:
+        raise ValueError("boş başlık")
+    if len(text) > max_text_length:
+        raise ValueError(f"başlık {max_text_length} karakterden uzun")
+    return text, record_id
+
+
+def result_record(result: dict, line_no: int, text: str, record_id: Optional[object]) -> dict:
+    """Tahmin sonucuna satır numarası, başlık ve (varsa) kayıt id'si ekle"""
+    record = dict(result, line=line_no, text=text)
+    if record_id is not None:
+        record["id"] = record_id
+    return record
+
+
+async def ndjson_stream(
+    lines: AsyncIterator[tuple[int, Optional[bytes]]],
+    score_chunk: Callable[[list[str]], Awaitable[list[dict]]],
+    chunk_size: int,
+    field: str = "text",
+    max_text_length: int = 500,
+) -> AsyncIterator[bytes]:
+    """
+    Satırları parça parça skorla; her sonucu ve en sonda özeti NDJSON olarak üret.
+
+    Hatalı satırların kayıtları da parçalarıyla birlikte tutulur; çıktı
+    girdi satır sırasındadır.
+    """
+    pending: list[tuple[int, Optional[str], Optional[object], Optional[str]]] = []
+    total = clickbait_count = errors = 0
+
+    async def flush():
+        nonlocal total, clickbait_count, errors
+        texts = [text for _, text, _, error in pending if error is None]
+        results = iter(await score_chunk(texts) if texts else ())
+        output = []
+        for line_no, text, record_id, error in pending:
+            if error is not None:
+                errors += 1
+                output.append(encode_record({"line": line_no, "error": error}))
+                continue
+            result = result_record(next(results), line_no, text, record_id)
+            total += 1
+            clickbait_count += bool(result["is_clickbait"])
+            output.append(encode_record(result))
+        pending.clear()
+        return b"".join(output)
+
+    async for line_no, line in lines:
+        try:
+            text, record_id = read_line(line, field, max_text_length)
+            pending.append((line_no, text, record_id, None))
+        except (ValueError, UnicodeDecodeError) as e:
+            pending.append((line_no, None, None, str(e)))
+        if len(pending) >= chunk_size:
+            yield await flush()
+
+    if pending:
+        yield await flush()
+    yield encode_record({"summary": dict(summarize(total, clickbait_count), errors=errors)})
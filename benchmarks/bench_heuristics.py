@@ -0,0 +1,70 @@
+"""
+🛡️ Clickbait Avcısı - Sezgisel Kural Benchmark'ı
+================================================
+Eski döngü + ``re.search`` uygulamasını birleşik, önceden derlenmiş
+``SafePatternEngine`` ile clickbait_data.csv başlıkları üzerinde karşılaştırır.
+
+Çalıştırmak için: python benchmarks/bench_heuristics.py --repeat 3
+"""
+
+import argparse
+import csv
+import re
+import sys
+import time
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+DATA_PATH = BASE_DIR / "model_training" / "clickbait_data.csv"
+
+sys.path.insert(0, str(BASE_DIR))
+from clickbait_core.heuristics import SafePatternEngine
+
+LEGACY_PATTERNS = [
+    r"(?i).*\b(dollar|euro|gold|currency|exchange rate)\b.*\?",
+    r"(?i).*\b(match|score|won|lost|game)\b.*\?",
+    r"(?i).*\b(school|holiday|vacation|class)\b.*\?",
+    r"(?i).*\b(weather|snow|rain|temperature|forecast)\b.*",
+    r"(?i).*\b(announced|statement|reported|said)\b.*",
+]
+
+
+def legacy_is_safe(text):
+    for pattern in LEGACY_PATTERNS:
+        if re.search(pattern, text):
+            return True
+    return False
+
+
+def best_of(fn, repeat):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = fn()
+        timings.append(time.perf_counter() - started)
+    return min(timings), result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Güvenli kalıp motoru micro-benchmark'ı")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    with open(DATA_PATH, encoding="utf-8", newline="") as f:
+        texts = [row["headline"] for row in csv.DictReader(f)]
+    engine = SafePatternEngine.default()
+
+    legacy_time, legacy = best_of(lambda: [legacy_is_safe(t) for t in texts], args.repeat)
+    engine_time, matches = best_of(lambda: engine.match_batch(texts), args.repeat)
+
+    mismatches = sum(1 for old, new in zip(legacy, matches) if old != (new is not None))
+    print(f"Headlines     : {len(texts):,}")
+    print(f"Legacy loop   : {legacy_time * 1000:8.1f} ms ({len(texts) / legacy_time:,.0f} texts/sec)")
+    print(f"Rule engine   : {engine_time * 1000:8.1f} ms ({len(texts) / engine_time:,.0f} texts/sec)")
+    print(f"Speedup       : {legacy_time / engine_time:.1f}x")
+    print(f"Mismatches    : {mismatches}")
+    print(f"Matched rules : {sum(m is not None for m in matches):,}")
+
+
+if __name__ == "__main__":
+    main()
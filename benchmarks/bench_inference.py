@@ -0,0 +1,279 @@
+"""
+📏 Clickbait Avcısı - Çıkarım Benchmark Paketi
+==============================================
+clickbait_data.csv'den sabit tohumla seçilen başlıklar üzerinde, farklı
+batch boyutlarında throughput ve p50/p95/p99 gecikmesini ölçer:
+
+- ``tokenize@B``    : yalnızca temizlenmiş metin → indeks matrisi
+- ``heuristics@B``  : güvenli kalıp kuralları + yanıt oluşturma
+- ``inference@B``   : temizleme + tokenizasyon + model (tekil ve batch)
+- ``http_predict@1``: ``POST /predict`` (mikro batch dahil)
+- ``http_batch@B``  : ``POST /predict/batch`` (B <= 50)
+
+HTTP ölçümleri FastAPI ``TestClient`` ile süreç içinde yapılır. Çeviri
+aşaması metni aynen döndüren bir stub ile değiştirilir, önbellekler her
+istekten önce boşaltılır; böylece ağ ve önbellek isabetleri sonucu
+etkilemez.
+
+Eşik dosyası (``--thresholds``) örneği::
+
+    {
+      "max_regression": 0.2,
+      "benchmarks": {
+        "inference@32": {"max_p95_ms": 25, "min_throughput": 4000},
+        "http_predict@1": {"max_p99_ms": 60}
+      }
+    }
+
+``max_regression`` yalnızca ``--baseline`` ile verilen önceki bir sonuç
+dosyasına göre uygulanır (p95 gecikme en fazla %20 artabilir, throughput
+en fazla %20 düşebilir). İhlal varsa çıkış kodu 1'dir.
+
+Çalıştırmak için:
+    python benchmarks/bench_inference.py --engine numpy --output bench.json
+    python benchmarks/bench_inference.py --baseline bench.json --thresholds thresholds.json
+"""
+
+import argparse
+import csv
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+MODEL_DIR = BASE_DIR / "model_training"
+DATA_PATH = MODEL_DIR / "clickbait_data.csv"
+BACKEND_DIR = BASE_DIR / "backend_api"
+
+DEFAULT_BATCH_SIZES = (1, 8, 32, 128)
+HTTP_MAX_BATCH = 50  # BatchPredictRequest sınırı
+SUITES = ("tokenize", "heuristics", "inference", "http")
+
+sys.path.insert(0, str(BASE_DIR))
+from clickbait_core.pipeline import build_results, load_artifacts, score_texts
+from clickbait_core.preprocessing import clean_texts
+
+
+def load_headlines(seed, limit=None):
+    """CSV'deki başlıkları tohumla karıştırılmış sırayla döndür"""
+    with open(DATA_PATH, encoding="utf-8", newline="") as f:
+        headlines = [row["headline"] for row in csv.DictReader(f)]
+    random.Random(seed).shuffle(headlines)
+    return headlines[:limit] if limit else headlines
+
+
+def batches(headlines, batch_size, count):
+    """Başlık listesi üzerinde dönerek ``count`` adet batch üret"""
+    position = 0
+    for _ in range(count):
+        if position + batch_size > len(headlines):
+            position = 0
+        yield headlines[position:position + batch_size]
+        position += batch_size
+
+
+def percentile(sorted_values, p):
+    index = min(len(sorted_values) - 1, max(0, int(round(p * (len(sorted_values) - 1)))))
+    return sorted_values[index]
+
+
+def measure(fn, inputs, warmup, setup=None):
+    """Her girdi için ``fn`` süresini ölç; ilk ``warmup`` çağrı sayılmaz"""
+    latencies = []
+    items = 0
+    for i, batch in enumerate(inputs):
+        if setup is not None:
+            setup()
+        started = time.perf_counter()
+        fn(batch)
+        elapsed = time.perf_counter() - started
+        if i >= warmup:
+            latencies.append(elapsed)
+            items += len(batch)
+    latencies.sort()
+    total = sum(latencies)
+    return {
+        "iterations": len(latencies),
+        "items": items,
+        "p50_ms": round(percentile(latencies, 0.50) * 1000, 4),
+        "p95_ms": round(percentile(latencies, 0.95) * 1000, 4),
+        "p99_ms": round(percentile(latencies, 0.99) * 1000, 4),
+        "mean_ms": round(statistics.fmean(latencies) * 1000, 4),
+        "throughput": round(items / total, 1) if total else None,
+    }
+
+
+def run_core(args, headlines, results):
+    """Tokenizasyon, sezgisel kurallar ve model çıkarımı"""
+    model, tokenizer, config = load_artifacts(MODEL_DIR, args.engine)
+    max_length = config['max_length']
+
+    for batch_size in args.batch_sizes:
+        inputs = list(batches(headlines, batch_size, args.iterations + args.warmup))
+        cleaned = [clean_texts(batch) for batch in inputs]
+        if "tokenize" in args.suites:
+            results[f"tokenize@{batch_size}"] = measure(
+                lambda batch: tokenizer.encode_batch(batch, max_length), cleaned, args.warmup)
+        if "heuristics" in args.suites:
+            scores = [0.9] * batch_size
+            results[f"heuristics@{batch_size}"] = measure(
+                lambda batch: build_results(batch, batch, scores), inputs, args.warmup)
+        if "inference" in args.suites:
+            results[f"inference@{batch_size}"] = measure(
+                lambda batch: score_texts(model, tokenizer, config, clean_texts(batch)), inputs, args.warmup)
+
+
+def run_http(args, headlines, results):
+    """FastAPI uygulamasına süreç içi HTTP istekleri (stub çevirmenle)"""
+    os.environ["CLICKBAIT_ENGINE"] = args.engine
+    os.environ["CLICKBAIT_TRANSLATION_CACHE_DB"] = ""
+    os.environ["CLICKBAIT_MODEL_WATCH_INTERVAL"] = "0"
+    os.environ["CLICKBAIT_JOB_WORKERS"] = "0"
+    sys.path.insert(0, str(BACKEND_DIR))
+    from fastapi.testclient import TestClient
+    from clickbait_core.translators import FunctionTranslator, TranslationStage
+    import main as backend
+
+    stub = TranslationStage([FunctionTranslator(lambda text: text, name="stub")])
+    backend.translation_stage = backend.translation_cache.stage = stub
+
+    def clear_caches():
+        backend.result_cache.cache.clear()
+        backend.translation_cache.memory.clear()
+
+    with TestClient(backend.app) as client:
+        deadline = time.monotonic() + args.load_timeout
+        while client.get("/health").json()["status"] == "loading":
+            if time.monotonic() > deadline:
+                raise TimeoutError("Model yüklenemedi (süre aşıldı)")
+            time.sleep(0.05)
+        if client.get("/health").json()["status"] != "healthy":
+            raise RuntimeError("Backend modeli yükleyemedi")
+
+        def post(path, payload):
+            response = client.post(path, json=payload)
+            response.raise_for_status()
+
+        inputs = list(batches(headlines, 1, args.iterations + args.warmup))
+        results["http_predict@1"] = measure(
+            lambda batch: post("/predict", {"text": batch[0]}), inputs, args.warmup, clear_caches)
+        for batch_size in args.batch_sizes:
+            if batch_size > HTTP_MAX_BATCH:
+                continue
+            inputs = list(batches(headlines, batch_size, args.iterations + args.warmup))
+            results[f"http_batch@{batch_size}"] = measure(
+                lambda batch: post("/predict/batch", {"texts": batch}), inputs, args.warmup, clear_caches)
+
+
+def check_thresholds(results, thresholds, baseline=None, max_regression=None):
+    """Eşik ve baseline ihlallerini açıklayan mesajlar döndür"""
+    violations = []
+    for name, limits in thresholds.get("benchmarks", {}).items():
+        result = results.get(name)
+        if result is None:
+            continue
+        for key, limit in limits.items():
+            kind, metric = key.split("_", 1)
+            value = result.get(metric)
+            if value is None:
+                continue
+            if kind == "max" and value > limit or kind == "min" and value < limit:
+                violations.append(f"{name}: {metric} = {value} ({key} {limit})")
+
+    if baseline and max_regression is not None:
+        for name, result in results.items():
+            previous = baseline.get(name)
+            if previous is None:
+                continue
+            if result["p95_ms"] > previous["p95_ms"] * (1 + max_regression):
+                violations.append(f"{name}: p95 {previous['p95_ms']} -> {result['p95_ms']} ms "
+                                  f"(> %{max_regression * 100:.0f} yavaşlama)")
+            if previous.get("throughput") and result["throughput"] < previous["throughput"] * (1 - max_regression):
+                violations.append(f"{name}: throughput {previous['throughput']} -> {result['throughput']}/s "
+                                  f"(> %{max_regression * 100:.0f} düşüş)")
+    return violations
+
+
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=BASE_DIR,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Çıkarım throughput/gecikme benchmark paketi")
+    parser.add_argument("--engine", default=os.getenv("CLICKBAIT_ENGINE", "keras"))
+    parser.add_argument("--batch-sizes", default=",".join(map(str, DEFAULT_BATCH_SIZES)),
+                        help="virgülle ayrılmış batch boyutları")
+    parser.add_argument("--suites", default=",".join(SUITES), help=f"çalıştırılacak ölçümler ({', '.join(SUITES)})")
+    parser.add_argument("--iterations", type=int, default=200, help="batch boyutu başına ölçülen çağrı")
+    parser.add_argument("--warmup", type=int, default=10, help="ölçüme katılmayan ilk çağrılar")
+    parser.add_argument("--seed", type=int, default=42, help="başlık seçimi için tohum")
+    parser.add_argument("--load-timeout", type=float, default=120.0, help="HTTP: model yükleme süresi sınırı (sn)")
+    parser.add_argument("--output", help="sonuçların yazılacağı JSON dosyası")
+    parser.add_argument("--thresholds", help="eşik JSON dosyası")
+    parser.add_argument("--baseline", help="karşılaştırılacak önceki sonuç JSON dosyası")
+    parser.add_argument("--max-regression", type=float, default=None,
+                        help="baseline'a göre izin verilen oran (örn. 0.2); eşik dosyasındakini geçersiz kılar")
+    args = parser.parse_args()
+    args.batch_sizes = [int(size) for size in args.batch_sizes.split(",") if size.strip()]
+    args.suites = [suite.strip() for suite in args.suites.split(",") if suite.strip()]
+    unknown = set(args.suites) - set(SUITES)
+    if unknown:
+        parser.error(f"bilinmeyen ölçüm: {', '.join(sorted(unknown))}")
+
+    headlines = load_headlines(args.seed)
+    results = {}
+    if set(args.suites) & {"tokenize", "heuristics", "inference"}:
+        run_core(args, headlines, results)
+    if "http" in args.suites:
+        run_http(args, headlines, results)
+
+    report = {
+        "meta": {
+            "engine": args.engine,
+            "seed": args.seed,
+            "iterations": args.iterations,
+            "warmup": args.warmup,
+            "batch_sizes": args.batch_sizes,
+            "commit": git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        },
+        "results": results,
+    }
+
+    thresholds = json.loads(Path(args.thresholds).read_text()) if args.thresholds else {}
+    baseline = json.loads(Path(args.baseline).read_text())["results"] if args.baseline else None
+    max_regression = args.max_regression if args.max_regression is not None else thresholds.get("max_regression")
+    report["violations"] = check_thresholds(results, thresholds, baseline, max_regression)
+
+    print(f"{'Benchmark':<18} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'items/sec':>12}")
+    for name, result in results.items():
+        print(f"{name:<18} {result['p50_ms']:>9.3f} {result['p95_ms']:>9.3f} {result['p99_ms']:>9.3f} "
+              f"{result['throughput'] or 0:>12,.0f}")
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, indent=2))
+        print(f"Sonuçlar: {args.output}")
+
+    if report["violations"]:
+        print("\n❌ Eşik ihlalleri:")
+        for violation in report["violations"]:
+            print(f"   - {violation}")
+        sys.exit(1)
+    if thresholds or baseline:
+        print("\n✅ Tüm eşikler karşılandı")
+
+
+if __name__ == "__main__":
+    main()
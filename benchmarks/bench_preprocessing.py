@@ -0,0 +1,67 @@
+"""
+🧹 Clickbait Avcısı - Ön İşleme Benchmark'ı
+===========================================
+Eski iki ``re.sub`` çağrılı ``clean_text`` ile paylaşılan
+``clickbait_core.preprocessing`` uygulamasını clickbait_data.csv
+üzerinde karşılaştırır.
+
+Çalıştırmak için: python benchmarks/bench_preprocessing.py --repeat 5
+"""
+
+import argparse
+import re
+import sys
+import time
+from pathlib import Path
+
+import pandas as pd
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+DATA_PATH = BASE_DIR / "model_training" / "clickbait_data.csv"
+
+sys.path.insert(0, str(BASE_DIR))
+from clickbait_core.preprocessing import clean_texts
+
+
+def legacy_clean_text(text):
+    if not isinstance(text, str):
+        return ""
+    text = text.lower()
+    text = re.sub(r'[^\w\sğüşıöçĞÜŞİÖÇ]', '', text)
+    text = re.sub(r'\s+', ' ', text).strip()
+    return text
+
+
+def best_of(fn, repeat):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = fn()
+        timings.append(time.perf_counter() - started)
+    return min(timings), result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="clean_text throughput benchmark'ı")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    headlines = pd.read_csv(DATA_PATH)["headline"]
+    texts = headlines.tolist()
+
+    legacy_time, legacy = best_of(lambda: headlines.apply(legacy_clean_text), args.repeat)
+    series_time, series = best_of(lambda: clean_texts(headlines), args.repeat)
+    list_time, cleaned = best_of(lambda: clean_texts(texts), args.repeat)
+
+    assert series.tolist() == legacy.tolist() == cleaned, "Temizleme çıktısı eski sürümle aynı değil"
+
+    print(f"Headlines            : {len(texts):,}")
+    for name, elapsed in (("Legacy Series.apply", legacy_time),
+                          ("clean_texts(Series)", series_time),
+                          ("clean_texts(list)", list_time)):
+        print(f"{name:<21}: {elapsed * 1000:7.1f} ms ({len(texts) / elapsed:,.0f} texts/sec)")
+    print(f"Speedup (list)       : {legacy_time / list_time:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""
+🚀 Clickbait Avcısı - Soğuk Başlangıç Benchmark'ı
+=================================================
+Backend'in import süresini ve uvicorn başlatıldıktan sonra
+/health'in ilk yanıtına ve modelin hazır olmasına kadar geçen süreyi ölçer.
+
+Çalıştırmak için: python benchmarks/bench_startup.py --runs 3 --output startup.json
+"""
+
+import argparse
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import urllib.request
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+BACKEND_DIR = BASE_DIR / "backend_api"
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def measure_import(env: dict) -> float:
+    """``import main`` süresini ayrı bir süreçte ölç (sn)"""
+    code = "import time; t = time.perf_counter(); import main; print(time.perf_counter() - t)"
+    output = subprocess.run(
+        [sys.executable, "-c", code], cwd=BACKEND_DIR, env=env,
+        capture_output=True, text=True, check=True,
+    ).stdout
+    return float(output.strip().splitlines()[-1])
+
+
+def measure_server(env: dict, timeout: float) -> dict:
+    """uvicorn'u başlat; ilk /health yanıtı ve 'healthy' anını ölç"""
+    port = _free_port()
+    url = f"http://127.0.0.1:{port}/health"
+    started = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app", "--port", str(port), "--log-level", "warning"],
+        cwd=BACKEND_DIR, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    first_response = ready = None
+    status = None
+    try:
+        while time.perf_counter() - started < timeout:
+            try:
+                with urllib.request.urlopen(url, timeout=1) as response:
+                    status = json.load(response)["status"]
+            except OSError:
+                time.sleep(0.02)
+                continue
+            now = time.perf_counter() - started
+            if first_response is None:
+                first_response = now
+            if status != "loading":
+                ready = now
+                break
+            time.sleep(0.02)
+    finally:
+        process.terminate()
+        process.wait()
+    return {"first_health_s": first_response, "ready_s": ready, "final_status": status}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Backend soğuk başlangıç benchmark'ı")
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--engine", default=os.getenv("CLICKBAIT_ENGINE", "keras"))
+    parser.add_argument("--timeout", type=float, default=120.0)
+    parser.add_argument("--output", help="sonuçların yazılacağı JSON dosyası")
+    args = parser.parse_args()
+
+    env = dict(os.environ, CLICKBAIT_ENGINE=args.engine)
+    imports = [measure_import(env) for _ in range(args.runs)]
+    servers = [measure_server(env, args.timeout) for _ in range(args.runs)]
+
+    def median(key):
+        values = [run[key] for run in servers if run[key] is not None]
+        return statistics.median(values) if values else None
+
+    report = {
+        "engine": args.engine,
+        "runs": args.runs,
+        "import_s": statistics.median(imports),
+        "first_health_s": median("first_health_s"),
+        "ready_s": median("ready_s"),
+        "final_status": servers[-1]["final_status"],
+    }
+    print(json.dumps(report, indent=2))
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
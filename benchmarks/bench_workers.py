@@ -0,0 +1,110 @@
+"""
+🧠 Clickbait Avcısı - Çok Süreçli Bellek Benchmark'ı
+===================================================
+N worker sürecini aynı anda ayağa kaldırır; her biri seçilen motorla
+artefaktları yükler, örnek başlıkları skorlar ve bellek kullanımını
+(RSS ve paylaşılan sayfaları bölüştüren PSS) raporlar.
+
+Çalıştırmak için: python benchmarks/bench_workers.py --workers 4 --engines keras numpy mmap
+"""
+
+import argparse
+import csv
+import json
+import multiprocessing as mp
+import sys
+import time
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+MODEL_DIR = BASE_DIR / "model_training"
+DATA_PATH = MODEL_DIR / "clickbait_data.csv"
+
+
+def read_memory_kb() -> dict:
+    """Linux'ta /proc/self/smaps_rollup'tan RSS ve PSS (kB)"""
+    memory = {}
+    try:
+        with open("/proc/self/smaps_rollup") as f:
+            for line in f:
+                key, _, value = line.partition(":")
+                if key in ("Rss", "Pss"):
+                    memory[key.lower() + "_kb"] = int(value.split()[0])
+    except OSError:
+        import resource
+        memory["rss_kb"] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return memory
+
+
+def worker(engine, texts, batch_size, barrier, results):
+    sys.path.insert(0, str(BASE_DIR))
+    from clickbait_core.pipeline import load_artifacts, score_texts
+    from clickbait_core.preprocessing import clean_texts
+
+    model, tokenizer, config = load_artifacts(MODEL_DIR, engine)
+    cleaned = clean_texts(texts)
+
+    started = time.perf_counter()
+    for start in range(0, len(cleaned), batch_size):
+        score_texts(model, tokenizer, config, cleaned[start:start + batch_size])
+    elapsed = time.perf_counter() - started
+
+    # Tüm worker'lar canlıyken ölç ki paylaşılan sayfalar PSS'e yansısın
+    barrier.wait()
+    results.put(dict(read_memory_kb(), rows_per_sec=len(cleaned) / elapsed))
+    barrier.wait()
+
+
+def run(engine, workers, texts, batch_size) -> dict:
+    ctx = mp.get_context("spawn")
+    barrier = ctx.Barrier(workers)
+    results = ctx.Queue()
+    processes = [
+        ctx.Process(target=worker, args=(engine, texts, batch_size, barrier, results))
+        for _ in range(workers)
+    ]
+    for process in processes:
+        process.start()
+    reports = [results.get() for _ in processes]
+    for process in processes:
+        process.join()
+
+    def total(key):
+        values = [report[key] for report in reports if key in report]
+        return sum(values) if values else None
+
+    return {
+        "engine": engine,
+        "workers": workers,
+        "total_rss_mb": round(total("rss_kb") / 1024, 1),
+        "total_pss_mb": round(total("pss_kb") / 1024, 1) if total("pss_kb") else None,
+        "rows_per_sec": round(total("rows_per_sec")),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Worker başına bellek ve throughput karşılaştırması")
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--engines", nargs="+", default=["keras", "numpy", "mmap"])
+    parser.add_argument("--rows", type=int, default=8192)
+    parser.add_argument("--batch-size", type=int, default=256)
+    parser.add_argument("--output", help="sonuçların yazılacağı JSON dosyası")
+    args = parser.parse_args()
+
+    with open(DATA_PATH, encoding="utf-8", newline="") as f:
+        texts = [row["headline"] for _, row in zip(range(args.rows), csv.DictReader(f))]
+
+    report = []
+    for engine in args.engines:
+        for workers in sorted({1, args.workers}):
+            result = run(engine, workers, texts, args.batch_size)
+            report.append(result)
+            print(f"{engine:<6} x{workers}: RSS {result['total_rss_mb']:>8} MB | "
+                  f"PSS {result['total_pss_mb']} MB | {result['rows_per_sec']:,} rows/sec")
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,202 @@
+/**
+ * Clickbait Avcısı - Sayfa Tarama
+ * ===============================
+ * Aktif sekmedeki tüm başlık adaylarını toplar, tekilleştirir ve
+ * önbellekte olmayanları tek bir gzip sıkıştırılmış istekle
+ * /predict/page uç noktasına gönderir. Sonuçlar sayfadaki başlıkların
+ * yanına işaretlenir ve chrome.storage.local'da önbelleğe alınır.
+ */
+
+// Tek istekte gönderilecek en fazla başlık (backend CLICKBAIT_PAGE_MAX_ITEMS)
+const PAGE_SCAN_MAX_ITEMS = 500;
+
+// Yerel skor önbelleği ayarları
+const SCORE_CACHE_KEY = 'scoreCache';
+const SCORE_CACHE_MAX_ENTRIES = 5000;
+const SCORE_CACHE_TTL_MS = 7 * 24 * 60 * 60 * 1000;
+
+/**
+ * Sayfadaki başlık adaylarını topla (sekmede çalışır, kendi içinde bağımsız olmalı)
+ */
+function collectHeadlines() {
+    const SELECTOR = 'h1, h2, h3, h4, [class*="headline"], [class*="title"], article a';
+    const MIN_LENGTH = 15;
+    const MAX_LENGTH = 300;
+    const seen = new Set();
+    const headlines = [];
+
+    for (const element of document.querySelectorAll(SELECTOR)) {
+        if (element.closest('nav, footer, script, style, [aria-hidden="true"]')) {
+            continue;
+        }
+        const text = (element.innerText || '').replace(/\s+/g, ' ').trim();
+        if (text.length < MIN_LENGTH || text.length > MAX_LENGTH || text.split(' ').length < 3) {
+            continue;
+        }
+        if (!seen.has(text)) {
+            seen.add(text);
+            headlines.push(text);
+        }
+    }
+    return headlines;
+}
+
+/**
+ * Skorlanan başlıkları sayfada işaretle (sekmede çalışır)
+ */
+function annotateHeadlines(scores) {
+    const SELECTOR = 'h1, h2, h3, h4, [class*="headline"], [class*="title"], article a';
+    const BADGE_CLASS = 'clickbait-avcisi-badge';
+
+    document.querySelectorAll(`.${BADGE_CLASS}`).forEach((badge) => badge.remove());
+
+    let marked = 0;
+    for (const element of document.querySelectorAll(SELECTOR)) {
+        const text = (element.innerText || '').replace(/\s+/g, ' ').trim();
+        const result = scores[text];
+        // İç içe eşleşen elemanlarda (örn. h2 > a) yalnızca en dıştaki işaretlenir
+        if (!result || element.parentElement?.closest('[data-clickbait-score]')?.dataset.clickbaitText === text) {
+            continue;
+        }
+        element.dataset.clickbaitScore = result.s;
+        element.dataset.clickbaitText = text;
+
+        const badge = document.createElement('span');
+        badge.className = BADGE_CLASS;
+        badge.textContent = result.c ? `🚨 ${Math.round(result.s * 100)}%` : '✅';
+        badge.title = `Clickbait Avcısı: ${(result.s * 100).toFixed(1)}%`;
+        badge.style.cssText = [
+            'display:inline-block', 'margin-left:6px', 'padding:1px 6px', 'border-radius:8px',
+            'font:600 11px/1.6 sans-serif', 'vertical-align:middle', 'color:#fff',
+            `background:${result.c ? '#e74c3c' : '#27ae60'}`,
+        ].join(';');
+        // Eleman içine değil yanına eklenir; innerText ve sonraki taramalar etkilenmez
+        element.insertAdjacentElement('afterend', badge);
+        if (result.c) {
+            element.style.outline = '2px solid #e74c3c';
+            element.style.outlineOffset = '2px';
+        }
+        marked++;
+    }
+    return marked;
+}
+
+/**
+ * Yerel önbelleği oku: { version: model sürümü, entries: { başlık: { s, c, d, t } } }
+ */
+async function loadScoreCache() {
+    const stored = await chrome.storage.local.get(SCORE_CACHE_KEY);
+    return stored[SCORE_CACHE_KEY] || { version: null, entries: {} };
+}
+
+/**
+ * Önbelleği en yeni SCORE_CACHE_MAX_ENTRIES kayıtla sınırlayıp kaydet.
+ * Çevrilemeden skorlanan (d) başlıklar saklanmaz; bir sonraki taramada yeniden sorulur.
+ */
+async function saveScoreCache(cache) {
+    const now = Date.now();
+    const entries = Object.entries(cache.entries)
+        .filter(([, entry]) => !entry.d && now - entry.t < SCORE_CACHE_TTL_MS)
+        .sort((a, b) => b[1].t - a[1].t)
+        .slice(0, SCORE_CACHE_MAX_ENTRIES);
+    cache.entries = Object.fromEntries(entries);
+    await chrome.storage.local.set({ [SCORE_CACHE_KEY]: cache });
+}
+
+/**
+ * JSON gövdesini gzip ile sıkıştır (CompressionStream yoksa düz gönder)
+ */
+async function compressJson(payload) {
+    const json = JSON.stringify(payload);
+    if (typeof CompressionStream === 'undefined') {
+        return { body: json, encoding: null };
+    }
+    const stream = new Blob([json]).stream().pipeThrough(new CompressionStream('gzip'));
+    return { body: await new Response(stream).arrayBuffer(), encoding: 'gzip' };
+}
+
+/**
+ * Başlıkları tek istekte skorla; { version, scores: { başlık: { s, c, d } } } döndür
+ * (d: başlık çevrilemeden skorlandı, önbelleğe alınmaz)
+ */
+async function scoreHeadlines(texts) {
+    const { body, encoding } = await compressJson({ texts });
+    const headers = {
+        'Content-Type': 'application/json',
+        'Accept': 'application/json'
+    };
+    if (encoding) {
+        headers['Content-Encoding'] = encoding;
+    }
+
+    const response = await fetch(`${API_BASE_URL}/predict/page`, { method: 'POST', headers, body });
+    if (!response.ok) {
+        const error = await response.json().catch(() => ({}));
+        throw new Error(typeof error.detail === 'string' ? error.detail : 'API hatası oluştu');
+    }
+
+    const data = await response.json();
+    const scores = {};
+    texts.forEach((text, i) => {
+        scores[text] = { s: data.scores[i], c: data.clickbait[i], d: Boolean(data.degraded?.[i]) };
+    });
+    return { version: data.version, scores };
+}
+
+/**
+ * Aktif sekmeyi tara: topla → önbellek → tek istek → işaretle
+ */
+async function scanActivePage() {
+    const [tab] = await chrome.tabs.query({ active: true, currentWindow: true });
+    const [{ result: headlines }] = await chrome.scripting.executeScript({
+        target: { tabId: tab.id },
+        func: collectHeadlines
+    });
+    if (!headlines || headlines.length === 0) {
+        return { total: 0, clickbait: 0, cached: 0, marked: 0 };
+    }
+
+    const cache = await loadScoreCache();
+    const now = Date.now();
+    const scores = {};
+    const missing = [];
+    for (const text of headlines.slice(0, PAGE_SCAN_MAX_ITEMS)) {
+        const entry = cache.entries[text];
+        if (entry && now - entry.t < SCORE_CACHE_TTL_MS) {
+            scores[text] = entry;
+        } else {
+            missing.push(text);
+        }
+    }
+    const cached = Object.keys(scores).length;
+
+    if (missing.length > 0) {
+        const fresh = await scoreHeadlines(missing);
+        const stale = fresh.version !== cache.version;
+        if (stale) {
+            // Model değişti: eski skorlar geçersiz, sayfadakiler de yeniden skorlanır
+            cache.version = fresh.version;
+            cache.entries = {};
+        }
+        for (const [text, result] of Object.entries(fresh.scores)) {
+            scores[text] = result;
+            cache.entries[text] = { ...result, t: now };
+        }
+        await saveScoreCache(cache);
+        if (stale && cached > 0) {
+            return scanActivePage();
+        }
+    }
+
+    const [{ result: marked }] = await chrome.scripting.executeScript({
+        target: { tabId: tab.id },
+        func: annotateHeadlines,
+        args: [scores]
+    });
+    return {
+        total: Object.keys(scores).length,
+        clickbait: Object.values(scores).filter((result) => result.c).length,
+        cached,
+        marked
+    };
+}
@@ -11,6 +11,8 @@ const API_BASE_URL = 'http://127.0.0.1:8000';
 // DOM elementleri
 const headlineInput = document.getElementById('headline');
 const analyzeBtn = document.getElementById('analyzeBtn');
+const scanBtn = document.getElementById('scanBtn');
+const scanSummary = document.getElementById('scanSummary');
 const loadingDiv = document.getElementById('loading');
 const errorDiv = document.getElementById('error');
 const resultDiv = document.getElementById('result');
@@ -40,11 +42,13 @@ async function checkApiHealth() {
                 statusDot.classList.add('online');
                 statusText.textContent = 'API Bağlı ✓';
                 analyzeBtn.disabled = false;
+                scanBtn.disabled = false;
             } else {
                 statusDot.classList.remove('online');
                 statusDot.classList.add('offline');
                 statusText.textContent = 'Model Yüklenmedi';
                 analyzeBtn.disabled = true;
+                scanBtn.disabled = true;
             }
         } else {
             throw new Error('API yanıt vermedi');
@@ -54,6 +58,7 @@ async function checkApiHealth() {
         statusDot.classList.add('offline');
         statusText.textContent = 'API Bağlantısı Yok';
         analyzeBtn.disabled = true;
+        scanBtn.disabled = true;
         console.error('API Health Check Error:', error);
     }
 }
@@ -116,6 +121,7 @@ function showError(message) {
 function resetUI() {
     errorDiv.classList.remove('show');
     resultDiv.classList.remove('show');
+    scanSummary.classList.remove('show');
     loadingDiv.classList.remove('show');
 }
 
@@ -154,8 +160,37 @@ async function handleAnalyze() {
     }
 }
 
+/**
+ * Sayfa tarama: aktif sekmedeki tüm başlıkları tek istekte skorla ve işaretle
+ */
+async function handleScanPage() {
+    resetUI();
+    loadingDiv.classList.add('show');
+    scanBtn.disabled = true;
+    
+    try {
+        const summary = await scanActivePage();
+        loadingDiv.classList.remove('show');
+        if (summary.total === 0) {
+            showError('Bu sayfada başlık bulunamadı.');
+            return;
+        }
+        scanSummary.textContent = `🔎 ${summary.total} başlık tarandı: ${summary.clickbait} clickbait ` +
+            `(%${(summary.clickbait / summary.total * 100).toFixed(1)}), ` +
+            `${summary.cached} başlık önbellekten, ${summary.marked} başlık sayfada işaretlendi.`;
+        scanSummary.classList.add('show');
+    } catch (error) {
+        loadingDiv.classList.remove('show');
+        showError(error.message || 'Sayfa taranamadı. API çalışıyor mu?');
+        console.error('Scan Error:', error);
+    } finally {
+        scanBtn.disabled = false;
+    }
+}
+
 // Event Listeners
 analyzeBtn.addEventListener('click', handleAnalyze);
+scanBtn.addEventListener('click', handleScanPage);
 
 // Enter tuşuna basınca da analiz yap
 headlineInput.addEventListener('keypress', (e) => {
@@ -0,0 +1,6 @@
+"""
+🧩 Clickbait Avcısı - Paylaşılan Çekirdek
+=========================================
+Backend API, Streamlit dashboard ve yardımcı scriptlerin ortak kullandığı
+yardımcı modüller.
+"""
@@ -0,0 +1,145 @@
+"""
+#️⃣ Clickbait Avcısı - Hashing Featurizer
+=========================================
+Kelime dağarcığı öğrenmeden metinleri sabit sayıda kovaya (bucket) eşler.
+Keras ``Tokenizer``'ın aksine büyüyen bir ``word_index`` yoktur; bellek
+sabittir ve pickle'lanacak bir durum oluşmaz.
+
+Modlar (hepsi 32 bit FNV-1a):
+- ``char``: başına/sonuna boşluk eklenmiş metnin ``min_n``..``max_n``
+  karakterlik n-gram'ları. Türkçe ekler ve ``ğüşıöç`` harfleri ayrı bir
+  kelime listesine ihtiyaç duymadan temsil edilir.
+- ``word``: boşlukla ayrılmış kelimeler.
+- ``bigram``: kelimeler ve ardışık kelime çiftleri (``"w1 w2"``), sırayla
+  ``w1, w2, w1 w2, w3, w2 w3, ...``.
+
+Hashleme tüm batch üzerinde NumPy ile vektörize yapılır; çıktı
+``VocabTokenizer.encode_batch`` ile aynı biçimdedir (``(n, max_length)``
+int32, 0 = padding), bu yüzden aynı Embedding tabanlı modele beslenir.
+"""
+
+from typing import Iterable, Optional
+
+import numpy as np
+
+FNV_OFFSET = np.uint32(2166136261)
+FNV_PRIME = np.uint32(16777619)
+
+MODES = ("char", "word", "bigram")
+
+
+class HashingFeaturizer:
+    """Eğitim gerektirmeyen, sabit bellekli featurizer"""
+
+    def __init__(self, num_buckets: int = 2 ** 16, mode: str = "char", min_n: int = 3, max_n: int = 5):
+        if mode not in MODES:
+            raise ValueError(f"Bilinmeyen hashing modu: {mode} (seçenekler: {', '.join(MODES)})")
+        if not 1 <= min_n <= max_n:
+            raise ValueError("1 <= min_n <= max_n olmalı")
+        # Kova 0 padding için ayrılmış; hash'ler 1..num_buckets-1 aralığına düşer
+        self.num_buckets = num_buckets
+        self.mode = mode
+        self.min_n = min_n
+        self.max_n = max_n
+
+    @classmethod
+    def from_config(cls, settings: dict) -> "HashingFeaturizer":
+        """``model_config.pickle`` içindeki ``featurizer`` sözlüğünden oluştur"""
+        return cls(
+            num_buckets=settings["num_buckets"],
+            mode=settings.get("mode", "char"),
+            min_n=settings.get("min_n", 3),
+            max_n=settings.get("max_n", 5),
+        )
+
+    def to_config(self) -> dict:
+        return {
+            "type": "hashing",
+            "num_buckets": self.num_buckets,
+            "mode": self.mode,
+            "min_n": self.min_n,
+            "max_n": self.max_n,
+        }
+
+    def _char_ngrams(self, texts: list[str]) -> tuple[np.ndarray, np.ndarray]:
+        """Tüm batch için ``(satır, hash)`` dizileri (metin sırasıyla)"""
+        padded = [f" {text} " for text in texts]
+        lengths = np.fromiter((len(text) for text in padded), dtype=np.int64, count=len(padded))
+        codepoints = np.frombuffer("".join(padded).encode("utf-32-le"), dtype=np.uint32)
+        total = len(codepoints)
+
+        rows = np.repeat(np.arange(len(padded)), lengths)
+        ends = np.repeat(np.cumsum(lengths), lengths)
+        positions = np.arange(total)
+
+        hashes = np.full(total, FNV_OFFSET, dtype=np.uint32)
+        columns, valid = [], []
+        for k in range(self.max_n):
+            index = np.minimum(positions + k, total - 1)
+            hashes = (hashes ^ codepoints[index]) * FNV_PRIME
+            if k + 1 >= self.min_n:
+                columns.append(hashes)
+                valid.append(positions + k < ends)
+
+        # (konum, n) sırası: kırpma her zaman metnin sonundan yapılır
+        hashes = np.stack(columns, axis=1)
+        valid = np.stack(valid, axis=1)
+        return np.broadcast_to(rows[:, None], valid.shape)[valid], hashes[valid]
+
+    def _words(self, texts: list[str]) -> tuple[np.ndarray, np.ndarray]:
+        """Tüm batch için kelime (ve ``bigram`` modunda kelime çifti) hash'leri"""
+        token_lists = [text.split() for text in texts]
+        counts = np.fromiter((len(tokens) for tokens in token_lists), dtype=np.int64, count=len(texts))
+        tokens = [token for tokens in token_lists for token in tokens]
+        rows = np.repeat(np.arange(len(texts)), counts)
+        if not tokens:
+            return rows, np.zeros(0, dtype=np.uint32)
+
+        # Sabit genişlikli UTF-32 matris: her sütun bir karakter konumu
+        array = np.array(tokens)
+        chars = array.view(np.uint32).reshape(len(tokens), -1)
+        lengths = np.char.str_len(array)
+        unigrams = _fnv_columns(np.full(len(tokens), FNV_OFFSET, dtype=np.uint32), chars, lengths)
+        if self.mode == "word":
+            return rows, unigrams
+
+        # "w1 w2" hash'i = w1 hash'inden devam edip boşluk ve w2'yi işlemek
+        starts = np.cumsum(counts) - counts
+        has_previous = np.arange(len(tokens)) != np.repeat(starts, counts)
+        previous = np.roll(unigrams, 1)
+        bigrams = _fnv_columns((previous ^ np.uint32(ord(" "))) * FNV_PRIME, chars, lengths)
+
+        hashes = np.stack([unigrams, bigrams], axis=1)
+        valid = np.stack([np.ones(len(tokens), dtype=bool), has_previous], axis=1)
+        return np.broadcast_to(rows[:, None], valid.shape)[valid], hashes[valid]
+
+    def encode_batch(
+        self, texts: Iterable[str], max_length: int, out: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """Metinleri ``(n, max_length)`` int32 kova matrisine yaz (post-padding)"""
+        texts = texts if isinstance(texts, list) else list(texts)
+        if out is None:
+            out = np.zeros((len(texts), max_length), dtype=np.int32)
+        else:
+            out = out[:len(texts)]
+            out.fill(0)
+        if not texts:
+            return out
+
+        rows, hashes = self._char_ngrams(texts) if self.mode == "char" else self._words(texts)
+        buckets = (hashes % np.uint32(self.num_buckets - 1) + 1).astype(np.int32)
+
+        counts = np.bincount(rows, minlength=len(texts))
+        starts = np.cumsum(counts) - counts
+        ranks = np.arange(len(rows)) - starts[rows]
+        keep = ranks < max_length
+        out[rows[keep], ranks[keep]] = buckets[keep]
+        return out
+
+
+def _fnv_columns(hashes: np.ndarray, chars: np.ndarray, lengths: np.ndarray) -> np.ndarray:
+    """Her satırın ilk ``lengths`` karakterini FNV-1a ile ``hashes``e ekle"""
+    for k in range(chars.shape[1]):
+        step = (hashes ^ chars[:, k]) * FNV_PRIME
+        hashes = np.where(k < lengths, step, hashes)
+    return hashes
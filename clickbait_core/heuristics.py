@@ -0,0 +1,71 @@
+"""
+🛡️ Clickbait Avcısı - Güvenli Kalıp Kural Motoru
+================================================
+Modelin yanlış pozitif verdiği bilinen başlık tiplerini (döviz, spor, okul
+soruları, hava durumu, resmi açıklamalar) yakalayıp skoru düşürür.
+
+Kurallar bir JSON dosyasından okunur ve tek bir birleşik regex'e derlenir;
+her başlık tek geçişte taranır ve hangi kuralın eşleştiği raporlanır.
+
+Dosya biçimi::
+
+    {"max_score": 0.3,
+     "rules": [{"name": "weather", "pattern": "\\\\b(weather|snow)\\\\b"}]}
+"""
+
+import json
+import logging
+import os
+import re
+from pathlib import Path
+from typing import Iterable, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_RULES_PATH = Path(__file__).resolve().parent / "safe_patterns.json"
+RULES_PATH_ENV = "CLICKBAIT_SAFE_PATTERNS"
+
+
+class SafePatternEngine:
+    """Önceden derlenmiş, tek geçişli kural motoru"""
+
+    def __init__(self, rules: list[tuple[str, str]], max_score: float = 0.3, threshold: float = 0.5):
+        if not rules:
+            raise ValueError("En az bir kural gerekli")
+        self.rules = list(rules)
+        self.max_score = max_score
+        self.threshold = threshold
+        # Her kural kendi isimli grubunda; eşleşen grup kuralı belirtir
+        self._group_to_rule = {f"r{i}": name for i, (name, _) in enumerate(self.rules)}
+        self._regex = re.compile(
+            "|".join(f"(?P<r{i}>{pattern})" for i, (_, pattern) in enumerate(self.rules)),
+            re.IGNORECASE,
+        )
+
+    @classmethod
+    def from_file(cls, path: Union[str, Path]) -> "SafePatternEngine":
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        rules = [(rule["name"], rule["pattern"]) for rule in data["rules"]]
+        return cls(rules, max_score=data.get("max_score", 0.3), threshold=data.get("threshold", 0.5))
+
+    @classmethod
+    def default(cls) -> "SafePatternEngine":
+        """``CLICKBAIT_SAFE_PATTERNS`` veya paketle gelen kural dosyası"""
+        return cls.from_file(os.getenv(RULES_PATH_ENV) or DEFAULT_RULES_PATH)
+
+    def match(self, text: str) -> Optional[str]:
+        """Eşleşen ilk (en soldaki) kuralın adını döndür"""
+        found = self._regex.search(text)
+        return self._group_to_rule[found.lastgroup] if found else None
+
+    def match_batch(self, texts: Iterable[str]) -> list[Optional[str]]:
+        search = self._regex.search
+        names = self._group_to_rule
+        return [names[found.lastgroup] if found else None for found in map(search, texts)]
+
+    def adjust(self, score: float, rule: Optional[str]) -> float:
+        """Kural eşleştiyse ve model clickbait diyorsa skoru sınırla"""
+        if rule is not None and score > self.threshold:
+            return min(score, self.max_score)
+        return score
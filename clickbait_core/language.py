@@ -0,0 +1,42 @@
+"""
+🗣️ Clickbait Avcısı - Dil Tespiti
+=================================
+Başlığın Türkçe olup olmadığını ağ çağrısı veya ek bağımlılık olmadan
+tahmin eder. Türkçe başlıklar çeviriye gönderilmeden doğrudan Türkçe
+modele yönlendirilir.
+
+Kural: Türkçeye özgü harfler (``ğ ş ı İ``) kesin işarettir; ``ç ö ü``
+ve sık geçen Türkçe kelimeler birlikte puanlanır.
+"""
+
+from typing import Iterable
+
+_STRONG_CHARS = frozenset("ğĞşŞıİ")
+_WEAK_CHARS = frozenset("çÇöÖüÜ")
+_STOPWORDS = frozenset(
+    "ve bir bu da de ile için mi mı mu mü ne neden nasıl kim hangi çok daha en gibi "
+    "olan oldu olarak ama sonra şimdi bugün yarın işte bakın yeni var yok".split()
+)
+
+
+def turkish_score(text: str) -> float:
+    """0..1 arası Türkçe olma puanı"""
+    if not text:
+        return 0.0
+    chars = set(text)
+    if chars & _STRONG_CHARS:
+        return 1.0
+    words = text.lower().split()
+    if not words:
+        return 0.0
+    stop_ratio = sum(word.strip("?!.,:;'\"") in _STOPWORDS for word in words) / len(words)
+    return min(1.0, stop_ratio * 2 + (0.3 if chars & _WEAK_CHARS else 0.0))
+
+
+def detect_language(text: str, threshold: float = 0.5) -> str:
+    """``"tr"`` veya ``"en"``"""
+    return "tr" if turkish_score(text) >= threshold else "en"
+
+
+def detect_languages(texts: Iterable[str], threshold: float = 0.5) -> list[str]:
+    return [detect_language(text, threshold) for text in texts]
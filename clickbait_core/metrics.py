@@ -0,0 +1,278 @@
+"""
+📈 Clickbait Avcısı - Metrikler
+===============================
+Bağımlılıksız sayaç/histogram kaydı ve Prometheus metin formatı çıktısı.
+
+Çıkarım hattının her aşaması (çeviri, temizleme, tokenizasyon + padding,
+model, sezgisel kurallar) ``timed`` ile ölçülür. Süreler ortak
+``REGISTRY`` içindeki ``clickbait_stage_duration_seconds`` histogramına
+yazılır ve kayıtlı hook'lara iletilir::
+
+    from clickbait_core.metrics import collect_timings
+
+    with collect_timings() as timings:     # Streamlit / CLI: aynı süreleri topla
+        ...
+    print(timings.summary())
+
+Backend ``REGISTRY.render()`` çıktısını ``/metrics`` üzerinden sunar.
+"""
+
+import logging
+import math
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Iterable
+
+logger = logging.getLogger(__name__)
+
+# Saniye; tek başlıktan (~ms altı) çeviri zaman aşımına (~sn) kadar
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+BATCH_SIZE_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128, 256, 512, 1024, 4096)
+
+
+def _format_labels(labels: dict) -> str:
+    if not labels:
+        return ""
+    escaped = {
+        name: str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        for name, value in labels.items()
+    }
+    return "{" + ",".join(f'{name}="{value}"' for name, value in escaped.items()) + "}"
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class _Metric:
+    kind = "untyped"
+
+    def __init__(self, name: str, help: str, labelnames: Iterable[str] = ()):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: dict) -> tuple:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} etiketleri {self.labelnames} olmalı, verilen: {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def render(self) -> list[str]:
+        return [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"] + self._samples()
+
+    def _samples(self) -> list[str]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """Yalnızca artan sayaç"""
+
+    kind = "counter"
+
+    def __init__(self, name: str, help: str, labelnames: Iterable[str] = ()):
+        super().__init__(name, help, labelnames)
+        self._values: dict[tuple, float] = {}
+
+    def inc(self, amount: float = 1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels) -> float:
+        return self._values.get(self._key(labels), 0)
+
+    def _samples(self) -> list[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return [
+            f"{self.name}{_format_labels(dict(zip(self.labelnames, key)))} {_format_value(value)}"
+            for key, value in items
+        ]
+
+
+class Histogram(_Metric):
+    """Sabit kovalı histogram (kümülatif ``_bucket``, ``_sum``, ``_count``)"""
+
+    kind = "histogram"
+
+    def __init__(self, name: str, help: str, labelnames: Iterable[str] = (), buckets: Iterable[float] = DEFAULT_BUCKETS):
+        super().__init__(name, help, labelnames)
+        self.buckets = tuple(sorted(buckets)) + (math.inf,)
+        self._series: dict[tuple, list] = {}  # etiketler -> [kova sayıları..., toplam]
+
+    def observe(self, value: float, **labels):
+        key = self._key(labels)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [0] * len(self.buckets) + [0.0]
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series[i] += 1
+                    break
+            series[-1] += value
+
+    def _samples(self) -> list[str]:
+        with self._lock:
+            items = sorted((key, list(series)) for key, series in self._series.items())
+        lines = []
+        for key, series in items:
+            cumulative = 0
+            for bound, count in zip(self.buckets, series):
+                cumulative += count
+                labels = _format_labels(dict(zip(self.labelnames, key), le=_format_value(bound)))
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _format_labels(dict(zip(self.labelnames, key)))
+            lines.append(f"{self.name}_sum{labels} {_format_value(series[-1])}")
+            lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+
+class MetricsRegistry:
+    """
+    İsimle tekilleştirilen metrikler ve okuma anında çalışan toplayıcılar.
+
+    Toplayıcılar (``add_collector``) başka yerde tutulan sayaçları (örn.
+    önbellek istatistikleri) ``(isim, tür, açıklama, [(etiketler, değer)])``
+    dörtlüleri olarak döndürür.
+    """
+
+    def __init__(self):
+        self._metrics: dict[str, _Metric] = {}
+        self._collectors: list[Callable[[], Iterable[tuple]]] = []
+        self._lock = threading.Lock()
+
+    def _get_or_create(self, cls, name: str, *args, **kwargs):
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = cls(name, *args, **kwargs)
+            elif not isinstance(metric, cls):
+                raise ValueError(f"{name} zaten {metric.kind} olarak kayıtlı")
+            return metric
+
+    def counter(self, name: str, help: str, labelnames: Iterable[str] = ()) -> Counter:
+        return self._get_or_create(Counter, name, help, labelnames)
+
+    def histogram(self, name: str, help: str, labelnames: Iterable[str] = (),
+                  buckets: Iterable[float] = DEFAULT_BUCKETS) -> Histogram:
+        return self._get_or_create(Histogram, name, help, labelnames, buckets)
+
+    def add_collector(self, collector: Callable[[], Iterable[tuple]]):
+        self._collectors.append(collector)
+
+    def render(self) -> str:
+        """Prometheus metin formatı (``text/plain; version=0.0.4``)"""
+        with self._lock:
+            metrics = sorted(self._metrics.values(), key=lambda metric: metric.name)
+        lines = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        for collector in self._collectors:
+            try:
+                families = list(collector())
+            except Exception as e:
+                logger.error(f"Metrik toplayıcı hatası: {e}")
+                continue
+            for name, kind, help, samples in families:
+                lines += [f"# HELP {name} {help}", f"# TYPE {name} {kind}"]
+                lines += [f"{name}{_format_labels(labels)} {_format_value(value)}" for labels, value in samples]
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+
+STAGE_SECONDS = REGISTRY.histogram(
+    "clickbait_stage_duration_seconds", "Çıkarım hattı aşamalarının süresi (çağrı başına)", ("stage",)
+)
+STAGE_ITEMS = REGISTRY.counter(
+    "clickbait_stage_items_total", "Aşamalardan geçen başlık sayısı", ("stage",)
+)
+
+_hooks: list[Callable[[str, float, int], None]] = []
+
+
+def add_hook(hook: Callable[[str, float, int], None]):
+    """Her ölçümde ``hook(aşama, saniye, başlık_sayısı)`` çağrılsın"""
+    _hooks.append(hook)
+
+
+def remove_hook(hook: Callable[[str, float, int], None]):
+    if hook in _hooks:
+        _hooks.remove(hook)
+
+
+def record_stage(stage: str, seconds: float, items: int = 1):
+    """Bir aşama ölçümünü histograma yaz ve hook'lara ilet"""
+    STAGE_SECONDS.observe(seconds, stage=stage)
+    STAGE_ITEMS.inc(items, stage=stage)
+    for hook in list(_hooks):
+        try:
+            hook(stage, seconds, items)
+        except Exception as e:
+            logger.error(f"Metrik hook hatası: {e}")
+
+
+@contextmanager
+def timed(stage: str, items: int = 1):
+    """``with timed("model", len(batch)):`` bloğunun süresini kaydet"""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        record_stage(stage, time.perf_counter() - started, items)
+
+
+class StageTimings:
+    """
+    Aşama sürelerini biriktiren hook (CLI özetleri ve dashboard için).
+
+    ``current_thread_only`` yalnızca oluşturulduğu thread'in ölçümlerini
+    toplar; aynı süreçte çalışan Streamlit oturumları birbirine karışmaz.
+    """
+
+    def __init__(self, current_thread_only: bool = False):
+        self.totals: dict[str, list] = {}  # aşama -> [çağrı, saniye, başlık]
+        self.thread_id = threading.get_ident() if current_thread_only else None
+        self._lock = threading.Lock()
+
+    def __call__(self, stage: str, seconds: float, items: int):
+        if self.thread_id is not None and threading.get_ident() != self.thread_id:
+            return
+        with self._lock:
+            total = self.totals.setdefault(stage, [0, 0.0, 0])
+            total[0] += 1
+            total[1] += seconds
+            total[2] += items
+
+    def summary(self) -> dict:
+        """``{aşama: {"calls", "seconds", "items", "ms_per_item"}}``"""
+        with self._lock:
+            return {
+                stage: {
+                    "calls": calls,
+                    "seconds": round(seconds, 6),
+                    "items": items,
+                    "ms_per_item": round(seconds / items * 1000, 4) if items else None,
+                }
+                for stage, (calls, seconds, items) in self.totals.items()
+            }
+
+    def reset(self):
+        with self._lock:
+            self.totals.clear()
+
+
+@contextmanager
+def collect_timings(current_thread_only: bool = True):
+    """Blok boyunca aşama sürelerini bir ``StageTimings`` içinde topla"""
+    timings = StageTimings(current_thread_only=current_thread_only)
+    add_hook(timings)
+    try:
+        yield timings
+    finally:
+        remove_hook(timings)
@@ -0,0 +1,163 @@
+"""
+🧮 Clickbait Avcısı - NumPy Çıkarım Motoru
+==========================================
+``train.py`` içindeki ``create_model()`` mimarisini
+(Embedding → GlobalAveragePooling1D → Dense... → Dense(1, sigmoid))
+TensorFlow yüklemeden, vektörize NumPy ile çalıştırır.
+
+Ağırlıklar ``export_weights()`` ile sıkıştırılmış bir ``.npz`` dosyasına
+yazılır ve ``NumpyAveragingModel.load()`` ile okunur. ``Embedding(mask_zero=True)``
+ile eğitilmiş modellerde (dinamik padding) ortalama yalnızca padding
+olmayan konumlar üzerinden alınır.
+
+Çok süreçli servis için ``save_mmap()`` her diziyi ayrı bir ``.npy``
+dosyasına yazar; ``load_mmap()`` bunları salt okunur memory-map olarak açar,
+böylece tüm worker'lar aynı fiziksel sayfaları paylaşır.
+"""
+
+import json
+from pathlib import Path
+from typing import Optional, Union
+
+import numpy as np
+
+FORMAT_VERSION = 1
+MMAP_META_FILE = "model_meta.json"
+
+_ACTIVATIONS = {
+    "linear": lambda x: x,
+    "relu": lambda x: np.maximum(x, 0, out=x),
+    "sigmoid": lambda x: 0.5 * (1.0 + np.tanh(0.5 * x)),
+}
+
+
+def uses_mask(model) -> bool:
+    """Model padding'i (id 0) maskeliyor mu? (``NumpyAveragingModel`` veya Keras modeli)"""
+    mask_zero = getattr(model, "mask_zero", None)
+    if mask_zero is not None:
+        return bool(mask_zero)
+    for layer in getattr(model, "layers", ()):
+        if type(layer).__name__ == "Embedding":
+            return bool(layer.get_config().get("mask_zero", False))
+    return False
+
+
+def export_weights(keras_model, path: Union[str, Path]) -> Path:
+    """Keras modelinin ağırlıklarını ``.npz`` olarak kaydet"""
+    arrays = {}
+    activations = []
+    mask_zero = False
+    for layer in keras_model.layers:
+        kind = type(layer).__name__
+        if kind == "Embedding":
+            arrays["embedding"] = layer.get_weights()[0].astype(np.float32)
+            mask_zero = bool(layer.get_config().get("mask_zero", False))
+        elif kind == "Dense":
+            kernel, bias = layer.get_weights()
+            index = len(activations)
+            arrays[f"kernel_{index}"] = kernel.astype(np.float32)
+            arrays[f"bias_{index}"] = bias.astype(np.float32)
+            activations.append(layer.get_config()["activation"])
+        elif kind in ("GlobalAveragePooling1D", "Dropout", "InputLayer"):
+            continue
+        else:
+            raise ValueError(f"Desteklenmeyen katman: {kind}")
+
+    if "embedding" not in arrays or not activations:
+        raise ValueError("Model bir Embedding ve en az bir Dense katmanı içermeli")
+    unknown = set(activations) - set(_ACTIVATIONS)
+    if unknown:
+        raise ValueError(f"Desteklenmeyen aktivasyon: {sorted(unknown)}")
+
+    path = Path(path)
+    np.savez_compressed(
+        path,
+        format_version=np.int32(FORMAT_VERSION),
+        activations=np.array(activations),
+        mask_zero=np.bool_(mask_zero),
+        **arrays,
+    )
+    return path
+
+
+class NumpyAveragingModel:
+    """Ortalama havuzlamalı sınıflandırıcının saf NumPy karşılığı"""
+
+    def __init__(self, embedding: np.ndarray, layers: list[tuple[np.ndarray, np.ndarray, str]],
+                 mask_zero: bool = False):
+        self.embedding = embedding
+        self.layers = layers
+        self.mask_zero = mask_zero
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "NumpyAveragingModel":
+        with np.load(path) as data:
+            version = int(data["format_version"])
+            if version != FORMAT_VERSION:
+                raise ValueError(f"Desteklenmeyen ağırlık formatı: {version}")
+            layers = [
+                (data[f"kernel_{i}"], data[f"bias_{i}"], str(activation))
+                for i, activation in enumerate(data["activations"])
+            ]
+            # mask_zero anahtarı olmayan eski dosyalar maskesiz eğitilmiştir
+            mask_zero = bool(data["mask_zero"]) if "mask_zero" in data.files else False
+            return cls(data["embedding"], layers, mask_zero=mask_zero)
+
+    def save_mmap(self, directory: Union[str, Path]) -> Path:
+        """Ağırlıkları memory-map ile açılabilecek düz ``.npy`` dosyalarına yaz"""
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        np.save(directory / "embedding.npy", np.ascontiguousarray(self.embedding, dtype=np.float32))
+        for i, (kernel, bias, _) in enumerate(self.layers):
+            np.save(directory / f"kernel_{i}.npy", np.ascontiguousarray(kernel, dtype=np.float32))
+            np.save(directory / f"bias_{i}.npy", np.ascontiguousarray(bias, dtype=np.float32))
+        with open(directory / MMAP_META_FILE, "w", encoding="utf-8") as f:
+            json.dump({
+                "format_version": FORMAT_VERSION,
+                "activations": [activation for _, _, activation in self.layers],
+                "mask_zero": self.mask_zero,
+            }, f)
+        return directory
+
+    @classmethod
+    def load_mmap(cls, directory: Union[str, Path]) -> "NumpyAveragingModel":
+        """``save_mmap()`` çıktısını salt okunur memory-map olarak aç"""
+        directory = Path(directory)
+        with open(directory / MMAP_META_FILE, encoding="utf-8") as f:
+            meta = json.load(f)
+        if meta["format_version"] != FORMAT_VERSION:
+            raise ValueError(f"Desteklenmeyen ağırlık formatı: {meta['format_version']}")
+
+        def mapped(name):
+            return np.load(directory / f"{name}.npy", mmap_mode="r")
+
+        layers = [
+            (mapped(f"kernel_{i}"), mapped(f"bias_{i}"), activation)
+            for i, activation in enumerate(meta["activations"])
+        ]
+        return cls(mapped("embedding"), layers, mask_zero=meta.get("mask_zero", False))
+
+    @property
+    def vocab_size(self) -> int:
+        return self.embedding.shape[0]
+
+    def _forward(self, x: np.ndarray) -> np.ndarray:
+        if self.mask_zero:
+            mask = x != 0
+            counts = np.maximum(mask.sum(axis=1, keepdims=True), 1)
+            hidden = (self.embedding[x] * mask[..., None]).sum(axis=1) / counts
+        else:
+            hidden = self.embedding[x].mean(axis=1)
+        for kernel, bias, activation in self.layers:
+            hidden = _ACTIVATIONS[activation](hidden @ kernel + bias)
+        return hidden
+
+    def predict(self, x, batch_size: Optional[int] = None, verbose: int = 0) -> np.ndarray:
+        """Keras ``Model.predict`` ile aynı şekilde ``(n, 1)`` skor döndür"""
+        x = np.asarray(x, dtype=np.int64)
+        if batch_size is None or batch_size >= len(x):
+            return self._forward(x)
+        return np.concatenate([
+            self._forward(x[start:start + batch_size])
+            for start in range(0, len(x), batch_size)
+        ])
@@ -0,0 +1,211 @@
+"""
+🔁 Clickbait Avcısı - Ortak Çıkarım Hattı
+=========================================
+Backend API ve komut satırı araçlarının paylaştığı adımlar:
+artefakt yükleme → temizleme → tokenizasyon → model → sezgisel kurallar.
+"""
+
+import logging
+import pickle
+from pathlib import Path
+from typing import Optional, Union
+
+import numpy as np
+
+from clickbait_core.hashing import HashingFeaturizer
+from clickbait_core.heuristics import SafePatternEngine
+from clickbait_core.metrics import BATCH_SIZE_BUCKETS, REGISTRY, timed
+from clickbait_core.numpy_engine import NumpyAveragingModel, uses_mask
+from clickbait_core.tflite_engine import TFLiteModel
+from clickbait_core.preprocessing import clean_text, clean_texts  # noqa: F401 (yeniden dışa aktarım)
+from clickbait_core.tokenizer import MmapVocabTokenizer, VocabTokenizer
+
+logger = logging.getLogger(__name__)
+
+ENGINES = ("keras", "numpy", "mmap", "tflite")
+
+MODEL_FILE = "saved_model.h5"
+NUMPY_WEIGHTS_FILE = "model_weights.npz"
+TFLITE_FILE = "model_quant.tflite"
+MMAP_DIR = "mmap"
+VOCAB_FILE = "vocab.json"
+TOKENIZER_FILE = "tokenizer.pickle"
+CONFIG_FILE = "model_config.pickle"
+
+_safe_patterns: Optional[SafePatternEngine] = None
+
+MODEL_BATCH_SIZE = REGISTRY.histogram(
+    "clickbait_model_batch_size", "Tek forward pass'te skorlanan başlık sayısı", buckets=BATCH_SIZE_BUCKETS
+)
+# Maskeli modellerde hiç token içermeyen (tamamen padding) satırların skoru.
+# Maskeli Keras modeli bu satırlarda NaN üretir; tüm motorların aynı sonucu
+# vermesi için bu satırlar modele gönderilmez. 0.5 karar eşiğidir: başlık
+# clickbait sayılmaz ama güven %50'de kalır (model bir şey görmedi).
+EMPTY_SCORE = 0.5
+
+PREDICTIONS = REGISTRY.counter("clickbait_predictions_total", "Üretilen tahminler", ("label",))
+HEURISTIC_OVERRIDES = REGISTRY.counter(
+    "clickbait_heuristic_overrides_total", "Güvenli kalıp kuralıyla düşürülen skorlar", ("rule",)
+)
+
+
+def weights_path(model_dir: Union[str, Path], engine: str = "keras") -> Path:
+    """Seçilen motorun ağırlık dosyası"""
+    if engine not in ENGINES:
+        raise ValueError(f"Bilinmeyen motor: {engine} (seçenekler: {', '.join(ENGINES)})")
+    files = {"keras": MODEL_FILE, "numpy": NUMPY_WEIGHTS_FILE, "mmap": MMAP_DIR, "tflite": TFLITE_FILE}
+    return Path(model_dir) / files[engine]
+
+
+def artifact_paths(model_dir: Union[str, Path], engine: str = "keras") -> list[Path]:
+    """Tahminleri etkileyen tüm artefakt dosyaları"""
+    model_dir = Path(model_dir)
+    if engine == "mmap":
+        mmap_dir = weights_path(model_dir, engine)
+        return sorted(mmap_dir.glob("*")) + [model_dir / CONFIG_FILE]
+    return [weights_path(model_dir, engine), model_dir / VOCAB_FILE,
+            model_dir / TOKENIZER_FILE, model_dir / CONFIG_FILE]
+
+
+def load_tokenizer(model_dir: Union[str, Path]) -> VocabTokenizer:
+    """vocab.json varsa onu, yoksa pickle'lanmış Keras tokenizer'ı yükle"""
+    model_dir = Path(model_dir)
+    if (model_dir / VOCAB_FILE).exists():
+        return VocabTokenizer.load(model_dir / VOCAB_FILE)
+    with open(model_dir / TOKENIZER_FILE, 'rb') as f:
+        return VocabTokenizer.from_keras(pickle.load(f))
+
+
+def load_artifacts(model_dir: Union[str, Path], engine: str = "keras"):
+    """
+    ``(model, tokenizer, config)`` üçlüsünü yükle.
+
+    TensorFlow yalnızca ``keras`` motoru seçildiğinde import edilir
+    (``tflite`` motoru ``tflite_runtime`` kuruluysa onu kullanır).
+    ``mmap`` motorunda ağırlıklar ve kelime dağarcığı worker'lar arasında
+    paylaşılan salt okunur memory-map'lerdir. Config bir hashing
+    featurizer tanımlıyorsa kelime dağarcığı yüklenmez
+    (bkz. ``build_featurizer``).
+    """
+    path = weights_path(model_dir, engine)
+    if not path.exists():
+        raise FileNotFoundError(f"Model dosyası bulunamadı: {path}")
+
+    with open(Path(model_dir) / CONFIG_FILE, 'rb') as f:
+        config = pickle.load(f)
+
+    if engine == "mmap":
+        model = NumpyAveragingModel.load_mmap(path)
+    elif engine == "numpy":
+        model = NumpyAveragingModel.load(path)
+    elif engine == "tflite":
+        model = TFLiteModel.load(path)
+    else:
+        import tensorflow as tf
+        model = tf.keras.models.load_model(str(path))
+
+    return model, build_featurizer(config, model_dir, engine), config
+
+
+def build_featurizer(config: dict, model_dir: Optional[Union[str, Path]] = None, engine: str = "keras"):
+    """
+    Config'teki ``featurizer`` ayarına göre metin → indeks dönüştürücüsünü kur.
+
+    ``{"type": "hashing", ...}`` eğitim veya dosya gerektirmez; ayar yoksa
+    (eski modeller) ``model_dir`` içindeki kelime dağarcığı yüklenir.
+    """
+    settings = config.get('featurizer') or {"type": "vocab"}
+    if settings["type"] == "hashing":
+        return HashingFeaturizer.from_config(settings)
+    if settings["type"] != "vocab":
+        raise ValueError(f"Bilinmeyen featurizer: {settings['type']}")
+    if model_dir is None:
+        raise ValueError("Kelime dağarcığı featurizer'ı için model_dir gerekli")
+    if engine == "mmap":
+        return MmapVocabTokenizer.load(weights_path(model_dir, engine))
+    return load_tokenizer(model_dir)
+
+
+def masks_padding(model, config: dict) -> bool:
+    """
+    Model tamamen padding olan satırları skorlayamıyor mu?
+
+    Config'teki ``mask_zero`` (eğitimde yazılır) önceliklidir; yoksa
+    modelin kendisine bakılır. Ayar ve maske bilgisi olmayan eski
+    modeller (ör. TFLite) maskesiz eğitilmiştir.
+    """
+    if 'mask_zero' in config:
+        return bool(config['mask_zero'])
+    return uses_mask(model)
+
+
+def score_texts(model, tokenizer, config: dict, cleaned: list[str],
+                out: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Temizlenmiş metinleri tek forward pass ile skorla (``tokenize`` ve ``model`` aşamaları ölçülür).
+
+    Maskeli modellerde token üretmeyen metinler (örn. yalnızca emoji/noktalama)
+    modele gitmez, ``EMPTY_SCORE`` alır; maskesiz modeller tüm satırları skorlar.
+    """
+    if not cleaned:
+        return np.zeros(0, dtype=np.float32)
+    MODEL_BATCH_SIZE.observe(len(cleaned))
+    with timed("tokenize", len(cleaned)):
+        padded = tokenizer.encode_batch(cleaned, config['max_length'], out=out)
+    with timed("model", len(cleaned)):
+        nonempty = padded.any(axis=1)
+        if nonempty.all() or not masks_padding(model, config):
+            return model.predict(padded, batch_size=len(padded), verbose=0)[:, 0]
+        scores = np.full(len(padded), EMPTY_SCORE, dtype=np.float32)
+        if nonempty.any():
+            rows = padded[nonempty]
+            scores[nonempty] = model.predict(rows, batch_size=len(rows), verbose=0)[:, 0]
+        return scores
+
+
+def get_safe_patterns() -> SafePatternEngine:
+    """Güvenli kalıp motorunu ilk kullanımda yükle"""
+    global _safe_patterns
+    if _safe_patterns is None:
+        _safe_patterns = SafePatternEngine.default()
+    return _safe_patterns
+
+
+def build_results(texts: list[str], translated_texts: list[str], scores) -> list[dict]:
+    """Skorlardan API yanıtlarını oluştur (sezgisel kurallar tek geçişte, ``heuristics`` aşaması)"""
+    with timed("heuristics", len(texts)):
+        return _build_results(texts, translated_texts, scores)
+
+
+def _build_results(texts: list[str], translated_texts: list[str], scores) -> list[dict]:
+    engine = get_safe_patterns()
+    results = []
+    for text, translated_text, rule, score in zip(
+        texts, translated_texts, engine.match_batch(translated_texts), scores
+    ):
+        score = float(score)
+        # --- Heuristics to reduce False Positives ---
+        adjusted = engine.adjust(score, rule)
+        if adjusted != score:
+            logger.info(f"Heuristic applied ({rule}): Safe pattern detected for '{translated_text}'")
+            HEURISTIC_OVERRIDES.inc(rule=rule)
+        else:
+            rule = None
+        is_clickbait = adjusted > 0.5
+        PREDICTIONS.inc(label='CLICKBAIT' if is_clickbait else 'NORMAL')
+
+        results.append({
+            'is_clickbait': is_clickbait,
+            'score': round(adjusted, 4),
+            'confidence': round(adjusted * 100 if is_clickbait else (1 - adjusted) * 100, 2),
+            'label': 'CLICKBAIT' if is_clickbait else 'NORMAL',
+            'heuristic': rule,
+            'original_text': text,
+            'translated_text': translated_text
+        })
+    return results
+
+
+def build_result(text: str, translated_text: str, score: float) -> dict:
+    """Skordan API yanıtını oluştur"""
+    return build_results([text], [translated_text], [score])[0]
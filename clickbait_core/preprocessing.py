@@ -0,0 +1,60 @@
+"""
+🧹 Clickbait Avcısı - Metin Ön İşleme
+=====================================
+Eğitim scripti, backend, dashboard ve yardımcı araçların ortak kullandığı
+tek ``clean_text`` uygulaması.
+
+Davranış eski regex sürümüyle birebir aynıdır::
+
+    text.lower()
+    re.sub(r'[^\\w\\sğüşıöçĞÜŞİÖÇ]', '', text)
+    re.sub(r'\\s+', ' ', text).strip()
+
+Ancak karakter silme işlemi, her karakter için sonucu ilk görüldüğünde
+hesaplayıp saklayan bir ``str.translate`` tablosuyla yapılır; boşluk
+sadeleştirme ise ``str.split`` / ``str.join`` ile C seviyesinde kalır.
+"""
+
+import re
+import time
+from typing import Iterable
+
+from clickbait_core.metrics import record_stage
+
+# Temizlemede korunan karakterler (harf/rakam/_ , boşluk ve Türkçe harfler)
+_REMOVED_CHAR_RE = re.compile(r'[^\w\sğüşıöçĞÜŞİÖÇ]')
+
+
+class _CleanTable(dict):
+    """``str.translate`` için tembel doldurulan karakter tablosu"""
+
+    def __missing__(self, codepoint: int):
+        value = None if _REMOVED_CHAR_RE.match(chr(codepoint)) else codepoint
+        self[codepoint] = value
+        return value
+
+
+_CLEAN_TABLE = _CleanTable()
+
+
+def clean_text(text: str) -> str:
+    """Metni temizle ve normalize et"""
+    if not isinstance(text, str):
+        return ""
+    return " ".join(text.lower().translate(_CLEAN_TABLE).split())
+
+
+def clean_texts(texts: Iterable[str]):
+    """
+    Bir metin listesini veya pandas Series'ini tek seferde temizle.
+
+    Series verilirse aynı indeksli bir Series, aksi halde liste döner.
+    Süre ``clean`` aşaması olarak kaydedilir (bkz. ``clickbait_core.metrics``).
+    """
+    started = time.perf_counter()
+    if hasattr(texts, "map") and hasattr(texts, "index") and not isinstance(texts, list):
+        cleaned = texts.map(clean_text)
+    else:
+        cleaned = [clean_text(text) for text in texts]
+    record_stage("clean", time.perf_counter() - started, len(cleaned))
+    return cleaned
@@ -0,0 +1,88 @@
+"""
+🗂️ Clickbait Avcısı - Artefakt Sürüm Kaydı
+==========================================
+Her eğitim (``train.py``) artefaktlarını ayrı bir sürüm klasörüne yazar::
+
+    model_training/
+    ├── versions/
+    │   ├── ACTIVE                  # servis edilen sürümün adı
+    │   ├── 20261016-090000/        # saved_model.h5, vocab.json, model_config.pickle,
+    │   └── 20261017-090000/        # model_weights.npz, train_state.json, (mmap/)
+    ├── saved_model.h5              # etkin sürümün kopyaları (eski düzen)
+    └── ...
+
+Sürüm klasörleri hiç değiştirilmez; yeni model yeni klasör demektir.
+``ACTIVE`` dosyası atomik olarak (``os.replace``) güncellenir, böylece
+okuyan bir süreç hiçbir zaman yarım yazılmış bir değer görmez.
+``versions/`` yoksa kök klasördeki dosyalar sürümsüz olarak kullanılır.
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Optional, Union
+
+from clickbait_core.pipeline import CONFIG_FILE
+
+VERSIONS_DIR = "versions"
+ACTIVE_FILE = "ACTIVE"
+STATE_FILE = "train_state.json"
+
+
+class ArtifactRegistry:
+    """Bir model klasöründeki sürümlü artefakt setleri"""
+
+    def __init__(self, root: Union[str, Path]):
+        self.root = Path(root)
+        self.versions_dir = self.root / VERSIONS_DIR
+
+    def versions(self) -> list[str]:
+        """Tamamlanmış sürümler, eskiden yeniye (adlar zaman damgası)"""
+        if not self.versions_dir.is_dir():
+            return []
+        return sorted(
+            path.name for path in self.versions_dir.iterdir()
+            if path.is_dir() and (path / CONFIG_FILE).exists()
+        )
+
+    def active_version(self) -> Optional[str]:
+        """``ACTIVE`` dosyasındaki sürüm; dosya yoksa en yeni sürüm, hiç sürüm yoksa None"""
+        try:
+            name = (self.versions_dir / ACTIVE_FILE).read_text(encoding="utf-8").strip()
+        except FileNotFoundError:
+            name = ""
+        if name:
+            return name
+        versions = self.versions()
+        return versions[-1] if versions else None
+
+    def path(self, version: Optional[str]) -> Path:
+        """Sürümün klasörü; ``None`` sürümsüz kök klasördür"""
+        if version is None:
+            return self.root
+        path = self.versions_dir / version
+        if Path(version).name != version or not (path / CONFIG_FILE).exists():
+            raise FileNotFoundError(f"Model sürümü bulunamadı: {version} ({self.versions_dir})")
+        return path
+
+    def resolve(self, version: Optional[str] = None) -> tuple[Optional[str], Path]:
+        """``(sürüm, klasör)``; sürüm verilmezse etkin sürüm"""
+        version = version or self.active_version()
+        return version, self.path(version)
+
+    def activate(self, version: str) -> Path:
+        """Sürümü etkin yap (``ACTIVE`` dosyasını atomik olarak değiştirir)"""
+        self.path(version)
+        target = self.versions_dir / ACTIVE_FILE
+        tmp = target.with_name(f".{ACTIVE_FILE}.{os.getpid()}")
+        tmp.write_text(version + "\n", encoding="utf-8")
+        os.replace(tmp, target)
+        return target
+
+    def describe(self, version: Optional[str]) -> dict:
+        """Sürümün ``train_state.json`` içeriği (yoksa boş sözlük)"""
+        try:
+            with open(self.path(version) / STATE_FILE, encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
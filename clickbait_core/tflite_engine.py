@@ -0,0 +1,134 @@
+"""
+🪶 Clickbait Avcısı - Kuantize TFLite Motoru
+============================================
+Eğitilmiş Keras modelini eğitim sonrası kuantizasyonla ``.tflite``
+dosyasına çevirir ve tam Keras yerine TFLite yorumlayıcısıyla çalıştırır.
+
+Kuantizasyon modları (``QUANTIZATION_MODES``):
+
+- ``dynamic``: ağırlıklar int8, aktivasyonlar float (veri gerektirmez)
+- ``float16``: ağırlıklar float16 (boyut yarıya iner, doğruluk neredeyse aynı)
+- ``int8``   : ağırlıklar ve aktivasyonlar int8; temsilî veriyle kalibre
+  edilir, desteklenmeyen işlemler float'ta kalır
+
+Yorumlayıcı için önce hafif ``tflite_runtime`` paketi denenir; yoksa
+``tf.lite.Interpreter`` kullanılır. Dönüştürme her zaman TensorFlow
+gerektirir (eğitim/export tarafı).
+"""
+
+import threading
+from pathlib import Path
+from typing import Iterable, Optional, Union
+
+import numpy as np
+
+from clickbait_core.numpy_engine import uses_mask
+
+QUANTIZATION_MODES = ("dynamic", "float16", "int8")
+REPRESENTATIVE_SAMPLES = 500
+
+
+def export_tflite(keras_model, path: Union[str, Path], quantization: str = "dynamic",
+                  representative_data: Optional[np.ndarray] = None) -> Path:
+    """Keras modelini kuantize ``.tflite`` olarak kaydet"""
+    import tensorflow as tf
+
+    if quantization not in QUANTIZATION_MODES:
+        raise ValueError(f"Bilinmeyen kuantizasyon: {quantization} (seçenekler: {', '.join(QUANTIZATION_MODES)})")
+    converter = tf.lite.TFLiteConverter.from_keras_model(keras_model)
+    converter.optimizations = [tf.lite.Optimize.DEFAULT]
+    if quantization == "float16":
+        converter.target_spec.supported_types = [tf.float16]
+    elif quantization == "int8":
+        if representative_data is None or not len(representative_data):
+            raise ValueError("int8 kuantizasyonu için temsilî veri gerekli")
+        samples = np.asarray(representative_data[:REPRESENTATIVE_SAMPLES], dtype=np.float32)
+
+        def representative_dataset():
+            for row in samples:
+                yield [row[None, :]]
+
+        converter.representative_dataset = representative_dataset
+
+    path = Path(path)
+    path.write_bytes(converter.convert())
+    return path
+
+
+def _interpreter_class():
+    try:
+        from tflite_runtime.interpreter import Interpreter
+    except ImportError:
+        import tensorflow as tf
+        Interpreter = tf.lite.Interpreter
+    return Interpreter
+
+
+class TFLiteModel:
+    """Keras ``predict`` arayüzüyle çalışan, thread-safe TFLite yorumlayıcı sarmalayıcısı"""
+
+    def __init__(self, model_path: Union[str, Path], num_threads: Optional[int] = None):
+        self.model_path = Path(model_path)
+        self.interpreter = _interpreter_class()(model_path=str(self.model_path), num_threads=num_threads)
+        self._input = self.interpreter.get_input_details()[0]
+        self._output = self.interpreter.get_output_details()[0]
+        self._batch_size = None
+        # Yorumlayıcı thread-safe değil; mikro batch ve /predict/batch aynı anda çağırabilir
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, path: Union[str, Path], num_threads: Optional[int] = None) -> "TFLiteModel":
+        return cls(path, num_threads=num_threads)
+
+    def _run(self, x: np.ndarray) -> np.ndarray:
+        if self._batch_size != len(x):
+            self.interpreter.resize_tensor_input(self._input["index"], [len(x), x.shape[1]])
+            self.interpreter.allocate_tensors()
+            self._batch_size = len(x)
+        self.interpreter.set_tensor(self._input["index"], x.astype(self._input["dtype"], copy=False))
+        self.interpreter.invoke()
+        output = self.interpreter.get_tensor(self._output["index"])
+        scale, zero_point = self._output.get("quantization", (0.0, 0))
+        if scale:
+            output = (output.astype(np.float32) - zero_point) * scale
+        return output.astype(np.float32, copy=False)
+
+    def predict(self, x, batch_size: Optional[int] = None, verbose: int = 0) -> np.ndarray:
+        """Keras ``Model.predict`` ile aynı şekilde ``(n, 1)`` skor döndür"""
+        x = np.asarray(x)
+        with self._lock:
+            if batch_size is None or batch_size >= len(x):
+                return self._run(x)
+            return np.concatenate([
+                self._run(x[start:start + batch_size])
+                for start in range(0, len(x), batch_size)
+            ])
+
+
+def accuracy_report(reference, candidate, x: np.ndarray, y: Iterable, batch_size: int = 1024) -> dict:
+    """
+    İki modelin (örn. Keras ve kuantize TFLite) aynı ayrılmış veri
+    üzerindeki doğruluk farkı ve skor sapması.
+
+    Referans model padding'i maskeliyorsa token içermeyen satırlar servis
+    sırasında modele gitmediği için (bkz. ``pipeline.score_texts``)
+    karşılaştırmaya alınmaz.
+    """
+    y = np.asarray(y).astype(np.float32).ravel()
+    if uses_mask(reference):
+        nonempty = np.asarray(x).any(axis=1)
+        x, y = x[nonempty], y[nonempty]
+    reference_scores = np.asarray(reference.predict(x, batch_size=batch_size, verbose=0))[:, 0]
+    candidate_scores = np.asarray(candidate.predict(x, batch_size=batch_size, verbose=0))[:, 0]
+    reference_accuracy = float(np.mean((reference_scores > 0.5) == (y > 0.5)))
+    candidate_accuracy = float(np.mean((candidate_scores > 0.5) == (y > 0.5)))
+    diff = np.abs(reference_scores - candidate_scores)
+    return {
+        "samples": int(len(y)),
+        "reference_accuracy": round(reference_accuracy, 6),
+        "quantized_accuracy": round(candidate_accuracy, 6),
+        "accuracy_delta": round(candidate_accuracy - reference_accuracy, 6),
+        "label_agreement": round(float(np.mean((reference_scores > 0.5) == (candidate_scores > 0.5))), 6),
+        "max_abs_score_diff": round(float(diff.max()), 6) if len(diff) else 0.0,
+        "mean_abs_score_diff": round(float(diff.mean()), 6) if len(diff) else 0.0,
+    }
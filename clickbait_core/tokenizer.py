@@ -0,0 +1,229 @@
+"""
+🔤 Clickbait Avcısı - Hafif Tokenizer
+=====================================
+Keras ``Tokenizer.texts_to_sequences`` + ``pad_sequences(padding='post',
+truncating='post')`` çıktısını TensorFlow import etmeden üretir.
+
+Sadece çıkarımda kullanılan ilk ``num_words`` kelime, pickle yerine küçük
+bir JSON dosyasında (``vocab.json``) saklanır.
+
+``MmapVocabTokenizer`` aynı kelime dağarcığını sıralı bir NumPy dizisi
+olarak memory-map ile açar; çok süreçli serviste worker'lar arasında
+paylaşılır ve kelime araması ``np.searchsorted`` ile batch halinde yapılır.
+"""
+
+import json
+from pathlib import Path
+from typing import Iterable, Optional, Union
+
+import numpy as np
+
+FORMAT_VERSION = 1
+MMAP_WORDS_FILE = "vocab_words.npy"
+MMAP_IDS_FILE = "vocab_ids.npy"
+MMAP_META_FILE = "vocab_meta.json"
+DEFAULT_FILTERS = '!"#$%&()*+,-./:;<=>?@[\\]^_`{|}~\t\n'
+
+
+class VocabTokenizer:
+    """Kırpılmış kelime dağarcığı ile çalışan Keras uyumlu tokenizer"""
+
+    def __init__(
+        self,
+        words: list[str],
+        num_words: Optional[int] = None,
+        oov_token: Optional[str] = "<OOV>",
+        filters: str = DEFAULT_FILTERS,
+        lower: bool = True,
+        split: str = " ",
+    ):
+        # words[i] -> indeks i + 1 (0 padding için ayrılmış)
+        self.words = list(words)
+        self.num_words = num_words
+        self.oov_token = oov_token
+        self.filters = filters
+        self.lower = lower
+        self.split = split
+        self.word_index = {word: i for i, word in enumerate(self.words, start=1)}
+        self.oov_index = self.word_index.get(oov_token) if oov_token is not None else None
+        self._filter_table = str.maketrans({c: split for c in filters})
+
+    @classmethod
+    def from_keras(cls, tokenizer) -> "VocabTokenizer":
+        """Eğitilmiş bir Keras ``Tokenizer`` nesnesinden oluştur"""
+        limit = tokenizer.num_words or (len(tokenizer.word_index) + 1)
+        by_index = sorted(
+            (i, word) for word, i in tokenizer.word_index.items() if i < limit
+        )
+        if [i for i, _ in by_index] != list(range(1, len(by_index) + 1)):
+            raise ValueError("Tokenizer word_index ardışık değil")
+        return cls(
+            [word for _, word in by_index],
+            num_words=tokenizer.num_words,
+            oov_token=tokenizer.oov_token,
+            filters=tokenizer.filters,
+            lower=tokenizer.lower,
+            split=tokenizer.split,
+        )
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "VocabTokenizer":
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("format_version") != FORMAT_VERSION:
+            raise ValueError(f"Desteklenmeyen vocab formatı: {data.get('format_version')}")
+        return cls(
+            data["words"],
+            num_words=data["num_words"],
+            oov_token=data["oov_token"],
+            filters=data["filters"],
+            lower=data["lower"],
+            split=data["split"],
+        )
+
+    def save(self, path: Union[str, Path]) -> Path:
+        path = Path(path)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(dict(self._settings(), words=self.words), f, ensure_ascii=False, separators=(",", ":"))
+        return path
+
+    def _settings(self) -> dict:
+        return {
+            "format_version": FORMAT_VERSION,
+            "num_words": self.num_words,
+            "oov_token": self.oov_token,
+            "filters": self.filters,
+            "lower": self.lower,
+            "split": self.split,
+        }
+
+    def save_mmap(self, directory: Union[str, Path]) -> Path:
+        """Kelimeleri sıralı dizi + indeks dizisi olarak ``.npy`` dosyalarına yaz"""
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        words = np.array(self.words)
+        order = np.argsort(words, kind="stable")
+        np.save(directory / MMAP_WORDS_FILE, words[order])
+        np.save(directory / MMAP_IDS_FILE, (order + 1).astype(np.int32))
+        with open(directory / MMAP_META_FILE, "w", encoding="utf-8") as f:
+            json.dump(self._settings(), f, ensure_ascii=False)
+        return directory
+
+    def text_to_word_sequence(self, text: str) -> list[str]:
+        if self.lower:
+            text = text.lower()
+        return [w for w in text.translate(self._filter_table).split(self.split) if w]
+
+    def text_to_sequence(self, text: str) -> list[int]:
+        get = self.word_index.get
+        if self.oov_index is None:
+            return [i for i in map(get, self.text_to_word_sequence(text)) if i is not None]
+        oov = self.oov_index
+        return [get(w, oov) for w in self.text_to_word_sequence(text)]
+
+    def texts_to_sequences(self, texts: Iterable[str]) -> list[list[int]]:
+        return [self.text_to_sequence(text) for text in texts]
+
+    def encode_batch(
+        self, texts: Iterable[str], max_length: int, out: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """
+        Metinleri doğrudan ``(n, max_length)`` int32 matrise yaz.
+
+        ``out`` verilirse (önceden ayrılmış dizi) ilk ``n`` satırı doldurulur.
+        """
+        texts = texts if isinstance(texts, list) else list(texts)
+        if out is None:
+            out = np.zeros((len(texts), max_length), dtype=np.int32)
+        else:
+            out = out[:len(texts)]
+            out.fill(0)
+        for row, text in enumerate(texts):
+            sequence = self.text_to_sequence(text)[:max_length]
+            out[row, :len(sequence)] = sequence
+        return out
+
+
+class MmapVocabTokenizer(VocabTokenizer):
+    """Memory-map edilmiş sıralı kelime dizisiyle çalışan tokenizer"""
+
+    def __init__(self, sorted_words: np.ndarray, ids: np.ndarray, num_words: Optional[int] = None,
+                 oov_token: Optional[str] = "<OOV>", filters: str = DEFAULT_FILTERS,
+                 lower: bool = True, split: str = " "):
+        # Sözlük (word_index) kurulmaz; aramalar paylaşılan dizi üzerinde yapılır
+        self.sorted_words = sorted_words
+        self.ids = ids
+        self.num_words = num_words
+        self.oov_token = oov_token
+        self.filters = filters
+        self.lower = lower
+        self.split = split
+        self.oov_index = self._lookup([oov_token])[0] if oov_token is not None else None
+        if self.oov_index == 0:
+            self.oov_index = None
+        self._filter_table = str.maketrans({c: split for c in filters})
+
+    @classmethod
+    def load(cls, directory: Union[str, Path]) -> "MmapVocabTokenizer":
+        directory = Path(directory)
+        with open(directory / MMAP_META_FILE, encoding="utf-8") as f:
+            meta = json.load(f)
+        if meta.get("format_version") != FORMAT_VERSION:
+            raise ValueError(f"Desteklenmeyen vocab formatı: {meta.get('format_version')}")
+        return cls(
+            np.load(directory / MMAP_WORDS_FILE, mmap_mode="r"),
+            np.load(directory / MMAP_IDS_FILE, mmap_mode="r"),
+            num_words=meta["num_words"],
+            oov_token=meta["oov_token"],
+            filters=meta["filters"],
+            lower=meta["lower"],
+            split=meta["split"],
+        )
+
+    @property
+    def words(self) -> list[str]:
+        words = [""] * len(self.ids)
+        for word, i in zip(self.sorted_words.tolist(), self.ids.tolist()):
+            words[i - 1] = word
+        return words
+
+    def _lookup(self, tokens: list[str]) -> np.ndarray:
+        """Kelime listesini indekslere çevir (bulunamayan = 0)"""
+        if not tokens:
+            return np.zeros(0, dtype=np.int32)
+        tokens = np.array(tokens)
+        positions = np.searchsorted(self.sorted_words, tokens)
+        np.minimum(positions, len(self.sorted_words) - 1, out=positions)
+        found = self.sorted_words[positions] == tokens
+        return np.where(found, self.ids[positions], 0).astype(np.int32)
+
+    def text_to_sequence(self, text: str) -> list[int]:
+        ids = self._lookup(self.text_to_word_sequence(text))
+        if self.oov_index is None:
+            return [i for i in ids.tolist() if i]
+        ids[ids == 0] = self.oov_index
+        return ids.tolist()
+
+    def encode_batch(
+        self, texts: Iterable[str], max_length: int, out: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        if self.oov_index is None:
+            return super().encode_batch(texts, max_length, out=out)
+
+        texts = texts if isinstance(texts, list) else list(texts)
+        if out is None:
+            out = np.zeros((len(texts), max_length), dtype=np.int32)
+        else:
+            out = out[:len(texts)]
+            out.fill(0)
+
+        # OOV varken her kelime tam bir indekse karşılık gelir; önce kırpmak güvenli
+        token_lists = [self.text_to_word_sequence(text)[:max_length] for text in texts]
+        lengths = np.fromiter((len(tokens) for tokens in token_lists), dtype=np.int64, count=len(texts))
+        ids = self._lookup([token for tokens in token_lists for token in tokens])
+        if len(ids):
+            ids[ids == 0] = self.oov_index
+            rows = np.repeat(np.arange(len(texts)), lengths)
+            starts = np.repeat(np.cumsum(lengths) - lengths, lengths)
+            out[rows, np.arange(len(ids)) - starts] = ids
+        return out
@@ -0,0 +1,228 @@
+"""
+🌍 Clickbait Avcısı - Çeviri Önbelleği
+======================================
+Aynı başlığın tekrar tekrar çevrilmesini önler.
+
+Katmanlar:
+1. Bellek içi LRU (boyut + TTL sınırlı)
+2. İsteğe bağlı SQLite deposu (yeniden başlatmalarda korunur)
+3. Gerçek çevirmen (örn. Google Translate) veya ``TranslationStage``
+
+Başarısız çeviriler önbelleğe yazılmaz; bu durumda orijinal metin döner.
+Aşamadaki önbelleğe alınamaz arka uçların (örn. yerel sözlük) sonuçları da
+yazılmaz, böylece asıl çevirmen geri geldiğinde daha iyi çeviri alınır.
+"""
+
+import logging
+import sqlite3
+import threading
+import time
+import unicodedata
+from pathlib import Path
+from typing import Callable, Iterable, Optional, Union
+
+from clickbait_core.cache import LRUCache
+from clickbait_core.metrics import timed
+
+logger = logging.getLogger(__name__)
+
+_local = threading.local()
+
+
+def google_translate(text: str) -> str:
+    """Google Translate ile İngilizce'ye çevir (thread başına tek istemci)"""
+    translator = getattr(_local, "google_translator", None)
+    if translator is None:
+        from deep_translator import GoogleTranslator
+
+        translator = GoogleTranslator(source="auto", target="en")
+        _local.google_translator = translator
+    return translator.translate(text)
+
+
+def normalize_key(text: str) -> str:
+    """Önbellek anahtarı: Unicode NFC + sadeleştirilmiş boşluklar"""
+    return " ".join(unicodedata.normalize("NFC", text).split())
+
+
+def latest_deadlines(keys: Iterable[str], deadlines: Iterable[Optional[float]]) -> dict[str, Optional[float]]:
+    """Anahtar başına en geç süre sınırı (süre sınırsız ``None`` her zaman kazanır)"""
+    latest: dict[str, Optional[float]] = {}
+    for key, deadline in zip(keys, deadlines):
+        previous = latest.get(key, deadline)
+        latest[key] = None if previous is None or deadline is None else max(previous, deadline)
+    return latest
+
+
+class SQLiteStore:
+    """Çevirileri diskte tutan basit anahtar/değer deposu"""
+
+    def __init__(self, path: Union[str, Path], ttl: Optional[float] = None):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS translations ("
+            " source TEXT PRIMARY KEY, translated TEXT NOT NULL, created REAL NOT NULL)"
+        )
+        self._conn.commit()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT translated, created FROM translations WHERE source = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        translated, created = row
+        if self.ttl is not None and time.time() - created >= self.ttl:
+            return None
+        return translated
+
+    def set_many(self, items: Iterable[tuple[str, str]]):
+        now = time.time()
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO translations (source, translated, created) VALUES (?, ?, ?)",
+                [(key, value, now) for key, value in items],
+            )
+            self._conn.commit()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM translations").fetchone()[0]
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+class TranslationCache:
+    """Çevirmen fonksiyonunun önüne konan iki katmanlı önbellek"""
+
+    def __init__(
+        self,
+        translate_fn: Callable[[str], str] = google_translate,
+        maxsize: int = 10000,
+        ttl: Optional[float] = None,
+        db_path: Optional[Union[str, Path]] = None,
+        stage=None,
+    ):
+        # stage verilirse (bkz. clickbait_core.translators) translate_fn yerine o kullanılır
+        self.translate_fn = translate_fn
+        self.stage = stage
+        self.memory = LRUCache(maxsize=maxsize, ttl=ttl)
+        self.store = SQLiteStore(db_path, ttl=ttl) if db_path else None
+        self.disk_hits = 0
+        self.errors = 0
+
+    def _lookup(self, key: str) -> Optional[str]:
+        value = self.memory.get(key)
+        if value is None and self.store is not None:
+            value = self.store.get(key)
+            if value is not None:
+                self.disk_hits += 1
+                self.memory.set(key, value)
+        return value
+
+    def _translate_uncached(self, key: str) -> Optional[str]:
+        try:
+            return self.translate_fn(key)
+        except Exception as e:
+            self.errors += 1
+            logger.error(f"Translation failed: {e}")
+            return None
+
+    def _translate_missing(
+        self, keys: list[str], map_fn: Callable, deadline: Union[None, float, list[Optional[float]]] = None
+    ) -> list[tuple[Optional[str], bool, bool]]:
+        """Önbellekte olmayan metinler için ``(çeviri, önbelleğe_yazılabilir, kalıcı)``"""
+        if self.stage is None:
+            return [(value, True, True) for value in map_fn(self._translate_uncached, keys)]
+        primary = self.stage.backends[0]
+        results = []
+        for value, backend in self.stage.translate_detailed(keys, deadline=deadline):
+            if backend is None:
+                self.errors += 1
+                results.append((None, False, False))
+            else:
+                results.append((value, backend.cacheable, backend.cacheable or backend is primary))
+        return results
+
+    def translate(self, text: str) -> str:
+        """Tek bir metni çevir"""
+        return self.translate_batch([text])[0]
+
+    def translate_batch(
+        self, texts: list[str], map_fn: Callable = map, fallback: bool = True
+    ) -> list[Optional[str]]:
+        """
+        Metin listesini çevir (sıra korunur).
+
+        Önbellekte olmayan benzersiz metinler ``map_fn`` ile çevrilir;
+        eşzamanlılık için ``ThreadPoolExecutor.map`` verilebilir. ``stage``
+        tanımlıysa eşzamanlılık ve zaman aşımını aşama yönetir.
+        ``fallback=False`` ise başarısız çeviriler ``None`` döner.
+        """
+        return [
+            text if value is None and fallback else value
+            for text, (value, _) in zip(texts, self.translate_batch_detailed(texts, map_fn))
+        ]
+
+    def translate_batch_detailed(
+        self, texts: list[str], map_fn: Callable = map,
+        deadline: Union[None, float, list[Optional[float]]] = None,
+    ) -> list[tuple[Optional[str], bool]]:
+        """
+        Her metin için ``(çeviri veya None, kalıcı mı)``.
+
+        İkinci değer çevirinin önbellekten, önbelleğe alınabilir bir arka
+        uçtan veya aşamanın birincil arka ucundan geldiğini gösterir; yedeğe
+        düşülen (örn. Google yerine sözlük) çeviriler için ``False`` olur.
+        ``deadline`` (``time.monotonic()``; tek an veya metin başına liste)
+        aşamaya iletilir, aynı metin birden çok kez geçerse en geç süre
+        sınırı kullanılır.
+        Süre ``translate`` aşaması olarak kaydedilir.
+        """
+        with timed("translate", len(texts)):
+            return self._translate_batch_detailed(texts, map_fn, deadline)
+
+    def _translate_batch_detailed(
+        self, texts: list[str], map_fn: Callable, deadline: Union[None, float, list[Optional[float]]] = None
+    ) -> list[tuple[Optional[str], bool]]:
+        keys = [normalize_key(text) for text in texts]
+        latest = latest_deadlines(keys, deadline) if isinstance(deadline, (list, tuple)) else None
+        found = {}
+        missing = []
+        for key in dict.fromkeys(keys):
+            value = self._lookup(key)
+            if value is None:
+                missing.append(key)
+            else:
+                found[key] = (value, True)
+
+        if missing:
+            fresh = []
+            if latest is not None:
+                deadline = [latest[key] for key in missing]
+            for key, (value, cacheable, durable) in zip(missing, self._translate_missing(missing, map_fn, deadline)):
+                if value is None:
+                    continue
+                found[key] = (value, durable)
+                if cacheable:
+                    fresh.append((key, value))
+                    self.memory.set(key, value)
+            if fresh and self.store is not None:
+                self.store.set_many(fresh)
+
+        return [found.get(key, (None, False)) for key in keys]
+
+    def stats(self) -> dict:
+        stats = self.memory.stats()
+        stats["disk_hits"] = self.disk_hits
+        stats["disk_size"] = len(self.store) if self.store is not None else 0
+        stats["errors"] = self.errors
+        return stats
@@ -0,0 +1,397 @@
+"""
+🔌 Clickbait Avcısı - Çeviri Aşaması
+====================================
+Takılabilir çeviri arka uçları ve bunları zaman aşımı, eşzamanlılık sınırı
+ve yedek zinciriyle çalıştıran ``TranslationStage``.
+
+Arka uçlar:
+- ``google``: deep_translator üzerinden Google Translate (ağ gerektirir)
+- ``dictionary``: yerel Türkçe→İngilizce kelime/ifade tablosu (çevrimdışı)
+
+Örnek: ``build_stage("google,dictionary", timeout=2.0)`` önce Google'ı dener,
+hata veya zaman aşımında sözlüğe düşer. Zaman aşımı metin başınadır; yerel
+arka uçlar (sözlük) thread havuzuna girmeden, takılan ağ çağrılarının
+arkasında beklemeden çalışır.
+"""
+
+import asyncio
+import logging
+import os
+import re
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Callable, Optional, Union
+
+from clickbait_core.language import detect_language
+from clickbait_core.translation import google_translate
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DICTIONARY_PATH = Path(__file__).resolve().parent / "data" / "tr_en.tsv"
+DICTIONARY_PATH_ENV = "CLICKBAIT_DICTIONARY_PATH"
+
+
+class Translator:
+    """Çeviri arka ucu arayüzü"""
+
+    name = "base"
+    # Sonuçlar kalıcı önbelleğe yazılabilir mi?
+    cacheable = True
+    # Ağa çıkmayan, hızlı arka uç mu? (thread havuzu ve zaman aşımı olmadan çalışır)
+    local = False
+
+    def translate(self, text: str) -> str:
+        raise NotImplementedError
+
+    def translate_batch(self, texts: list[str]) -> list[str]:
+        return [self.translate(text) for text in texts]
+
+
+class FunctionTranslator(Translator):
+    """Düz bir ``str -> str`` fonksiyonunu arka uca çevirir (testler için stub)"""
+
+    def __init__(self, fn: Callable[[str], str], name: str = "function", cacheable: bool = True,
+                 local: bool = False):
+        self.fn = fn
+        self.name = name
+        self.cacheable = cacheable
+        self.local = local
+
+    def translate(self, text: str) -> str:
+        return self.fn(text)
+
+
+class GoogleTranslatorBackend(Translator):
+    name = "google"
+
+    def translate(self, text: str) -> str:
+        return google_translate(text)
+
+
+class DictionaryTranslator(Translator):
+    """
+    Yerel kelime/ifade tablosuyla kelime kelime çeviri.
+
+    TSV biçimi: ``türkçe<TAB>english`` (``#`` ile başlayan satırlar yorum;
+    karşılığı boş bırakılan kelimeler, örn. soru ekleri, çeviride atılır).
+    Çok kelimeli ifadeler en uzun eşleşme ile önceliklidir. Bulunamayan
+    kelimelerde kesme işaretinden sonrası atılır ve yaygın ekler ancak geriye
+    tablodaki bir kök kalıyorsa atılır; kök bulunamazsa kelime olduğu gibi
+    bırakılır. Türkçe görünmeyen metinlerde (bkz. ``language.detect_language``,
+    örn. İngilizce başlıklar) ek atılmaz ve kelimelerin en az yarısı tabloda
+    birebir geçmiyorsa metin çevrilmeden döner.
+    """
+
+    name = "dictionary"
+    cacheable = False
+    local = True
+
+    SUFFIXES = sorted(
+        "lar ler da de ta te dan den tan ten nın nin nun nün ın in un ün ı i u ü "
+        "ya ye yı yi yu yü a e na ne sı si su sü ları leri ndan nden nda nde".split(),
+        key=len, reverse=True,
+    )
+    _TOKEN_RE = re.compile(r"\w+(?:['’]\w+)?|[^\w\s]")
+
+    def __init__(self, table: dict[str, str]):
+        self.table = {self._lower(key): value for key, value in table.items()}
+        self.max_phrase = max((len(key.split()) for key in self.table), default=1)
+
+    @classmethod
+    def from_file(cls, path: Union[str, Path]) -> "DictionaryTranslator":
+        table = {}
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                if not line.strip() or line.startswith("#"):
+                    continue
+                source, sep, target = line.rstrip("\r\n").partition("\t")
+                if sep:
+                    table[source.strip()] = target.strip()
+        return cls(table)
+
+    @classmethod
+    def default(cls) -> "DictionaryTranslator":
+        return cls.from_file(os.getenv(DICTIONARY_PATH_ENV) or DEFAULT_DICTIONARY_PATH)
+
+    @staticmethod
+    def _lower(text: str) -> str:
+        """Türkçe kurallarıyla küçük harfe çevir (I→ı, İ→i)"""
+        return text.replace("I", "ı").replace("İ", "i").lower()
+
+    def _known_stem(self, word: str, depth: int = 3) -> Optional[str]:
+        """En fazla ``depth`` ek atarak tabloda bulunan kökü ara"""
+        if word in self.table:
+            return word
+        if depth == 0:
+            return None
+        for suffix in self.SUFFIXES:
+            if word.endswith(suffix) and len(word) - len(suffix) >= 3:
+                stem = self._known_stem(word[:-len(suffix)], depth - 1)
+                if stem is not None:
+                    return stem
+        return None
+
+    def _lookup_word(self, word: str, strip_suffixes: bool = True) -> Optional[str]:
+        if word in self.table:
+            return self.table[word]
+        if not strip_suffixes:
+            return None
+        stem = self._known_stem(re.split(r"['’]", word, maxsplit=1)[0])
+        return None if stem is None else self.table[stem]
+
+    def translate(self, text: str) -> str:
+        turkish = detect_language(text) == "tr"
+        tokens = self._TOKEN_RE.findall(text)
+        lowered = [self._lower(token) for token in tokens]
+        output = []
+        words = sum(token[0].isalnum() for token in tokens)
+        exact = 0
+        i = 0
+        while i < len(tokens):
+            for size in range(min(self.max_phrase, len(tokens) - i), 1, -1):
+                phrase = " ".join(lowered[i:i + size])
+                if phrase in self.table:
+                    output.append(self.table[phrase])
+                    exact += size
+                    i += size
+                    break
+            else:
+                is_word = tokens[i][0].isalnum()
+                translated = self._lookup_word(lowered[i], strip_suffixes=turkish) if is_word else None
+                exact += is_word and lowered[i] in self.table
+                output.append(tokens[i] if translated is None else translated)
+                i += 1
+
+        if not turkish and exact * 2 < words:
+            return text
+        text = " ".join(word for word in output if word)
+        return re.sub(r"\s+([^\w\s])", r"\1", text)
+
+
+class BackendStats:
+    """Arka uç başına gecikme ve hata sayaçları"""
+
+    def __init__(self, window: int = 1000):
+        self.calls = 0
+        self.errors = 0
+        self.timeouts = 0
+        self._latencies = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float, ok: bool = True):
+        with self._lock:
+            self.calls += 1
+            if not ok:
+                self.errors += 1
+            self._latencies.append(seconds)
+
+    def record_timeout(self):
+        # Zaman aşımına uğrayan çağrı arka planda bitince ayrıca record() edilir
+        with self._lock:
+            self.timeouts += 1
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            latencies = sorted(self._latencies)
+
+        def percentile(p):
+            if not latencies:
+                return None
+            return round(latencies[min(len(latencies) - 1, int(p * len(latencies)))] * 1000, 2)
+
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "timeouts": self.timeouts,
+            "p50_ms": percentile(0.50),
+            "p95_ms": percentile(0.95),
+            "mean_ms": round(sum(latencies) / len(latencies) * 1000, 2) if latencies else None,
+        }
+
+
+class TranslationStage:
+    """
+    Arka uçları sırayla deneyen, zaman aşımlı ve eşzamanlılığı sınırlı aşama.
+
+    Her metin önce ilk arka uca gönderilir; hata veren veya çalışmaya
+    başladıktan sonra ``timeout`` saniyede bitmeyen metinler bir sonraki
+    arka uca düşer. Sırada bekleyen metinler için batch'in toplam bekleme
+    süresi ``timeout`` × (metin sayısı / ``max_concurrency``) ile sınırlıdır.
+    Her ağ arka ucunun kendi thread havuzu vardır; yerel arka uçlar
+    doğrudan çağıran thread'de çalışır.
+    """
+
+    def __init__(
+        self,
+        backends: list[Translator],
+        timeout: Optional[float] = None,
+        max_concurrency: int = 8,
+    ):
+        if not backends:
+            raise ValueError("En az bir çeviri arka ucu gerekli")
+        self.backends = list(backends)
+        self.timeout = timeout
+        self.max_concurrency = max_concurrency
+        self.metrics = {backend.name: BackendStats() for backend in self.backends}
+        self._pools = {
+            backend.name: ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix=f"translate-{backend.name}")
+            for backend in self.backends if not backend.local
+        }
+
+    def _call(self, backend: Translator, text: str) -> str:
+        started = time.perf_counter()
+        try:
+            result = backend.translate(text)
+        except Exception:
+            self.metrics[backend.name].record(time.perf_counter() - started, ok=False)
+            raise
+        self.metrics[backend.name].record(time.perf_counter() - started)
+        return result
+
+    def _run_inline(self, backend: Translator, texts: list[str]) -> dict:
+        results = {}
+        for i, text in enumerate(texts):
+            try:
+                results[i] = self._call(backend, text)
+            except Exception as e:
+                logger.error(f"Translation failed ({backend.name}): {e}")
+        return results
+
+    def _run_backend(self, backend: Translator, texts: list[str], deadlines: list[Optional[float]]) -> dict:
+        """
+        Bir arka ucu metinler üzerinde çalıştır; ``{indeks: çeviri}`` döndür.
+
+        ``timeout`` her metin için çağrı başladığı andan itibaren sayılır;
+        ``deadlines`` (``time.monotonic()``) her metnin kendi üst sınırıdır.
+        """
+        if backend.local or (len(texts) == 1 and deadlines[0] is None and self.timeout is None):
+            return self._run_inline(backend, texts)
+
+        started: dict[int, float] = {}
+
+        def run(index: int, text: str) -> str:
+            started[index] = time.monotonic()
+            return self._call(backend, text)
+
+        pool = self._pools[backend.name]
+        futures = {pool.submit(run, i, text): i for i, text in enumerate(texts)}
+        # Hiçbir metin en geç süre sınırından sonra beklenmez
+        batch_deadline = None if None in deadlines else max(deadlines)
+        if self.timeout is not None:
+            # Sırada bekleyenler de en fazla kendi "dalgaları" kadar bekler
+            waves = -(-len(texts) // self.max_concurrency)
+            own = time.monotonic() + self.timeout * waves
+            batch_deadline = own if batch_deadline is None else min(batch_deadline, own)
+
+        pending = set(futures)
+        expired = set()
+        done_results = {}
+        while pending:
+            now = time.monotonic()
+            if batch_deadline is not None and now >= batch_deadline:
+                break
+            wakes = [] if batch_deadline is None else [batch_deadline]
+            for future in list(pending):
+                if future.done():
+                    continue
+                index = futures[future]
+                limits = [] if deadlines[index] is None else [deadlines[index]]
+                began = started.get(index)
+                if began is not None and self.timeout is not None:
+                    limits.append(began + self.timeout)
+                if not limits:
+                    continue
+                if now >= min(limits):
+                    pending.discard(future)
+                    expired.add(future)
+                else:
+                    wakes.append(min(limits))
+            if not pending:
+                break
+            if self.timeout is not None:
+                # Henüz başlamamış metinler başladıklarında tekrar kontrol edilir
+                wakes.append(now + self.timeout)
+            timeout = max(min(wakes) - now, 0) if wakes else None
+            done, pending = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+            for future in done:
+                try:
+                    done_results[futures[future]] = future.result()
+                except Exception as e:
+                    logger.error(f"Translation failed ({backend.name}): {e}")
+
+        timed_out = pending | expired
+        for future in timed_out:
+            # Çalışmakta olan çağrı durdurulamaz; sonucu yalnızca beklenmez
+            future.cancel()
+            self.metrics[backend.name].record_timeout()
+        if timed_out:
+            logger.warning(f"{len(timed_out)} çeviri zaman aşımına uğradı ({backend.name})")
+        return done_results
+
+    def translate_detailed(
+        self, texts: list[str], deadline: Union[None, float, list[Optional[float]]] = None
+    ) -> list[tuple[Optional[str], Optional[Translator]]]:
+        """
+        Her metin için ``(çeviri, üreten arka uç)``; hiçbiri başaramazsa ``(None, None)``.
+
+        ``deadline`` (``time.monotonic()`` cinsinden) tüm metinler için tek bir
+        an veya metin başına bir liste olabilir. Ağ arka uçları her metni kendi
+        süre sınırını geçmeden bırakır; süresi dolan metinler sıradaki ağ arka
+        uçlarına gönderilmez, yerel arka uçlar (sözlük) yine de çalışır.
+        """
+        deadlines = list(deadline) if isinstance(deadline, (list, tuple)) else [deadline] * len(texts)
+        if len(deadlines) != len(texts):
+            raise ValueError("deadline listesi metin sayısıyla aynı uzunlukta olmalı")
+        results: list[tuple[Optional[str], Optional[Translator]]] = [(None, None)] * len(texts)
+        remaining = list(range(len(texts)))
+        for backend in self.backends:
+            if not remaining:
+                break
+            active = remaining
+            if not backend.local:
+                now = time.monotonic()
+                active = [index for index in remaining if deadlines[index] is None or now < deadlines[index]]
+                if not active:
+                    continue
+            translated = self._run_backend(backend, [texts[i] for i in active], [deadlines[i] for i in active])
+            for local, value in translated.items():
+                results[active[local]] = (value, backend)
+            remaining = [index for index in remaining if results[index][1] is None]
+        return results
+
+    def translate_batch(self, texts: list[str], fallback: bool = True) -> list[Optional[str]]:
+        """Çeviriler; hiçbir arka uç başaramazsa orijinal metin (veya ``None``)"""
+        return [
+            value if value is not None else (text if fallback else None)
+            for text, (value, _) in zip(texts, self.translate_detailed(texts))
+        ]
+
+    def translate(self, text: str) -> str:
+        return self.translate_batch([text])[0]
+
+    async def atranslate_batch(self, texts: list[str], fallback: bool = True) -> list[Optional[str]]:
+        """Olay döngüsünü bloklamadan çevir"""
+        return await asyncio.get_running_loop().run_in_executor(None, self.translate_batch, texts, fallback)
+
+    def stats(self) -> dict:
+        return {name: stats.snapshot() for name, stats in self.metrics.items()}
+
+
+BACKENDS = {
+    "google": GoogleTranslatorBackend,
+    "dictionary": DictionaryTranslator.default,
+}
+
+
+def build_stage(spec: str = "google,dictionary", timeout: Optional[float] = None,
+                max_concurrency: int = 8) -> TranslationStage:
+    """``"google,dictionary"`` gibi virgüllü bir tanımdan aşama oluştur"""
+    names = [name.strip().lower() for name in spec.split(",") if name.strip()]
+    unknown = [name for name in names if name not in BACKENDS]
+    if unknown:
+        raise ValueError(f"Bilinmeyen çeviri arka ucu: {unknown} (seçenekler: {', '.join(BACKENDS)})")
+    return TranslationStage([BACKENDS[name]() for name in names], timeout=timeout,
+                            max_concurrency=max_concurrency)
@@ -2,22 +2,16 @@ import os
 import pickle
 import tensorflow as tf
 from tensorflow.keras.preprocessing.sequence import pad_sequences
-import re
-from deep_translator import GoogleTranslator
+from clickbait_core.preprocessing import clean_text
+from clickbait_core.translation import TranslationCache
+from clickbait_core.translators import build_stage
 
 # Paths
 BASE_DIR = "model_training"
 MODEL_PATH = os.path.join(BASE_DIR, "saved_model.h5")
 TOKENIZER_PATH = os.path.join(BASE_DIR, "tokenizer.pickle")
 CONFIG_PATH = os.path.join(BASE_DIR, "model_config.pickle")
-
-def clean_text(text):
-    if not isinstance(text, str):
-        return ""
-    text = text.lower()
-    text = re.sub(r'[^\w\sğüşıöçĞÜŞİÖÇ]', '', text)
-    text = re.sub(r'\s+', ' ', text).strip()
-    return text
+TRANSLATION_CACHE_DB = os.path.join(".cache", "translations.sqlite3")
 
 def main():
     print("Loading artifacts...")
@@ -28,6 +22,8 @@ def main():
         config = pickle.load(f)
         
     MAX_LENGTH = config['max_length']
+    stage = build_stage(os.getenv("CLICKBAIT_TRANSLATORS", "google,dictionary"))
+    translation_cache = TranslationCache(db_path=TRANSLATION_CACHE_DB, stage=stage)
     
     test_cases = [
         ("You Won't Believe What Happened Next!", "Clickbait (English)"),
@@ -54,11 +50,12 @@ def main():
         translated = "No"
         
         if "(Turkish)" in label or "(TR)" in label:
-            try:
-                processed_text = GoogleTranslator(source='auto', target='en').translate(text)
+            errors_before = translation_cache.errors
+            processed_text = translation_cache.translate(text)
+            if translation_cache.errors > errors_before:
+                print("Translation error, using original text")
+            else:
                 translated = "Yes"
-            except Exception as e:
-                print(f"Translation error: {e}")
         elif "OOV" in label:
             translated = "Skip"
             processed_text = text
@@ -72,5 +69,8 @@ def main():
         
         print(f"{text[:50]:<50} | {label:<20} | {translated:<5} | {score:.4f}     | {pred_label}")
 
+    print(f"\nTranslation cache: {translation_cache.stats()}")
+    print(f"Translation backends: {stage.stats()}")
+
 if __name__ == "__main__":
     main()
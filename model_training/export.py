@@ -0,0 +1,189 @@
+import os
+import sys
+import pickle
+import argparse
+import numpy as np
+
+# --- Configuration ---
+# Use paths relative to this script
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT_DIR = os.path.dirname(BASE_DIR)
+DATA_PATH = os.path.join(BASE_DIR, "clickbait_data.csv")
+MODEL_PATH = os.path.join(BASE_DIR, "saved_model.h5")
+TOKENIZER_PATH = os.path.join(BASE_DIR, "tokenizer.pickle")
+CONFIG_PATH = os.path.join(BASE_DIR, "model_config.pickle")
+NUMPY_WEIGHTS_PATH = os.path.join(BASE_DIR, "model_weights.npz")
+VOCAB_PATH = os.path.join(BASE_DIR, "vocab.json")
+MMAP_DIR = os.path.join(BASE_DIR, "mmap")
+TFLITE_PATH = os.path.join(BASE_DIR, "model_quant.tflite")
+QUANTIZATION_REPORT_PATH = os.path.join(BASE_DIR, "quantization_report.json")
+
+PARITY_TOLERANCE = 1e-4
+
+sys.path.insert(0, ROOT_DIR)
+from clickbait_core.numpy_engine import NumpyAveragingModel, export_weights, uses_mask
+from clickbait_core.pipeline import build_featurizer
+from clickbait_core.tflite_engine import QUANTIZATION_MODES, REPRESENTATIVE_SAMPLES
+from clickbait_core.tokenizer import VocabTokenizer
+
+
+def artifact_path(model_dir, default_path):
+    """The file named like default_path inside model_dir (e.g. a versions/<version> directory)."""
+    return os.path.join(model_dir, os.path.basename(default_path))
+
+
+def load_keras_tokenizer(model_dir=BASE_DIR):
+    with open(artifact_path(model_dir, TOKENIZER_PATH), 'rb') as f:
+        return pickle.load(f)
+
+
+def load_keras_artifacts(model_dir=BASE_DIR):
+    """Returns (model, keras_tokenizer, config); the tokenizer is None for hashing featurizers."""
+    import tensorflow as tf
+
+    model = tf.keras.models.load_model(artifact_path(model_dir, MODEL_PATH))
+    with open(artifact_path(model_dir, CONFIG_PATH), 'rb') as f:
+        config = pickle.load(f)
+    tokenizer = None if config.get('featurizer') else load_keras_tokenizer(model_dir)
+    return model, tokenizer, config
+
+
+def export_numpy(model, path=NUMPY_WEIGHTS_PATH):
+    export_weights(model, path)
+    print(f"NumPy weights saved to: {path} ({os.path.getsize(path) / 1024:.0f} KB)")
+
+
+def export_vocab(tokenizer, path=VOCAB_PATH):
+    VocabTokenizer.from_keras(tokenizer).save(path)
+    print(f"Vocabulary saved to: {path} ({os.path.getsize(path) / 1024:.0f} KB)")
+
+
+def export_mmap(weights_path=NUMPY_WEIGHTS_PATH, vocab_path=VOCAB_PATH, directory=MMAP_DIR):
+    """Write flat .npy files that every server worker can memory-map read-only."""
+    NumpyAveragingModel.load(weights_path).save_mmap(directory)
+    if vocab_path is not None:
+        VocabTokenizer.load(vocab_path).save_mmap(directory)
+    size = sum(os.path.getsize(os.path.join(directory, name)) for name in os.listdir(directory))
+    print(f"Memory-mappable artifacts saved to: {directory} ({size / 1024:.0f} KB)")
+
+
+def export_quantized(model, tokenizer, config, quantization, path=TFLITE_PATH,
+                     report_path=QUANTIZATION_REPORT_PATH, limit=None):
+    """
+    Write a quantized .tflite and compare it with Keras on the held-out split.
+
+    The split is rebuilt exactly like train.py's in-memory path
+    (train_test_split(test_size=0.2, random_state=42) over clickbait_data.csv),
+    so the report covers rows the model never trained on.
+    """
+    import json
+    import pandas as pd
+    from sklearn.model_selection import train_test_split
+    from tensorflow.keras.preprocessing.sequence import pad_sequences
+    from clickbait_core.preprocessing import clean_texts
+    from clickbait_core.tflite_engine import TFLiteModel, accuracy_report, export_tflite
+
+    df = pd.read_csv(DATA_PATH, nrows=limit)
+    cleaned = clean_texts(df['headline'])
+    if tokenizer is None:
+        X = build_featurizer(config).encode_batch(list(cleaned), config['max_length'])
+    else:
+        X = pad_sequences(tokenizer.texts_to_sequences(cleaned), maxlen=config['max_length'],
+                          padding='post', truncating='post')
+    train_idx, test_idx = train_test_split(np.arange(len(X)), test_size=0.2, random_state=42)
+
+    export_tflite(model, path, quantization, representative_data=X[train_idx[:REPRESENTATIVE_SAMPLES]])
+    report = {"quantization": quantization, "tflite_bytes": os.path.getsize(path)}
+    report.update(accuracy_report(model, TFLiteModel.load(path), X[test_idx], df['clickbait'].values[test_idx]))
+    with open(report_path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+
+    print(f"Quantized model ({quantization}) saved to: {path} ({report['tflite_bytes'] / 1024:.0f} KB)")
+    print(f"Held-out accuracy on {report['samples']} headlines: {report['reference_accuracy']:.4f} -> "
+          f"{report['quantized_accuracy']:.4f} (delta {report['accuracy_delta']:+.4f}, "
+          f"label agreement {report['label_agreement']:.2%})")
+    print(f"Quantization report saved to: {report_path}")
+    return report
+
+
+def check_parity(model, tokenizer, config, weights_path=NUMPY_WEIGHTS_PATH, vocab_path=VOCAB_PATH, limit=None):
+    """Compare Keras and NumPy tokenization and scores on clickbait_data.csv."""
+    import pandas as pd
+    from tensorflow.keras.preprocessing.sequence import pad_sequences
+    from clickbait_core.preprocessing import clean_texts
+
+    df = pd.read_csv(DATA_PATH, nrows=limit)
+    cleaned = clean_texts(df['headline'])
+    if tokenizer is None:
+        # Hashing featurizer: identical ids by construction, only the model is compared
+        vocab_padded = padded = build_featurizer(config).encode_batch(list(cleaned), config['max_length'])
+    else:
+        padded = pad_sequences(tokenizer.texts_to_sequences(cleaned), maxlen=config['max_length'],
+                               padding='post', truncating='post')
+        vocab_padded = VocabTokenizer.load(vocab_path).encode_batch(list(cleaned), config['max_length'])
+        if not np.array_equal(padded, vocab_padded):
+            print("❌ Tokenization parity check failed")
+            return False
+        print(f"Tokenization parity on {len(padded)} headlines: identical")
+
+    # On masked models, rows without tokens never reach the model at serving time (fixed EMPTY_SCORE)
+    if uses_mask(model):
+        nonempty = padded.any(axis=1)
+        padded, vocab_padded = padded[nonempty], vocab_padded[nonempty]
+    keras_scores = model.predict(padded, batch_size=1024, verbose=0)[:, 0]
+
+    numpy_scores = NumpyAveragingModel.load(weights_path).predict(vocab_padded, batch_size=1024)[:, 0]
+
+    max_diff = float(np.max(np.abs(keras_scores - numpy_scores)))
+    agreement = float(np.mean((keras_scores > 0.5) == (numpy_scores > 0.5)))
+    print(f"Parity on {len(padded)} headlines: max |diff| = {max_diff:.2e}, label agreement = {agreement:.4%}")
+    if max_diff > PARITY_TOLERANCE:
+        print(f"❌ Parity check failed (tolerance {PARITY_TOLERANCE:.0e})")
+        return False
+    print("✅ Parity check passed")
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export trained artifacts for lightweight inference engines.")
+    parser.add_argument('--verify', action='store_true', help="run a Keras vs NumPy parity check on clickbait_data.csv")
+    parser.add_argument('--limit', type=int, default=None, help="only use the first N rows for --verify")
+    parser.add_argument('--vocab-only', action='store_true', help="only export vocab.json from tokenizer.pickle "
+                                                                  "(not needed for hashing featurizers)")
+    parser.add_argument('--mmap', action='store_true', help="also export flat .npy files for the shared-memory 'mmap' engine")
+    parser.add_argument('--quantize', choices=QUANTIZATION_MODES, default=None,
+                        help="also export model_quant.tflite for the 'tflite' engine with an accuracy-delta report")
+    parser.add_argument('--model-dir', default=BASE_DIR,
+                        help="artifact set to export, e.g. versions/<version> (default: the flat files in model_training/)")
+    args = parser.parse_args()
+
+    model_dir = args.model_dir
+    weights_path = artifact_path(model_dir, NUMPY_WEIGHTS_PATH)
+    vocab_path = artifact_path(model_dir, VOCAB_PATH)
+
+    if args.vocab_only:
+        export_vocab(load_keras_tokenizer(model_dir), vocab_path)
+        return
+
+    model_path = artifact_path(model_dir, MODEL_PATH)
+    if not os.path.exists(model_path):
+        print(f"❌ Model not found at: {model_path}\nRun train.py first.")
+        sys.exit(1)
+
+    model, tokenizer, config = load_keras_artifacts(model_dir)
+    export_numpy(model, weights_path)
+    if tokenizer is not None:
+        export_vocab(tokenizer, vocab_path)
+    if args.mmap:
+        export_mmap(weights_path, vocab_path if tokenizer is not None else None, artifact_path(model_dir, MMAP_DIR))
+
+    if args.quantize:
+        export_quantized(model, tokenizer, config, args.quantize, artifact_path(model_dir, TFLITE_PATH),
+                         artifact_path(model_dir, QUANTIZATION_REPORT_PATH), limit=args.limit)
+
+    if args.verify and not check_parity(model, tokenizer, config, weights_path, vocab_path, limit=args.limit):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
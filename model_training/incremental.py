@@ -0,0 +1,111 @@
+"""
+Incremental (warm-start) retraining for train.py (--incremental).
+
+Every artifact set carries a small train_state.json checkpoint:
+
+    {"version": "...", "parent": "...", "data_offset": 32000, ...}
+
+data_offset is the number of CSV rows the model has already seen. An
+incremental run loads the active version's saved_model.h5 and tokenizer
+(see clickbait_core.registry), reads only the rows appended after that
+offset plus a random replay sample of older rows (against forgetting),
+and fine-tunes the existing weights with a small learning rate.
+
+The Keras tokenizer is not refitted: fit_on_texts re-sorts word_index by
+frequency, which would shift the ids the embedding was trained on.
+Unseen words are appended after the existing ids instead, so old ids stay
+stable. Only words that land below num_words get an embedding row; the
+rest stay <OOV> until the next full retrain.
+"""
+
+import json
+import os
+import time
+
+import numpy as np
+from tensorflow.keras.preprocessing.text import text_to_word_sequence
+
+from clickbait_core.registry import STATE_FILE
+from input_pipeline import iter_chunks
+
+
+def load_state(model_dir):
+    """The train_state.json of an artifact set, or None for sets trained before checkpoints."""
+    path = os.path.join(model_dir, STATE_FILE)
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_state(model_dir, state):
+    path = os.path.join(model_dir, STATE_FILE)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(state, f, indent=2)
+    return path
+
+
+def new_version():
+    """Sortable version id (UTC timestamp), unique at hourly retrain granularity."""
+    return time.strftime("%Y%m%d-%H%M%S", time.gmtime())
+
+
+def make_state(version, data_path, data_offset, parent=None, **extra):
+    return dict(version=version, parent=parent, data=os.path.abspath(data_path),
+                data_offset=int(data_offset), trained_at=time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+                **extra)
+
+
+def read_increment(path, offset, replay_size, chunk_size, seed=42):
+    """
+    Stream the CSV once and return (cleaned_headlines, labels, stats).
+
+    Rows at index >= offset are new. replay_size rows are drawn uniformly
+    from the first offset rows; only their ids are held in memory while
+    scanning, so the old data is never loaded as a whole.
+    """
+    rng = np.random.default_rng(seed)
+    replay = np.sort(rng.choice(offset, size=min(replay_size, offset), replace=False)) if offset else np.zeros(0, int)
+
+    texts, labels = [], []
+    row = new_rows = 0
+    for cleaned, chunk_labels in iter_chunks(path, chunk_size):
+        end = row + len(cleaned)
+        # New rows in this chunk, then the replay ids that fall inside it
+        picks = list(range(max(offset, row), end))
+        new_rows += len(picks)
+        lo, hi = np.searchsorted(replay, [row, min(end, offset)])
+        picks.extend(int(i) for i in replay[lo:hi])
+        for i in picks:
+            texts.append(cleaned[i - row])
+            labels.append(chunk_labels[i - row])
+        row = end
+
+    if row < offset:
+        raise ValueError(f"❌ Error: {path} has {row} rows but the checkpoint has already seen {offset}. "
+                         f"Was the CSV rewritten? Run a full retrain instead.")
+    stats = {"total_rows": row, "new_rows": new_rows, "replay_rows": len(replay)}
+    return texts, np.asarray(labels, dtype=np.float32), stats
+
+
+def extend_vocabulary(tokenizer, texts):
+    """
+    Append words not yet in the Keras tokenizer after the existing ids and
+    update its counts. Returns how many new words got a usable id (< num_words).
+    """
+    limit = tokenizer.num_words or float("inf")
+    added = usable = 0
+    for text in texts:
+        words = text_to_word_sequence(text, filters=tokenizer.filters, lower=tokenizer.lower, split=tokenizer.split)
+        for word in words:
+            tokenizer.word_counts[word] = tokenizer.word_counts.get(word, 0) + 1
+            if word not in tokenizer.word_index:
+                index = len(tokenizer.word_index) + 1
+                tokenizer.word_index[word] = index
+                tokenizer.index_word[index] = word
+                added += 1
+                usable += index < limit
+        for word in set(words):
+            tokenizer.word_docs[word] = tokenizer.word_docs.get(word, 0) + 1
+    tokenizer.document_count += len(texts)
+    return added, usable
@@ -0,0 +1,142 @@
+"""
+Streaming tf.data input pipeline for train.py (--pipeline stream).
+
+The CSV is read in chunks and cleaned chunk by chunk with the shared
+clean_texts. Each headline is encoded to a variable-length id sequence,
+so nothing is padded to MAX_LENGTH up front. Batches are padded only to
+their longest sequence. The model masks id 0 (Embedding(mask_zero=True)),
+so the average pooling ignores padding and batch shape does not change
+the result.
+
+Rows are split deterministically by position (row % 5: 0 -> test,
+1 -> validation, rest -> train). No split needs the whole file in memory.
+Rows that encode to no tokens (emoji- or punctuation-only headlines) are
+dropped: a fully masked row has no average and would give a NaN loss.
+"""
+
+import os
+import time
+
+import numpy as np
+import pandas as pd
+import tensorflow as tf
+
+from clickbait_core.preprocessing import clean_texts
+
+SPLITS = ("test", "val", "train", "train", "train")
+
+
+def iter_chunks(path, chunk_size):
+    """Yield (cleaned_headlines, labels) per CSV chunk."""
+    for chunk in pd.read_csv(path, usecols=["headline", "clickbait"], chunksize=chunk_size):
+        yield clean_texts(chunk["headline"]).tolist(), chunk["clickbait"].to_numpy(dtype=np.float32)
+
+
+def scan(path, chunk_size, tokenizer=None):
+    """
+    One streaming pass: count rows per split and, if given, fit the Keras
+    tokenizer incrementally on the training rows. Counts include rows that
+    iter_split later drops as empty; the datasets repeat, so steps stay valid.
+    """
+    counts = dict.fromkeys(set(SPLITS), 0)
+    row = 0
+    for cleaned, _ in iter_chunks(path, chunk_size):
+        splits = [SPLITS[(row + i) % len(SPLITS)] for i in range(len(cleaned))]
+        for split in splits:
+            counts[split] += 1
+        if tokenizer is not None:
+            tokenizer.fit_on_texts([text for text, split in zip(cleaned, splits) if split == "train"])
+        row += len(cleaned)
+    return counts
+
+
+def sequence_encoder(tokenizer=None, featurizer=None, max_length=None):
+    """Return a function mapping a list of cleaned texts to id arrays (no padding)."""
+    if featurizer is not None:
+        def encode(texts):
+            padded = featurizer.encode_batch(texts, max_length)
+            # Hash buckets are never 0, so the non-zero count is the length
+            return [row[:length] for row, length in zip(padded, np.count_nonzero(padded, axis=1))]
+    else:
+        def encode(texts):
+            return [np.asarray(seq[:max_length], dtype=np.int32) for seq in tokenizer.texts_to_sequences(texts)]
+    return encode
+
+
+def iter_split(path, split, encode, chunk_size):
+    """Yield (sequence, label) for one split, skipping rows without tokens."""
+    row = 0
+    for cleaned, labels in iter_chunks(path, chunk_size):
+        for sequence, label in zip(encode(cleaned), labels):
+            if SPLITS[row % len(SPLITS)] == split and len(sequence):
+                yield sequence, label
+            row += 1
+
+
+def make_dataset(path, split, encode, batch_size, chunk_size,
+                 shuffle_buffer=0, cache=None, seed=42):
+    """
+    Build a batched, infinitely repeating dataset for one split.
+
+    cache: None (no caching), "memory", or a directory; caching happens
+    after cleaning and encoding, so later epochs skip the CSV entirely.
+    The dataset repeats so that every pass reaches the end of the cache
+    (a partially read cache is discarded); pass steps from steps_for().
+    """
+    dataset = tf.data.Dataset.from_generator(
+        lambda: iter_split(path, split, encode, chunk_size),
+        output_signature=(
+            tf.TensorSpec(shape=(None,), dtype=tf.int32),
+            tf.TensorSpec(shape=(), dtype=tf.float32),
+        ),
+    )
+    if cache == "memory":
+        dataset = dataset.cache()
+    elif cache:
+        os.makedirs(cache, exist_ok=True)
+        dataset = dataset.cache(os.path.join(cache, split))
+    if shuffle_buffer:
+        dataset = dataset.shuffle(shuffle_buffer, seed=seed, reshuffle_each_iteration=True)
+    dataset = dataset.padded_batch(batch_size, padded_shapes=([None], []))
+    return dataset.repeat().prefetch(tf.data.AUTOTUNE)
+
+
+def split_arrays(path, split, encode, chunk_size, max_length, limit=None):
+    """
+    Materialize one split as a post-padded (n, max_length) int32 matrix and
+    labels, e.g. the test split for a quantization report. limit stops early.
+    """
+    sequences, labels = [], []
+    for sequence, label in iter_split(path, split, encode, chunk_size):
+        sequences.append(sequence)
+        labels.append(label)
+        if limit is not None and len(sequences) >= limit:
+            break
+    sequences, labels = sequences[:limit], labels[:limit]
+    X = np.zeros((len(sequences), max_length), dtype=np.int32)
+    for i, sequence in enumerate(sequences):
+        X[i, :len(sequence)] = sequence
+    return X, np.asarray(labels, dtype=np.float32)
+
+
+def steps_for(samples, batch_size):
+    return max(1, -(-samples // batch_size))
+
+
+class ThroughputCallback(tf.keras.callbacks.Callback):
+    """Report training samples/sec for every epoch."""
+
+    def __init__(self, samples_per_epoch):
+        super().__init__()
+        self.samples_per_epoch = samples_per_epoch
+        self._started = None
+
+    def on_epoch_begin(self, epoch, logs=None):
+        self._started = time.perf_counter()
+
+    def on_epoch_end(self, epoch, logs=None):
+        elapsed = time.perf_counter() - self._started
+        rate = self.samples_per_epoch / max(elapsed, 1e-9)
+        if logs is not None:
+            logs["samples_per_sec"] = rate
+        print(f"Epoch {epoch + 1}: {self.samples_per_epoch:,} samples in {elapsed:.1f}s ({rate:,.0f} samples/sec)")
@@ -1,6 +1,8 @@
 import os
-import re
+import sys
 import pickle
+import shutil
+import argparse
 import numpy as np
 import pandas as pd
 import tensorflow as tf
@@ -17,6 +19,23 @@ DATA_PATH = os.path.join(BASE_DIR, "clickbait_data.csv")
 MODEL_SAVE_PATH = os.path.join(BASE_DIR, "saved_model.h5")
 TOKENIZER_SAVE_PATH = os.path.join(BASE_DIR, "tokenizer.pickle")
 CONFIG_SAVE_PATH = os.path.join(BASE_DIR, "model_config.pickle")
+NUMPY_WEIGHTS_SAVE_PATH = os.path.join(BASE_DIR, "model_weights.npz")
+VOCAB_SAVE_PATH = os.path.join(BASE_DIR, "vocab.json")
+STATE_SAVE_PATH = os.path.join(BASE_DIR, "train_state.json")
+TFLITE_SAVE_PATH = os.path.join(BASE_DIR, "model_quant.tflite")
+QUANTIZATION_REPORT_PATH = os.path.join(BASE_DIR, "quantization_report.json")
+
+# Native Turkish model (character n-gram hashing, no translation at inference)
+TR_OUTPUT_DIR = os.path.join(BASE_DIR, "tr")
+
+# Shared clickbait_core package lives in the project root
+sys.path.insert(0, os.path.dirname(BASE_DIR))
+from clickbait_core.hashing import HashingFeaturizer
+from clickbait_core.numpy_engine import export_weights, uses_mask
+from clickbait_core.preprocessing import clean_texts
+from clickbait_core.registry import VERSIONS_DIR, ArtifactRegistry
+from clickbait_core.tflite_engine import QUANTIZATION_MODES, REPRESENTATIVE_SAMPLES
+from clickbait_core.tokenizer import VocabTokenizer
 
 VOCAB_SIZE = 10000
 MAX_LENGTH = 50
@@ -25,6 +44,17 @@ OOV_TOKEN = "<OOV>"
 EPOCHS = 5
 BATCH_SIZE = 32
 
+# Hashing featurizer settings (--featurizer hashing, always used for --language tr)
+HASH_BUCKETS = 2 ** 16
+CHAR_NGRAM_RANGE = (3, 5)
+# Sequence length per hashing mode (char n-grams and bigrams emit more ids per headline)
+HASH_MAX_LENGTH = {"char": 200, "word": MAX_LENGTH, "bigram": 2 * MAX_LENGTH}
+
+# Incremental retraining (--incremental)
+REPLAY_SIZE = 2000
+FINE_TUNE_LEARNING_RATE = 1e-4
+MIN_EVAL_ROWS = 50  # smaller increments are fine-tuned on all rows without a held-out test
+
 def check_gpu():
     print("TensorFlow Version:", tf.__version__)
     gpus = tf.config.list_physical_devices('GPU')
@@ -35,23 +65,61 @@ def check_gpu():
     else:
         print("⚠️ No GPU detected. Training will run on CPU.")
 
-def load_data():
-    if not os.path.exists(DATA_PATH):
-        raise FileNotFoundError(f"❌ Data file not found at: {DATA_PATH}\nPlease ensure 'clickbait_data.csv' is in the 'model_training' directory.")
-    print(f"Loading data from: {DATA_PATH}")
-    return pd.read_csv(DATA_PATH)
-
-def clean_text(text):
-    if not isinstance(text, str):
-        return ""
-    text = text.lower()
-    text = re.sub(r'[^\w\sğüşıöçĞÜŞİÖÇ]', '', text)
-    text = re.sub(r'\s+', ' ', text).strip()
-    return text
-
-def create_model():
+def parse_args():
+    parser = argparse.ArgumentParser(description="Train the clickbait classifier.")
+    parser.add_argument("--language", choices=("en", "tr"), default="en",
+                        help="'en' trains the vocabulary model on translated input; "
+                             "'tr' trains a character n-gram hashing model on Turkish headlines")
+    parser.add_argument("--data", default=None,
+                        help="CSV with 'headline' and 'clickbait' columns (default: clickbait_data.csv for en)")
+    parser.add_argument("--output-dir", default=None,
+                        help=f"where to write artifacts (default: {BASE_DIR} for en, {TR_OUTPUT_DIR} for tr)")
+    parser.add_argument("--featurizer", choices=("vocab", "hashing"), default=None,
+                        help="'vocab' fits a Keras Tokenizer; 'hashing' maps tokens into fixed buckets "
+                             "with nothing to fit or pickle (default: vocab for en, hashing for tr)")
+    parser.add_argument("--hash-mode", choices=("char", "word", "bigram"), default=None,
+                        help="hashing features (default: bigram for en, char for tr)")
+    parser.add_argument("--hash-buckets", type=int, default=HASH_BUCKETS)
+    parser.add_argument("--epochs", type=int, default=EPOCHS)
+    parser.add_argument("--batch-size", type=int, default=BATCH_SIZE)
+    parser.add_argument("--pipeline", choices=("memory", "stream"), default="memory",
+                        help="'memory' pads the whole CSV into one array; 'stream' reads it in chunks "
+                             "into a tf.data pipeline with dynamic padding")
+    parser.add_argument("--chunk-size", type=int, default=50000, help="CSV rows per chunk (stream)")
+    parser.add_argument("--shuffle-buffer", type=int, default=10000, help="0 disables shuffling (stream)")
+    parser.add_argument("--cache", default=None,
+                        help="cache encoded examples: 'memory' or a directory for an on-disk cache (stream); "
+                             "delete the directory when the data or featurizer changes")
+    parser.add_argument("--incremental", action="store_true",
+                        help="fine-tune the model in --output-dir on the rows appended since its last run "
+                             "plus a replay sample, instead of training from scratch")
+    parser.add_argument("--replay-size", type=int, default=REPLAY_SIZE,
+                        help="already-seen rows mixed into an incremental run (incremental)")
+    parser.add_argument("--learning-rate", type=float, default=FINE_TUNE_LEARNING_RATE,
+                        help="Adam learning rate for fine-tuning (incremental)")
+    parser.add_argument("--quantize", choices=QUANTIZATION_MODES, default=None,
+                        help="also export a post-training quantized model_quant.tflite (engine 'tflite') "
+                             "and report its accuracy delta on the held-out split")
+    parser.add_argument("--start-row", type=int, default=None,
+                        help="treat rows before this index as seen; needed once for models trained "
+                             "before train_state.json existed (incremental)")
+    args = parser.parse_args()
+    if args.language == "tr":
+        args.featurizer = "hashing"
+    args.featurizer = args.featurizer or "vocab"
+    args.hash_mode = args.hash_mode or ("char" if args.language == "tr" else "bigram")
+    return args
+
+def load_data(path=DATA_PATH):
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"❌ Data file not found at: {path}\nPlease ensure the CSV exists (see --data).")
+    print(f"Loading data from: {path}")
+    return pd.read_csv(path)
+
+def create_model(vocab_size=VOCAB_SIZE, max_length=MAX_LENGTH, mask_zero=False):
+    # mask_zero makes the average pooling ignore padding (needed for dynamic padding)
     model = Sequential([
-        Embedding(VOCAB_SIZE, EMBEDDING_DIM, input_length=MAX_LENGTH),
+        Embedding(vocab_size, EMBEDDING_DIM, input_length=max_length, mask_zero=mask_zero),
         GlobalAveragePooling1D(),
         Dense(64, activation='relu'),
         Dropout(0.3),
@@ -62,65 +130,297 @@ def create_model():
     model.compile(optimizer='adam', loss='binary_crossentropy', metrics=['accuracy'])
     return model
 
-def main():
-    check_gpu()
-    
-    print("Loading data...")
-    try:
-        df = load_data()
-    except Exception as e:
-        print(e)
-        return
+def make_featurizer(args):
+    """Returns (featurizer, keras_tokenizer, vocab_size, max_length); exactly one of the first two is set."""
+    if args.featurizer == "hashing":
+        # Hashing needs no fitting: memory is fixed and ğüşıöç / suffixes land in buckets too
+        featurizer = HashingFeaturizer(args.hash_buckets, mode=args.hash_mode,
+                                       min_n=CHAR_NGRAM_RANGE[0], max_n=CHAR_NGRAM_RANGE[1])
+        return featurizer, None, args.hash_buckets, HASH_MAX_LENGTH[args.hash_mode]
+    return None, Tokenizer(num_words=VOCAB_SIZE, oov_token=OOV_TOKEN), VOCAB_SIZE, MAX_LENGTH
 
+def train_in_memory(args, data_path):
+    """
+    Original path: load the whole CSV, pad everything to max_length.
+    Returns the artifacts, rows seen and the held-out data (see make_holdout).
+    """
+    print("Loading data...")
+    df = load_data(data_path)
     print(f"Data loaded: {len(df)} rows")
     
     print("Preprocessing...")
     if 'headline' not in df.columns or 'clickbait' not in df.columns:
-        print("❌ Error: CSV must contain 'headline' and 'clickbait' columns.")
-        return
+        raise ValueError("❌ Error: CSV must contain 'headline' and 'clickbait' columns.")
 
-    df['cleaned_headline'] = df['headline'].apply(clean_text)
-    
-    tokenizer = Tokenizer(num_words=VOCAB_SIZE, oov_token=OOV_TOKEN)
-    tokenizer.fit_on_texts(df['cleaned_headline'])
+    df['cleaned_headline'] = clean_texts(df['headline'])
     
-    sequences = tokenizer.texts_to_sequences(df['cleaned_headline'])
-    X = pad_sequences(sequences, maxlen=MAX_LENGTH, padding='post', truncating='post')
+    featurizer, tokenizer, vocab_size, max_length = make_featurizer(args)
+    if featurizer is not None:
+        X = featurizer.encode_batch(list(df['cleaned_headline']), max_length)
+    else:
+        tokenizer.fit_on_texts(df['cleaned_headline'])
+        sequences = tokenizer.texts_to_sequences(df['cleaned_headline'])
+        X = pad_sequences(sequences, maxlen=max_length, padding='post', truncating='post')
     y = df['clickbait'].values
     
     X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
     
     print("Building model...")
-    model = create_model()
+    model = create_model(vocab_size, max_length)
     model.summary()
     
     print("Starting training...")
-    model.fit(X_train, y_train, epochs=EPOCHS, batch_size=BATCH_SIZE, validation_split=0.2)
+    model.fit(X_train, y_train, epochs=args.epochs, batch_size=args.batch_size, validation_split=0.2)
     
     print("Evaluating...")
     loss, accuracy = model.evaluate(X_test, y_test)
     print(f"Test Accuracy: {accuracy:.4f}")
-    
+    return model, featurizer, tokenizer, vocab_size, max_length, len(df), make_holdout(X_test, y_test, X_train)
+
+def train_streaming(args, data_path):
+    """Chunked CSV -> tf.data (cache, shuffle, dynamic padded_batch, prefetch)."""
+    from input_pipeline import ThroughputCallback, make_dataset, scan, sequence_encoder, split_arrays, steps_for
+
+    if not os.path.exists(data_path):
+        raise FileNotFoundError(f"❌ Data file not found at: {data_path}")
+    featurizer, tokenizer, vocab_size, max_length = make_featurizer(args)
+
+    print(f"Scanning {data_path} in chunks of {args.chunk_size:,} rows...")
+    counts = scan(data_path, args.chunk_size, tokenizer)
+    print(f"Rows: {counts['train']:,} train / {counts['val']:,} validation / {counts['test']:,} test")
+
+    encode = sequence_encoder(tokenizer, featurizer, max_length)
+    datasets = {
+        split: make_dataset(
+            data_path, split, encode, args.batch_size, args.chunk_size,
+            shuffle_buffer=args.shuffle_buffer if split == "train" else 0,
+            cache=args.cache,
+        )
+        for split in ("train", "val", "test")
+    }
+
+    print("Building model...")
+    model = create_model(vocab_size, max_length, mask_zero=True)
+    model.summary()
+
+    print("Starting training...")
+    steps = {split: steps_for(count, args.batch_size) for split, count in counts.items()}
+    model.fit(datasets["train"], steps_per_epoch=steps["train"],
+              validation_data=datasets["val"], validation_steps=steps["val"],
+              epochs=args.epochs, callbacks=[ThroughputCallback(counts["train"])])
+
+    print("Evaluating...")
+    loss, accuracy = model.evaluate(datasets["test"], steps=steps["test"])
+    print(f"Test Accuracy: {accuracy:.4f}")
+
+    holdout = None
+    if args.quantize:
+        # Only the quantization report needs the test split as one padded array
+        X_test, y_test = split_arrays(data_path, "test", encode, args.chunk_size, max_length)
+        X_calibration, _ = split_arrays(data_path, "train", encode, args.chunk_size, max_length,
+                                        limit=REPRESENTATIVE_SAMPLES)
+        holdout = make_holdout(X_test, y_test, X_calibration)
+    return model, featurizer, tokenizer, vocab_size, max_length, sum(counts.values()), holdout
+
+def train_incremental(args, data_path, model_dir):
+    """
+    Warm start: load the artifact set in model_dir and fine-tune it on
+    rows appended since its train_state.json offset plus a replay sample.
+    Returns None when there is nothing new to learn from.
+    """
+    from incremental import extend_vocabulary, load_state, read_increment
+
+    state = load_state(model_dir)
+    if args.start_row is not None:
+        offset = args.start_row
+    elif state is not None:
+        offset = state['data_offset']
+    else:
+        raise ValueError(f"❌ Error: no {os.path.basename(STATE_SAVE_PATH)} in {model_dir}. "
+                         "Pass --start-row (rows the current model was trained on) or run a full training.")
+    model_path = os.path.join(model_dir, os.path.basename(MODEL_SAVE_PATH))
+    if not os.path.exists(model_path):
+        raise FileNotFoundError(f"❌ Model not found at: {model_path}\nRun a full training first.")
+    if not os.path.exists(data_path):
+        raise FileNotFoundError(f"❌ Data file not found at: {data_path}")
+
+    print(f"Loading model from: {model_path}")
+    model = tf.keras.models.load_model(model_path)
+    with open(os.path.join(model_dir, os.path.basename(CONFIG_SAVE_PATH)), 'rb') as handle:
+        config = pickle.load(handle)
+    featurizer = tokenizer = None
+    if config.get('featurizer'):
+        featurizer = HashingFeaturizer.from_config(config['featurizer'])
+    else:
+        with open(os.path.join(model_dir, os.path.basename(TOKENIZER_SAVE_PATH)), 'rb') as handle:
+            tokenizer = pickle.load(handle)
+    vocab_size, max_length = config['vocab_size'], config['max_length']
+
+    print(f"Reading rows after {offset:,} from {data_path}...")
+    texts, y, stats = read_increment(data_path, offset, args.replay_size, args.chunk_size)
+    if not stats['new_rows']:
+        print(f"No new rows since the last run ({stats['total_rows']:,} rows seen).")
+        return None
+    print(f"Rows: {stats['new_rows']:,} new + {stats['replay_rows']:,} replay")
+
+    if featurizer is not None:
+        X = featurizer.encode_batch(texts, max_length)
+    else:
+        added, usable = extend_vocabulary(tokenizer, texts)
+        print(f"Vocabulary: {added:,} new words ({usable:,} within the {tokenizer.num_words:,}-word embedding)")
+        X = pad_sequences(tokenizer.texts_to_sequences(texts), maxlen=max_length, padding='post', truncating='post')
+    # Rows without tokens are fully masked on mask_zero (streaming) models and give a NaN loss
+    if uses_mask(model):
+        keep = X.any(axis=1)
+        X, y = X[keep], np.asarray(y)[keep]
+
+    # Recompile: a fresh optimizer with a small step keeps the old weights mostly intact
+    model.compile(optimizer=tf.keras.optimizers.Adam(learning_rate=args.learning_rate),
+                  loss='binary_crossentropy', metrics=['accuracy'])
+    if len(y) < MIN_EVAL_ROWS:
+        X_train, X_test, y_train, y_test = X, None, y, None
+    else:
+        X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
+
+    print("Starting fine-tuning...")
+    model.fit(X_train, y_train, epochs=args.epochs, batch_size=args.batch_size)
+
+    if X_test is None:
+        return model, featurizer, tokenizer, vocab_size, max_length, stats['total_rows'], None
+    print("Evaluating...")
+    loss, accuracy = model.evaluate(X_test, y_test)
+    print(f"Test Accuracy: {accuracy:.4f}")
+    return model, featurizer, tokenizer, vocab_size, max_length, stats['total_rows'], make_holdout(X_test, y_test, X_train)
+
+def make_holdout(X_test, y_test, X_train):
+    """Held-out split for the quantization report plus int8 calibration rows from the training split."""
+    return {"x_test": X_test, "y_test": y_test, "x_calibration": X_train[:REPRESENTATIVE_SAMPLES]}
+
+def export_quantized(output_dir, model, holdout, quantization):
+    """Write model_quant.tflite and a Keras-vs-quantized accuracy report on the held-out split."""
+    import json
+    from clickbait_core.tflite_engine import TFLiteModel, accuracy_report, export_tflite
+
+    if holdout is None and quantization == "int8":
+        print("⚠️ int8 quantization needs calibration rows; too few rows in this run, skipped.")
+        return
+    tflite_path = os.path.join(output_dir, os.path.basename(TFLITE_SAVE_PATH))
+    export_tflite(model, tflite_path, quantization, representative_data=holdout["x_calibration"] if holdout else None)
+    model_path = os.path.join(output_dir, os.path.basename(MODEL_SAVE_PATH))
+    report = {
+        "quantization": quantization,
+        "keras_bytes": os.path.getsize(model_path),
+        "tflite_bytes": os.path.getsize(tflite_path),
+    }
+    if holdout is not None:
+        report.update(accuracy_report(model, TFLiteModel.load(tflite_path), holdout["x_test"], holdout["y_test"]))
+    report_path = os.path.join(output_dir, os.path.basename(QUANTIZATION_REPORT_PATH))
+    with open(report_path, "w", encoding="utf-8") as handle:
+        json.dump(report, handle, indent=2)
+
+    print(f"Quantized model ({quantization}) saved to: {tflite_path} "
+          f"({report['tflite_bytes'] / 1024:.0f} KB vs {report['keras_bytes'] / 1024:.0f} KB .h5)")
+    if holdout is None:
+        print("⚠️ No held-out split (too few rows), accuracy delta not measured.")
+    else:
+        print(f"Held-out accuracy: {report['reference_accuracy']:.4f} -> {report['quantized_accuracy']:.4f} "
+              f"(delta {report['accuracy_delta']:+.4f}, label agreement {report['label_agreement']:.2%})")
+    print(f"Quantization report saved to: {report_path}")
+
+def promote(version_dir, output_dir, version):
+    """
+    Make a versioned artifact set the active one: copy it over the flat
+    files (Streamlit, CLI) and point versions/ACTIVE at it (backend).
+    """
+    for name in sorted(os.listdir(version_dir)):
+        path = os.path.join(version_dir, name)
+        if os.path.isfile(path):
+            shutil.copy2(path, os.path.join(output_dir, name))
+    ArtifactRegistry(output_dir).activate(version)
+    print(f"Activated version {version} ({version_dir})")
+
+def save_artifacts(output_dir, model, featurizer, tokenizer, vocab_size, max_length, language):
     print("Saving artifacts...")
+    model_path = os.path.join(output_dir, os.path.basename(MODEL_SAVE_PATH))
+    config_path = os.path.join(output_dir, os.path.basename(CONFIG_SAVE_PATH))
+    weights_path = os.path.join(output_dir, os.path.basename(NUMPY_WEIGHTS_SAVE_PATH))
+
     # 1. Save Model (.h5)
-    model.save(MODEL_SAVE_PATH)
-    print(f"Model saved to: {MODEL_SAVE_PATH}")
+    model.save(model_path)
+    print(f"Model saved to: {model_path}")
     
-    # 2. Save Tokenizer
-    with open(TOKENIZER_SAVE_PATH, 'wb') as handle:
-        pickle.dump(tokenizer, handle, protocol=pickle.HIGHEST_PROTOCOL)
-    print(f"Tokenizer saved to: {TOKENIZER_SAVE_PATH}")
+    # 2. Save Tokenizer (the hashing featurizer has no fitted state)
+    if tokenizer is not None:
+        tokenizer_path = os.path.join(output_dir, os.path.basename(TOKENIZER_SAVE_PATH))
+        with open(tokenizer_path, 'wb') as handle:
+            pickle.dump(tokenizer, handle, protocol=pickle.HIGHEST_PROTOCOL)
+        print(f"Tokenizer saved to: {tokenizer_path}")
 
     # 3. Save Config (Required by Backend/Streamlit)
     config = {
-        'vocab_size': VOCAB_SIZE,
-        'max_length': MAX_LENGTH,
-        'embedding_dim': EMBEDDING_DIM
+        'vocab_size': vocab_size,
+        'max_length': max_length,
+        'embedding_dim': EMBEDDING_DIM,
+        'language': language,
+        # Serving needs this for engines that cannot be inspected (TFLite)
+        'mask_zero': uses_mask(model),
     }
-    with open(CONFIG_SAVE_PATH, 'wb') as handle:
+    if featurizer is not None:
+        config['featurizer'] = featurizer.to_config()
+    with open(config_path, 'wb') as handle:
         pickle.dump(config, handle, protocol=pickle.HIGHEST_PROTOCOL)
-    print(f"Config saved to: {CONFIG_SAVE_PATH}")
+    print(f"Config saved to: {config_path}")
+
+    # 4. Save NumPy weights (TensorFlow-free inference engine)
+    export_weights(model, weights_path)
+    print(f"NumPy weights saved to: {weights_path}")
+
+    # 5. Save trimmed vocabulary (loadable without TensorFlow)
+    if tokenizer is not None:
+        vocab_path = os.path.join(output_dir, os.path.basename(VOCAB_SAVE_PATH))
+        VocabTokenizer.from_keras(tokenizer).save(vocab_path)
+        print(f"Vocabulary saved to: {vocab_path}")
+
+def main():
+    from incremental import load_state, make_state, new_version, save_state
+
+    args = parse_args()
+    if args.language == "tr" and args.data is None:
+        print("❌ Error: --language tr needs a Turkish dataset (--data path/to/headlines.csv).")
+        return
+    output_dir = args.output_dir or (TR_OUTPUT_DIR if args.language == "tr" else BASE_DIR)
+    os.makedirs(output_dir, exist_ok=True)
+    data_path = args.data or DATA_PATH
+
+    check_gpu()
     
+    train = train_streaming if args.pipeline == "stream" else train_in_memory
+    try:
+        if args.incremental:
+            # Warm start from the active version (flat files for pre-registry models)
+            base_dir = ArtifactRegistry(output_dir).resolve()[1]
+            trained = train_incremental(args, data_path, base_dir)
+        else:
+            trained = train(args, data_path)
+    except (FileNotFoundError, ValueError) as e:
+        print(e)
+        return
+    if trained is None:
+        return
+    model, featurizer, tokenizer, vocab_size, max_length, rows, holdout = trained
+
+    # Every run writes a new versioned set, then makes it the active one
+    parent = load_state(base_dir) if args.incremental else None
+    version = new_version()
+    version_dir = os.path.join(output_dir, VERSIONS_DIR, version)
+    os.makedirs(version_dir, exist_ok=True)
+    save_artifacts(version_dir, model, featurizer, tokenizer, vocab_size, max_length, args.language)
+    if args.quantize:
+        export_quantized(version_dir, model, holdout, args.quantize)
+    state = make_state(version, data_path, rows, parent=parent and parent['version'],
+                       mode="incremental" if args.incremental else "full")
+    print(f"Checkpoint saved to: {save_state(version_dir, state)} (data offset {rows:,})")
+    promote(version_dir, output_dir, version)
     print("✅ Training completed successfully!")
 
 if __name__ == "__main__":
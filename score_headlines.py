@@ -0,0 +1,173 @@
+"""
+Streaming bulk scorer for large headline files.
+
+Reads CSV / JSONL / plain-text input in fixed-size chunks, scores each chunk
+with the same cleaning, tokenization and heuristics as the backend API and
+writes results incrementally, so memory stays bounded for any input size.
+
+Examples:
+    python score_headlines.py archive.csv -o scores.csv
+    python score_headlines.py feed.jsonl -o scores.jsonl --column title --engine numpy
+    cat headlines.txt | python score_headlines.py - -o - --translate
+    python score_headlines.py archive.csv -o scores.csv --translate --translator dictionary   # offline
+"""
+
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+from contextlib import nullcontext
+from itertools import islice
+from pathlib import Path
+
+import numpy as np
+
+from clickbait_core.metrics import StageTimings, add_hook
+from clickbait_core.pipeline import ENGINES, build_results, load_artifacts, score_texts
+from clickbait_core.preprocessing import clean_texts
+from clickbait_core.translation import TranslationCache
+from clickbait_core.translators import BACKENDS, build_stage
+
+BASE_DIR = Path(__file__).resolve().parent
+MODEL_DIR = BASE_DIR / "model_training"
+TRANSLATION_CACHE_DB = BASE_DIR / ".cache" / "translations.sqlite3"
+
+OUTPUT_FIELDS = ("score", "is_clickbait", "label", "heuristic")
+
+
+def detect_format(path, explicit=None):
+    if explicit:
+        return explicit
+    suffix = Path(path).suffix.lower()
+    if suffix in (".jsonl", ".ndjson"):
+        return "jsonl"
+    if suffix in (".txt", "") or path == "-":
+        return "txt"
+    return "csv"
+
+
+def open_text(path, mode):
+    if path == "-":
+        return nullcontext(sys.stdin if "r" in mode else sys.stdout)
+    return open(path, mode, encoding="utf-8", newline="")
+
+
+def read_rows(handle, fmt, column):
+    """Yield input rows as dicts, one at a time."""
+    if fmt == "csv":
+        reader = csv.DictReader(handle)
+        if reader.fieldnames is None or column not in reader.fieldnames:
+            raise ValueError(f"CSV input has no '{column}' column")
+        yield from reader
+    elif fmt == "jsonl":
+        for line in handle:
+            if line.strip():
+                yield json.loads(line)
+    else:
+        for line in handle:
+            line = line.rstrip("\r\n")
+            if line:
+                yield {column: line}
+
+
+def chunked(rows, size):
+    """Group an iterator into lists of at most ``size`` items."""
+    rows = iter(rows)
+    while True:
+        chunk = list(islice(rows, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+class ResultWriter:
+    """Incremental CSV / JSONL writer."""
+
+    def __init__(self, handle, fmt):
+        self.handle = handle
+        self.fmt = fmt
+        self._csv = None
+
+    def write(self, rows):
+        if self.fmt == "jsonl":
+            self.handle.writelines(json.dumps(row, ensure_ascii=False) + "\n" for row in rows)
+        else:
+            if self._csv is None:
+                self._csv = csv.DictWriter(self.handle, fieldnames=list(rows[0]), extrasaction="ignore")
+                self._csv.writeheader()
+            self._csv.writerows(rows)
+        self.handle.flush()
+
+
+def score_chunks(chunks, model, tokenizer, config, column, translator=None, chunk_size=4096):
+    """Score each chunk in one vectorized pass; yields rows with scores attached."""
+    buffer = np.zeros((chunk_size, config['max_length']), dtype=np.int32)
+    for rows in chunks:
+        texts = [str(row.get(column) or "") for row in rows]
+        translated = translator(texts) if translator else texts
+        scores = score_texts(model, tokenizer, config, clean_texts(translated), out=buffer)
+        results = build_results(texts, translated, scores)
+        for row, translated_text, result in zip(rows, translated, results):
+            for field in OUTPUT_FIELDS:
+                row[field] = result[field]
+            if translator:
+                row["translated_text"] = translated_text
+        yield rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Score a headline file of any size in streaming chunks.")
+    parser.add_argument("input", help="input file (.csv, .jsonl or .txt), '-' for stdin")
+    parser.add_argument("-o", "--output", default="-", help="output file (.csv or .jsonl), '-' for stdout")
+    parser.add_argument("--input-format", choices=("csv", "jsonl", "txt"))
+    parser.add_argument("--output-format", choices=("csv", "jsonl"))
+    parser.add_argument("--column", default="headline", help="field holding the headline text")
+    parser.add_argument("--chunk-size", type=int, default=4096)
+    parser.add_argument("--engine", choices=ENGINES, default=os.getenv("CLICKBAIT_ENGINE", "keras"))
+    parser.add_argument("--model-dir", default=str(MODEL_DIR))
+    parser.add_argument("--translate", action="store_true", help="translate headlines to English first (cached)")
+    parser.add_argument("--translation-workers", type=int, default=8)
+    parser.add_argument("--translator", default=os.getenv("CLICKBAIT_TRANSLATORS", "google,dictionary"),
+                        help=f"comma-separated backends tried in order ({', '.join(BACKENDS)})")
+    parser.add_argument("--translation-timeout", type=float, default=10.0,
+                        help="per-headline translation timeout in seconds (0 = none)")
+    parser.add_argument("--timings", action="store_true",
+                        help="print time spent per stage (translate, clean, tokenize, model, heuristics)")
+    args = parser.parse_args()
+
+    input_format = detect_format(args.input, args.input_format)
+    output_format = args.output_format or ("jsonl" if detect_format(args.output) == "jsonl" else "csv")
+
+    model, tokenizer, config = load_artifacts(args.model_dir, args.engine)
+    timings = StageTimings()
+    if args.timings:
+        add_hook(timings)
+
+    translator = None
+    if args.translate:
+        stage = build_stage(args.translator, timeout=args.translation_timeout or None,
+                            max_concurrency=args.translation_workers)
+        cache = TranslationCache(db_path=TRANSLATION_CACHE_DB, stage=stage)
+        translator = cache.translate_batch
+
+    started = time.perf_counter()
+    total = 0
+    with open_text(args.input, "r") as source, open_text(args.output, "w") as sink:
+        writer = ResultWriter(sink, output_format)
+        chunks = chunked(read_rows(source, input_format, args.column), args.chunk_size)
+        for rows in score_chunks(chunks, model, tokenizer, config, args.column, translator, args.chunk_size):
+            writer.write(rows)
+            total += len(rows)
+            elapsed = time.perf_counter() - started
+            print(f"\r{total:,} rows | {total / elapsed:,.0f} rows/sec", end="", file=sys.stderr)
+
+    elapsed = time.perf_counter() - started
+    print(f"\n✅ Scored {total:,} rows in {elapsed:.1f}s ({total / max(elapsed, 1e-9):,.0f} rows/sec)", file=sys.stderr)
+    for stage, summary in timings.summary().items():
+        print(f"   {stage:<10} {summary['seconds']:8.2f}s  {summary['ms_per_item']:.4f} ms/row", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,10 @@
+"""Testler depo kökünden (``clickbait_core``) ve ``backend_api`` klasöründen import eder"""
+
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+for path in (ROOT, ROOT / "backend_api"):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
@@ -0,0 +1,84 @@
+"""Sıkıştırılmış istek gövdeleri: açma, boyut sınırları ve route entegrasyonu"""
+
+import gzip
+import zlib
+
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("httpx")
+
+from fastapi import APIRouter, FastAPI, HTTPException  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+from pydantic import BaseModel  # noqa: E402
+
+from compression import compressed_route, decompress_body  # noqa: E402
+
+LIMIT = 1024
+
+
+class Payload(BaseModel):
+    texts: list[str]
+
+
+@pytest.fixture(scope="module")
+def client():
+    router = APIRouter(route_class=compressed_route(LIMIT))
+
+    @router.post("/echo")
+    async def echo(payload: Payload):
+        return {"count": len(payload.texts)}
+
+    app = FastAPI()
+    app.include_router(router)
+    return TestClient(app)
+
+
+def test_decompress_body_round_trips():
+    body = b'{"texts": ["a"]}'
+    assert decompress_body(gzip.compress(body), "gzip", LIMIT) == body
+    assert decompress_body(zlib.compress(body), "deflate", LIMIT) == body
+    assert decompress_body(body, "identity", LIMIT) == body
+
+
+@pytest.mark.parametrize("body, encoding, status", [
+    (gzip.compress(b"x" * (LIMIT + 1)), "gzip", 413),
+    (b"x" * (LIMIT + 1), "", 413),
+    (b"not gzip", "gzip", 400),
+    (b"{}", "br", 415),
+])
+def test_decompress_body_errors(body, encoding, status):
+    with pytest.raises(HTTPException) as error:
+        decompress_body(body, encoding, LIMIT)
+    assert error.value.status_code == status
+
+
+def test_route_accepts_gzip_body(client):
+    body = gzip.compress(b'{"texts": ["bir", "iki"]}')
+    response = client.post("/echo", content=body,
+                           headers={"Content-Encoding": "gzip", "Content-Type": "application/json"})
+    assert response.status_code == 200
+    assert response.json() == {"count": 2}
+
+
+def test_route_rejects_oversized_content_length_before_reading(client):
+    response = client.post("/echo", content=b"\0" * (LIMIT + 1),
+                           headers={"Content-Encoding": "gzip", "Content-Type": "application/json"})
+    assert response.status_code == 413
+
+
+def test_route_rejects_oversized_streamed_body(client):
+    def chunks():
+        for _ in range(4):
+            yield b"\0" * (LIMIT // 2)
+
+    # Akış halinde gönderilen gövdede Content-Length yoktur; boyut okurken denetlenir
+    response = client.post("/echo", content=chunks(),
+                           headers={"Content-Encoding": "gzip", "Content-Type": "application/json"})
+    assert response.status_code == 413
+
+
+def test_route_rejects_decompression_bomb(client):
+    response = client.post("/echo", content=gzip.compress(b" " * (LIMIT * 50)),
+                           headers={"Content-Encoding": "gzip", "Content-Type": "application/json"})
+    assert response.status_code == 413
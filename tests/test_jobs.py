@@ -0,0 +1,111 @@
+"""``JobRunner`` dağıtımı ve kapanışı: hemen biten, gönderilemeyen ve durdurulan işler"""
+
+import threading
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+
+pytest.importorskip("starlette")
+
+import jobs  # noqa: E402
+from jobs import JobRunner, JobStore  # noqa: E402
+
+
+class FakePool:
+    """İşi çağıran thread'de hemen bitiren (veya hiç kabul etmeyen) havuz"""
+
+    def __init__(self, error=None):
+        self.error = error
+        self.submitted = []
+
+    def submit(self, fn, *args):
+        if self.error is not None:
+            raise self.error
+        self.submitted.append(args)
+        future = Future()
+        future.set_result("completed")
+        return future
+
+    def shutdown(self, wait=True, cancel_futures=False):
+        pass
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = JobStore(tmp_path / "jobs.sqlite3", tmp_path / "jobs")
+    yield store
+    store.close()
+
+
+def make_runner(store, pool):
+    runner = JobRunner(store, workers=2, chunk_size=10, max_line_bytes=1024)
+    runner._pool = pool
+    runner._new_pool = lambda: pool
+    return runner
+
+
+def dispatch_with_timeout(runner, seconds=5):
+    thread = threading.Thread(target=runner._dispatch, daemon=True)
+    thread.start()
+    thread.join(seconds)
+    assert not thread.is_alive(), "_dispatch kilitlendi"
+
+
+def test_already_finished_future_does_not_deadlock(store):
+    store.create("a", "text", 1)
+    store.create("b", "text", 1)
+    pool = FakePool()
+    runner = make_runner(store, pool)
+
+    dispatch_with_timeout(runner)
+
+    assert [args[2] for args in pool.submitted] == ["a", "b"]
+    assert runner._active == {}
+
+
+@pytest.mark.parametrize("error", [BrokenProcessPool("öldü"), RuntimeError("cannot schedule new futures")])
+def test_submit_failure_requeues_job(store, error):
+    store.create("a", "text", 1)
+    runner = make_runner(store, FakePool(error))
+
+    dispatch_with_timeout(runner)
+
+    job = store.get("a")
+    assert job["status"] == "queued"
+    assert job["owner"] is None
+    assert runner._broken == isinstance(error, BrokenProcessPool)
+
+
+def test_submit_failure_fails_job_after_max_attempts(store):
+    store.create("a", "text", 1)
+    runner = make_runner(store, FakePool(RuntimeError("havuz kapalı")))
+
+    for _ in range(jobs.MAX_ATTEMPTS):
+        dispatch_with_timeout(runner)
+
+    job = store.get("a")
+    assert job["status"] == "failed"
+    assert job["attempts"] == jobs.MAX_ATTEMPTS
+    assert "havuz kapalı" in job["error"]
+
+
+def test_stop_requeues_jobs_only_after_workers_finish(store):
+    store.create("a", "text", 1)
+    seen = {}
+
+    class DrainingPool(FakePool):
+        def shutdown(self, wait=True, cancel_futures=False):
+            # Worker hâlâ parçasını yazıyor olabilir: iş başka bir sürece verilmemeli
+            seen["status"] = store.get("a")["status"]
+            seen["claimed_by_other"] = store.claim_next(owner=-1)
+
+    runner = make_runner(store, DrainingPool())
+    store.claim_next(runner.owner)
+
+    runner.stop()
+
+    assert seen == {"status": "stopping", "claimed_by_other": None}
+    job = store.get("a")
+    assert job["status"] == "queued"
+    assert job["owner"] is None
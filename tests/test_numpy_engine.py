@@ -0,0 +1,162 @@
+"""NumPy motoru ve hafif tokenizer'ın Keras karşılıklarıyla aynı çıktıyı verdiğini doğrular"""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from clickbait_core.numpy_engine import NumpyAveragingModel, export_weights, uses_mask  # noqa: E402
+from clickbait_core.pipeline import EMPTY_SCORE, build_result, score_texts  # noqa: E402
+from clickbait_core.tokenizer import MmapVocabTokenizer, VocabTokenizer  # noqa: E402
+
+TEXTS = [
+    "you won't believe what happened next",
+    "government announces new budget for schools",
+    "10 things doctors don't want you to know!",
+    "Scientists discover new species in the Amazon",
+    "this one trick will change your life forever and ever and ever",
+    "completely unseen words xyzzy",
+]
+MAX_LENGTH = 8
+
+
+def random_model(vocab_size=50, dim=6, mask_zero=False, seed=0):
+    rng = np.random.default_rng(seed)
+    layers = [
+        (rng.normal(size=(dim, 4)).astype(np.float32), rng.normal(size=4).astype(np.float32), "relu"),
+        (rng.normal(size=(4, 1)).astype(np.float32), rng.normal(size=1).astype(np.float32), "sigmoid"),
+    ]
+    embedding = rng.normal(size=(vocab_size, dim)).astype(np.float32)
+    return NumpyAveragingModel(embedding, layers, mask_zero=mask_zero)
+
+
+def reference_forward(model, x):
+    """Katman katman, döngüyle yazılmış referans hesap"""
+    outputs = []
+    for row in x:
+        positions = [i for i in row if i != 0] if model.mask_zero else list(row)
+        hidden = model.embedding[positions].mean(axis=0)
+        for kernel, bias, activation in model.layers:
+            hidden = hidden @ kernel + bias
+            hidden = np.maximum(hidden, 0) if activation == "relu" else 1 / (1 + np.exp(-hidden))
+        outputs.append(hidden)
+    return np.array(outputs)
+
+
+@pytest.mark.parametrize("mask_zero", [False, True])
+def test_forward_matches_reference(mask_zero):
+    model = random_model(mask_zero=mask_zero)
+    x = np.array([[3, 7, 1, 0, 0], [4, 4, 4, 4, 4], [9, 0, 0, 0, 0]])
+
+    np.testing.assert_allclose(model.predict(x), reference_forward(model, x), rtol=1e-5, atol=1e-6)
+    np.testing.assert_allclose(model.predict(x, batch_size=2), model.predict(x), rtol=1e-6)
+
+
+def test_mmap_round_trip(tmp_path):
+    model = random_model(mask_zero=True)
+    loaded = NumpyAveragingModel.load_mmap(model.save_mmap(tmp_path / "mmap"))
+    x = np.array([[1, 2, 3, 0], [5, 0, 0, 0]])
+
+    assert loaded.mask_zero
+    np.testing.assert_array_equal(loaded.predict(x), model.predict(x))
+
+
+def test_vocab_tokenizer_round_trips(tmp_path):
+    tokenizer = VocabTokenizer(["<OOV>", "you", "new", "will", "the", "won't"], num_words=7)
+    expected = tokenizer.encode_batch(TEXTS, MAX_LENGTH)
+
+    loaded = VocabTokenizer.load(tokenizer.save(tmp_path / "vocab.json"))
+    mapped = MmapVocabTokenizer.load(tokenizer.save_mmap(tmp_path / "mmap"))
+
+    np.testing.assert_array_equal(loaded.encode_batch(TEXTS, MAX_LENGTH), expected)
+    np.testing.assert_array_equal(mapped.encode_batch(TEXTS, MAX_LENGTH), expected)
+
+
+def test_rows_without_tokens_get_neutral_score_on_masked_models():
+    model = random_model(mask_zero=True)
+    tokenizer = VocabTokenizer(["you", "new"], oov_token=None)
+
+    scores = score_texts(model, tokenizer, {"max_length": MAX_LENGTH}, ["", "!!! ???", "you new", "xyzzy"])
+
+    assert scores[0] == scores[1] == scores[3] == EMPTY_SCORE == 0.5
+    np.testing.assert_allclose(scores[2], model.predict(tokenizer.encode_batch(["you new"], MAX_LENGTH))[0, 0])
+    result = build_result("!!! ???", "!!! ???", scores[1])
+    assert not result["is_clickbait"] and result["confidence"] == 50.0
+
+
+def test_unmasked_models_still_score_rows_without_tokens():
+    model = random_model(mask_zero=False)
+    tokenizer = VocabTokenizer(["you", "new"], oov_token=None)
+    texts = ["", "you new"]
+
+    scores = score_texts(model, tokenizer, {"max_length": MAX_LENGTH}, texts)
+
+    np.testing.assert_allclose(scores, model.predict(tokenizer.encode_batch(texts, MAX_LENGTH))[:, 0])
+    # Config'teki mask_zero modelin kendisinden önce gelir (örn. TFLite)
+    masked = score_texts(model, tokenizer, {"max_length": MAX_LENGTH, "mask_zero": True}, texts)
+    assert masked[0] == EMPTY_SCORE
+
+
+# --- Keras ile karşılaştırma (TensorFlow kurulu değilse atlanır) ---
+
+@pytest.fixture(scope="module")
+def keras():
+    tf = pytest.importorskip("tensorflow")
+    return tf.keras
+
+
+@pytest.fixture(scope="module")
+def keras_tokenizer(keras):
+    from tensorflow.keras.preprocessing.text import Tokenizer
+
+    tokenizer = Tokenizer(num_words=12, oov_token="<OOV>")
+    tokenizer.fit_on_texts(TEXTS[:4])
+    return tokenizer
+
+
+def test_encode_batch_matches_keras(keras_tokenizer):
+    from tensorflow.keras.preprocessing.sequence import pad_sequences
+
+    expected = pad_sequences(
+        keras_tokenizer.texts_to_sequences(TEXTS), maxlen=MAX_LENGTH, padding="post", truncating="post"
+    )
+    tokenizer = VocabTokenizer.from_keras(keras_tokenizer)
+
+    np.testing.assert_array_equal(tokenizer.encode_batch(TEXTS, MAX_LENGTH), expected)
+
+
+@pytest.mark.parametrize("mask_zero", [False, True])
+def test_numpy_model_matches_keras(keras, keras_tokenizer, tmp_path, mask_zero):
+    keras.utils.set_random_seed(0)
+    model = keras.Sequential([
+        keras.layers.Embedding(12, 8, mask_zero=mask_zero),
+        keras.layers.GlobalAveragePooling1D(),
+        keras.layers.Dense(4, activation="relu"),
+        keras.layers.Dropout(0.3),
+        keras.layers.Dense(1, activation="sigmoid"),
+    ])
+    x = VocabTokenizer.from_keras(keras_tokenizer).encode_batch(TEXTS, MAX_LENGTH)
+    expected = model.predict(x, verbose=0)
+
+    engine = NumpyAveragingModel.load(export_weights(model, tmp_path / "weights.npz"))
+
+    assert engine.mask_zero == uses_mask(model) == mask_zero
+    np.testing.assert_allclose(engine.predict(x), expected, rtol=1e-5, atol=1e-6)
+
+
+def test_engines_agree_on_rows_without_tokens(keras, keras_tokenizer, tmp_path):
+    keras.utils.set_random_seed(0)
+    model = keras.Sequential([
+        keras.layers.Embedding(12, 8, mask_zero=True),
+        keras.layers.GlobalAveragePooling1D(),
+        keras.layers.Dense(1, activation="sigmoid"),
+    ])
+    model.build((None, MAX_LENGTH))
+    engine = NumpyAveragingModel.load(export_weights(model, tmp_path / "weights.npz"))
+    tokenizer = VocabTokenizer.from_keras(keras_tokenizer)
+    texts = ["", "?!", "you won't believe"]
+
+    keras_scores = score_texts(model, tokenizer, {"max_length": MAX_LENGTH}, texts)
+    numpy_scores = score_texts(engine, tokenizer, {"max_length": MAX_LENGTH}, texts)
+
+    assert not np.isnan(keras_scores).any()
+    np.testing.assert_allclose(keras_scores, numpy_scores, rtol=1e-5, atol=1e-6)
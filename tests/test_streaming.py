@@ -0,0 +1,79 @@
+"""NDJSON akış yardımcıları: satır bölme ve kayıt çözme"""
+
+import asyncio
+import json
+
+import pytest
+
+pytest.importorskip("starlette")
+
+from streaming import iter_lines, ndjson_stream, parse_record  # noqa: E402
+
+
+@pytest.mark.parametrize("line, expected", [
+    (b'{"text": "Bunu g\\u00f6r\\u00fcnce", "id": 7}', ("Bunu görünce", 7)),
+    (b'"  JSON metni  "', ("JSON metni", None)),
+    ("düz metin başlık".encode(), ("düz metin başlık", None)),
+    ('"Şok" açıklama: bakın ne oldu'.encode(), ('"Şok" açıklama: bakın ne oldu', None)),
+    (b'"123"', ("123", None)),
+    (b"{yarim kalmis", ("{yarim kalmis", None)),
+])
+def test_parse_record(line, expected):
+    assert parse_record(line, "text") == expected
+
+
+def test_parse_record_rejects_object_without_field():
+    with pytest.raises(ValueError):
+        parse_record(b'{"title": "x"}', "text")
+
+
+async def collect(chunks, max_line_bytes=64):
+    async def source():
+        for chunk in chunks:
+            yield chunk
+    return [item async for item in iter_lines(source(), max_line_bytes)]
+
+
+def test_iter_lines_splits_across_chunks_and_skips_long_lines():
+    lines = asyncio.run(collect([b"bir\niki", b" par\xc3\xa7a\n\n", b"x" * 100, b"\nson"], max_line_bytes=32))
+
+    assert lines == [(1, b"bir"), (2, "iki parça".encode()), (4, None), (5, b"son")]
+
+
+def test_ndjson_stream_reports_errors_and_summary():
+    async def score_chunk(texts):
+        return [{"is_clickbait": "Şok" in text, "score": 0.9} for text in texts]
+
+    async def run():
+        async def lines():
+            for item in [(1, '"Şok" gelişme'.encode()), (2, b'{"text": ""}'), (3, b"normal haber")]:
+                yield item
+        return b"".join([chunk async for chunk in ndjson_stream(lines(), score_chunk, chunk_size=1)])
+
+    output = asyncio.run(run()).decode().splitlines()
+
+    assert '"line": 2, "error"' in output[1]
+    assert output[0].startswith('{"is_clickbait": true')
+    assert output[-1] == (
+        '{"summary": {"total": 2, "clickbait_count": 1, "normal_count": 1, "clickbait_ratio": 50.0, "errors": 1}}'
+    )
+
+
+def test_ndjson_stream_keeps_input_order_within_chunks():
+    scored = []
+
+    async def score_chunk(texts):
+        scored.append(texts)
+        return [{"is_clickbait": False, "score": 0.1} for _ in texts]
+
+    async def run():
+        async def lines():
+            for item in [(1, b"bir"), (2, None), (3, b"iki"), (4, b'{"text": 5}'), (5, b"uc")]:
+                yield item
+        return b"".join([chunk async for chunk in ndjson_stream(lines(), score_chunk, chunk_size=3)])
+
+    records = [json.loads(line) for line in asyncio.run(run()).decode().splitlines()]
+
+    assert [record["line"] for record in records[:-1]] == [1, 2, 3, 4, 5]
+    assert scored == [["bir", "iki"], ["uc"]]
+    assert records[-1]["summary"]["errors"] == 2
@@ -0,0 +1,137 @@
+"""``TranslationCache``: isabet/ıskalama, TTL ve başarısız çevirilerin yazılmaması"""
+
+import pytest
+
+from clickbait_core import cache as cache_module
+from clickbait_core import translation as translation_module
+from clickbait_core.translation import TranslationCache, latest_deadlines
+from clickbait_core.translators import FunctionTranslator, TranslationStage
+
+
+class StubTranslator:
+    """Çağrıları sayan, istenen metinlerde hata veren yerel çevirmen"""
+
+    def __init__(self, failing=()):
+        self.calls = []
+        self.failing = set(failing)
+
+    def __call__(self, text: str) -> str:
+        self.calls.append(text)
+        if text in self.failing:
+            raise RuntimeError("çevirmen erişilemez")
+        return f"en:{text}"
+
+
+class Clock:
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(cache_module.time, "monotonic", clock)
+    monkeypatch.setattr(translation_module.time, "time", clock)
+    return clock
+
+
+def test_miss_then_hit():
+    stub = StubTranslator()
+    cache = TranslationCache(translate_fn=stub)
+
+    assert cache.translate("Şok eden haber") == "en:Şok eden haber"
+    assert cache.translate("Şok eden haber") == "en:Şok eden haber"
+
+    assert stub.calls == ["Şok eden haber"]
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"]) == (1, 1)
+
+
+def test_batch_translates_each_unique_key_once():
+    stub = StubTranslator()
+    cache = TranslationCache(translate_fn=stub)
+
+    result = cache.translate_batch(["a  b", "a b", "c", "a b"])
+
+    assert result == ["en:a b", "en:a b", "en:c", "en:a b"]
+    assert stub.calls == ["a b", "c"]
+
+
+def test_memory_ttl_expires(clock):
+    stub = StubTranslator()
+    cache = TranslationCache(translate_fn=stub, ttl=60)
+
+    cache.translate("başlık")
+    clock.now += 59
+    cache.translate("başlık")
+    assert len(stub.calls) == 1
+
+    clock.now += 2
+    cache.translate("başlık")
+    assert len(stub.calls) == 2
+
+
+def test_disk_store_survives_restart_and_respects_ttl(tmp_path, clock):
+    db_path = tmp_path / "translations.sqlite3"
+    first = TranslationCache(translate_fn=StubTranslator(), ttl=60, db_path=db_path)
+    first.translate("başlık")
+    first.store.close()
+
+    stub = StubTranslator()
+    second = TranslationCache(translate_fn=stub, ttl=60, db_path=db_path)
+    assert second.translate("başlık") == "en:başlık"
+    assert stub.calls == []
+    assert second.stats()["disk_hits"] == 1
+    second.store.close()
+
+    clock.now += 61
+    third = TranslationCache(translate_fn=stub, ttl=60, db_path=db_path)
+    third.translate("başlık")
+    assert stub.calls == ["başlık"]
+    third.store.close()
+
+
+def test_failed_translation_is_not_persisted(tmp_path):
+    stub = StubTranslator(failing={"bozuk"})
+    cache = TranslationCache(translate_fn=stub, db_path=tmp_path / "t.sqlite3")
+
+    assert cache.translate_batch(["bozuk", "sağlam"]) == ["bozuk", "en:sağlam"]
+    assert cache.translate_batch(["bozuk"], fallback=False) == [None]
+
+    assert stub.calls.count("bozuk") == 2
+    assert "bozuk" not in cache.memory
+    assert cache.store.get("bozuk") is None
+    assert cache.store.get("sağlam") == "en:sağlam"
+    assert cache.stats()["errors"] == 2
+    cache.store.close()
+
+
+def test_non_cacheable_fallback_is_not_persisted():
+    primary = FunctionTranslator(StubTranslator(failing={"x"}), name="primary")
+    local = FunctionTranslator(str.upper, name="local", cacheable=False)
+    cache = TranslationCache(stage=TranslationStage([primary, local]))
+
+    assert cache.translate_batch_detailed(["x", "y"]) == [("X", False), ("en:y", True)]
+    assert "x" not in cache.memory
+    assert "y" in cache.memory
+
+
+def test_duplicate_texts_use_latest_deadline():
+    seen = []
+
+    class RecordingStage(TranslationStage):
+        def translate_detailed(self, texts, deadline=None):
+            seen.append((texts, deadline))
+            return super().translate_detailed(texts, deadline)
+
+    cache = TranslationCache(stage=RecordingStage([FunctionTranslator(str.upper, name="primary")]))
+
+    assert cache.translate_batch_detailed(["a", "b", "a", "c"], deadline=[1e9, 2e9, 3e9, None]) == [
+        ("A", True), ("B", True), ("A", True), ("C", True),
+    ]
+    assert seen == [(["a", "b", "c"], [3e9, 2e9, None])]
+    assert latest_deadlines(["a", "a"], [None, 5.0]) == {"a": None}
+
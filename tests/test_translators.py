@@ -0,0 +1,149 @@
+"""``TranslationStage``: yedek zinciri, metin başına zaman aşımı ve çevrimdışı sözlük"""
+
+import threading
+import time
+
+import pytest
+
+from clickbait_core.translators import DictionaryTranslator, FunctionTranslator, TranslationStage, build_stage
+
+
+def failing(text: str) -> str:
+    raise ConnectionError("ağ yok")
+
+
+def sleeping(seconds: float, events: threading.Event = None):
+    def translate(text: str) -> str:
+        if events is not None:
+            events.wait(seconds)
+        else:
+            time.sleep(seconds)
+        return f"remote:{text}"
+    return translate
+
+
+def local_backend():
+    return FunctionTranslator(lambda text: f"local:{text}", name="local", cacheable=False, local=True)
+
+
+def test_falls_back_in_order():
+    primary = FunctionTranslator(lambda text: failing(text) if "x" in text else f"primary:{text}", name="primary")
+    secondary = FunctionTranslator(lambda text: failing(text) if "y" in text else f"secondary:{text}",
+                                   name="secondary")
+    stage = TranslationStage([primary, secondary, local_backend()])
+
+    results = stage.translate_detailed(["a", "x", "xy"])
+
+    assert [value for value, _ in results] == ["primary:a", "secondary:x", "local:xy"]
+    assert [backend.name for _, backend in results] == ["primary", "secondary", "local"]
+    assert stage.stats()["primary"]["errors"] == 2
+
+
+def test_all_backends_failing_returns_none():
+    stage = TranslationStage([FunctionTranslator(failing, name="a"), FunctionTranslator(failing, name="b")])
+
+    assert stage.translate_detailed(["metin"]) == [(None, None)]
+    assert stage.translate_batch(["metin"]) == ["metin"]
+    assert stage.translate_batch(["metin"], fallback=False) == [None]
+
+
+def test_timeout_is_per_item_not_per_batch():
+    # 12 metin, 2 worker, her biri 0.1 sn: toplam ~0.6 sn sürer ama hiçbiri tek başına 0.3 sn'yi aşmaz
+    remote = FunctionTranslator(sleeping(0.1), name="remote")
+    stage = TranslationStage([remote, local_backend()], timeout=0.3, max_concurrency=2)
+
+    results = stage.translate_detailed([str(i) for i in range(12)])
+
+    assert all(backend is remote for _, backend in results)
+    assert stage.stats()["remote"]["timeouts"] == 0
+
+
+def test_hung_backend_times_out_and_local_fallback_runs_immediately():
+    release = threading.Event()
+    remote = FunctionTranslator(sleeping(10, release), name="remote")
+    stage = TranslationStage([remote, local_backend()], timeout=0.2, max_concurrency=2)
+
+    started = time.monotonic()
+    try:
+        results = stage.translate_detailed(["a", "b", "c", "d"])
+    finally:
+        release.set()
+    elapsed = time.monotonic() - started
+
+    assert [value for value, _ in results] == ["local:a", "local:b", "local:c", "local:d"]
+    # 4 metin / 2 worker = 2 dalga; sırada bekleyenler de bu sürede bırakılır
+    assert elapsed < 0.2 * 2 + 0.3
+    assert stage.stats()["remote"]["timeouts"] == 4
+
+
+def test_request_deadline_skips_remote_but_not_local_backends():
+    remote = FunctionTranslator(sleeping(0.05), name="remote")
+    stage = TranslationStage([remote, local_backend()], timeout=5)
+
+    results = stage.translate_detailed(["a", "b"], deadline=time.monotonic() - 1)
+
+    assert [value for value, _ in results] == ["local:a", "local:b"]
+    assert stage.stats()["remote"]["calls"] == 0
+
+
+def test_request_deadline_caps_remote_wait():
+    release = threading.Event()
+    remote = FunctionTranslator(sleeping(10, release), name="remote")
+    stage = TranslationStage([remote, local_backend()], timeout=5)
+
+    started = time.monotonic()
+    try:
+        results = stage.translate_detailed(["a"], deadline=time.monotonic() + 0.1)
+    finally:
+        release.set()
+
+    assert time.monotonic() - started < 1
+    assert results[0][0] == "local:a"
+
+
+def test_per_item_deadlines_do_not_cut_other_items():
+    remote = FunctionTranslator(sleeping(0.2), name="remote")
+    stage = TranslationStage([remote, local_backend()], timeout=5, max_concurrency=4)
+
+    now = time.monotonic()
+    results = stage.translate_detailed(["acele", "sabırlı", "sınırsız"], deadline=[now + 0.05, now + 2, None])
+
+    assert [value for value, _ in results] == ["local:acele", "remote:sabırlı", "remote:sınırsız"]
+    assert stage.stats()["remote"]["timeouts"] == 1
+
+
+def test_per_item_deadlines_must_match_texts():
+    stage = TranslationStage([local_backend()])
+
+    with pytest.raises(ValueError):
+        stage.translate_detailed(["a", "b"], deadline=[None])
+
+
+def test_dictionary_translates_phrases_and_suffixes():
+    translator = DictionaryTranslator({"sonra ne oldu": "what happened next", "kitap": "book", "mi": ""})
+
+    assert translator.local and not translator.cacheable
+    assert translator.translate("Sonra ne oldu?") == "what happened next?"
+    assert translator.translate("Kitaplar mi") == "book"
+    assert translator.translate("bilinmeyen kelime") == "bilinmeyen kelime"
+
+
+def test_dictionary_strips_suffixes_only_down_to_known_stems():
+    translator = DictionaryTranslator({"her": "every", "kitap": "book", "şok": "shock"})
+
+    # "here" → "her" gibi tahminler yapılmaz: İngilizce başlık olduğu gibi döner
+    assert translator.translate("Here is why") == "Here is why"
+    assert translator.translate("Kitaplarda şok") == "book shock"
+    assert translator.translate("Şok: kitapçılar kapanıyor") == "shock: kitapçılar kapanıyor"
+
+
+def test_offline_stage_uses_bundled_dictionary():
+    stage = build_stage("dictionary")
+
+    assert stage.translate("son dakika") == "breaking news"
+    assert stage.stats()["dictionary"]["calls"] == 1
+
+
+def test_build_stage_rejects_unknown_backend():
+    with pytest.raises(ValueError):
+        build_stage("google,deepl")